@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import contextlib
 import json
+import logging
 import re
 import sys
-import traceback
+from collections.abc import Iterator
 from http.server import BaseHTTPRequestHandler
 from pathlib import Path
 
@@ -13,44 +15,163 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from refaudit.budget import TimeBudget
-from refaudit.web import check_reference_payload
+from refaudit.web import (
+    check_reference_payload,
+    check_references_payload,
+    client_config,
+    iter_references_payload,
+)
 
 EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
 MAX_REF_LENGTH = 2000
 MAX_EMAIL_LENGTH = 320
+MAX_BATCH_REFS = 50
+STREAM_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson; charset=utf-8",
+    "sse": "text/event-stream; charset=utf-8",
+}
 WEB_PAUSE_SEC = 0.1
 
+logger = logging.getLogger(__name__)
+
 
 def build_json_response(status: int, payload: dict) -> tuple[int, bytes]:
     body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
     return status, body
 
 
-def validate_payload(payload: dict) -> tuple[str, str]:
-    ref = (payload.get("ref") or "").strip()
-    email = (payload.get("email") or "").strip()
-
+def _validate_ref(value) -> str:
+    ref = (value if isinstance(value, str) else "").strip()
     if not ref:
         raise ValueError("reference text is required")
     if len(ref) > MAX_REF_LENGTH:
         raise ValueError("reference text must be 2000 characters or fewer")
+    return ref
+
+
+def _validate_email(value) -> str:
+    email = (value if isinstance(value, str) else "").strip()
     if not email:
         raise ValueError("email is required")
     if len(email) > MAX_EMAIL_LENGTH or not EMAIL_RE.match(email):
         raise ValueError("email format is invalid")
-    return ref, email
+    return email
+
+
+def validate_payload(payload: dict) -> tuple[str, str]:
+    ref = _validate_ref(payload.get("ref"))
+    return ref, _validate_email(payload.get("email"))
+
+
+def validate_batch_payload(payload: dict) -> tuple[list[str], str]:
+    refs = payload.get("refs")
+    if not isinstance(refs, list) or not refs:
+        raise ValueError("refs must be a non-empty list")
+    if len(refs) > MAX_BATCH_REFS:
+        raise ValueError(f"refs must contain {MAX_BATCH_REFS} references or fewer")
+    return [_validate_ref(ref) for ref in refs], _validate_email(payload.get("email"))
 
 
 WEB_BUDGET_SEC = 55.0  # Vercel maxDuration=60s, keep 5s buffer
 
 
 def handle_check(payload: dict) -> tuple[int, dict]:
+    if "refs" in payload:
+        return handle_check_batch(payload)
     ref, email = validate_payload(payload)
     budget = TimeBudget(total_seconds=WEB_BUDGET_SEC)
     result = check_reference_payload(ref, email=email, pause_sec=WEB_PAUSE_SEC, budget=budget)
     return 200, {"ok": True, "result": result, "diagnostics": budget.diagnostics()}
 
 
+def handle_config() -> tuple[int, dict]:
+    return 200, {
+        "ok": True,
+        "config": {**client_config(), "max_batch_refs": MAX_BATCH_REFS, "budget_sec": WEB_BUDGET_SEC},
+    }
+
+
+def handle_check_batch(payload: dict) -> tuple[int, dict]:
+    refs, email = validate_batch_payload(payload)
+    budget = TimeBudget(total_seconds=WEB_BUDGET_SEC)
+    results = check_references_payload(refs, email=email, pause_sec=WEB_PAUSE_SEC, budget=budget)
+    return 200, {
+        "ok": True,
+        "results": results,
+        "complete": all(item["ok"] for item in results),
+        "diagnostics": budget.diagnostics(),
+    }
+
+
+def stream_format(accept: str | None) -> str | None:
+    """Pick a streaming format from the Accept header, or None for plain JSON."""
+    accept = (accept or "").lower()
+    if "text/event-stream" in accept:
+        return "sse"
+    if "application/x-ndjson" in accept:
+        return "ndjson"
+    return None
+
+
+def _encode_event(fmt: str, event: str, payload: dict) -> bytes:
+    data = json.dumps({"type": event, **payload}, ensure_ascii=False)
+    if fmt == "sse":
+        return f"event: {event}\ndata: {data}\n\n".encode()
+    return (data + "\n").encode()
+
+
+def handle_check_stream(payload: dict, fmt: str) -> Iterator[bytes]:
+    """Validate, then return an iterator of encoded per-reference events.
+
+    Each finished reference is sent as a ``result`` event carrying its input
+    ``index``; a final ``done`` event carries completeness and diagnostics.
+    Raises ``ValueError`` before anything is streamed if the payload is invalid.
+    """
+    if "refs" in payload:
+        refs, email = validate_batch_payload(payload)
+    else:
+        ref, email = validate_payload(payload)
+        refs = [ref]
+    budget = TimeBudget(total_seconds=WEB_BUDGET_SEC)
+
+    def events() -> Iterator[bytes]:
+        complete = True
+        for entry in iter_references_payload(refs, email=email, pause_sec=WEB_PAUSE_SEC, budget=budget):
+            complete = complete and entry["ok"]
+            yield _encode_event(fmt, "result", entry)
+        yield _encode_event(fmt, "done", {"complete": complete, "diagnostics": budget.diagnostics()})
+
+    return events()
+
+
+def write_stream(request: BaseHTTPRequestHandler, fmt: str, chunks: Iterator[bytes]) -> None:
+    """Send ``chunks`` as they are produced; errors after the headers become an ``error`` event.
+
+    If the client disconnects, writing stops and ``chunks`` is closed, which
+    cancels the checks that have not started yet.
+    """
+    request.send_response(200)
+    request.send_header("Content-Type", STREAM_CONTENT_TYPES[fmt])
+    request.send_header("Cache-Control", "no-store")
+    request.send_header("X-Accel-Buffering", "no")
+    request.end_headers()
+    try:
+        for chunk in chunks:
+            request.wfile.write(chunk)
+            request.wfile.flush()
+    except ConnectionError:
+        # BrokenPipeError / ConnectionResetError: the client has gone away.
+        return
+    except Exception:
+        logger.exception("streamed check failed")
+        with contextlib.suppress(ConnectionError):
+            request.wfile.write(_encode_event(fmt, "error", {"error": "internal_error"}))
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
 class handler(BaseHTTPRequestHandler):
     def _write_json(self, status: int, payload: dict) -> None:
         status_code, body = build_json_response(status, payload)
@@ -62,12 +183,12 @@ class handler(BaseHTTPRequestHandler):
 
     def do_OPTIONS(self) -> None:
         self.send_response(204)
-        self.send_header("Allow", "POST, OPTIONS")
+        self.send_header("Allow", "GET, POST, OPTIONS")
         self.send_header("Cache-Control", "no-store")
         self.end_headers()
 
     def do_GET(self) -> None:
-        self._write_json(405, {"ok": False, "error": "method_not_allowed"})
+        self._write_json(*handle_config())
 
     def do_POST(self) -> None:
         try:
@@ -82,11 +203,15 @@ class handler(BaseHTTPRequestHandler):
             self._write_json(400, {"ok": False, "error": "invalid_json"})
             return
 
+        fmt = stream_format(self.headers.get("Accept"))
         try:
+            if fmt is not None:
+                write_stream(self, fmt, handle_check_stream(payload, fmt))
+                return
             status, response = handle_check(payload)
             self._write_json(status, response)
         except ValueError as exc:
             self._write_json(400, {"ok": False, "error": str(exc)})
         except Exception:
-            traceback.print_exc()
+            logger.exception("check request failed")
             self._write_json(500, {"ok": False, "error": "internal_error"})
@@ -509,28 +509,92 @@ function buildMarkdown(results, inputText, diagnosticsList) {
   return lines.join("\n");
 }
 
-async function checkReference(ref, email) {
+// Used when the config endpoint is unreachable.
+const DEFAULT_CONFIG = { max_concurrency: 2, batch_size: 5 };
+const MAX_BACKOFF_MS = 30000;
+const MAX_ATTEMPTS = 4;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+async function fetchConfig() {
+  try {
+    const response = await fetch("/api/check", { headers: { Accept: "application/json" } });
+    const payload = await response.json();
+    if (response.ok && payload?.ok) {
+      return { ...DEFAULT_CONFIG, ...payload.config };
+    }
+  } catch {
+    // fall through to defaults
+  }
+  return DEFAULT_CONFIG;
+}
+
+async function streamReferences(refs, email, onEntry) {
   const response = await fetch("/api/check", {
     method: "POST",
     headers: {
       "Content-Type": "application/json",
+      Accept: "application/x-ndjson",
     },
-    body: JSON.stringify({ ref, email }),
+    body: JSON.stringify({ refs, email }),
   });
 
-  let payload = null;
-  try {
-    payload = await response.json();
-  } catch {
-    payload = null;
-  }
-
-  if (!response.ok || !payload?.ok) {
+  if (!response.ok || !response.body) {
+    let payload = null;
+    try {
+      payload = await response.json();
+    } catch {
+      payload = null;
+    }
     const message = payload?.error || (response.status === 504 ? "timeout" : "request_failed");
-    throw new Error(message);
+    const error = new Error(message);
+    error.status = response.status;
+    error.retryAfter = Number(response.headers.get("Retry-After")) || 0;
+    throw error;
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let diagnostics = null;
+  const handleLine = (line) => {
+    if (!line.trim()) {
+      return;
+    }
+    const event = JSON.parse(line);
+    if (event.type === "result") {
+      onEntry(event);
+    } else if (event.type === "done") {
+      diagnostics = event.diagnostics || null;
+    } else if (event.type === "error") {
+      throw new Error(event.error || "request_failed");
+    }
+  };
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) {
+      break;
+    }
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop();
+    lines.forEach(handleLine);
   }
+  handleLine(buffer + decoder.decode());
+  return diagnostics;
+}
 
-  return { result: payload.result, diagnostics: payload.diagnostics || null };
+function failedResult(ref, message) {
+  return {
+    input_text: ref,
+    found: false,
+    status: "not_found",
+    retracted: false,
+    is_website: false,
+    error: true,
+    message,
+    retraction_details: [],
+  };
 }
 
 async function runAudit() {
@@ -557,30 +621,99 @@ async function runAudit() {
   renderResults(latestResults);
   updateSummary(latestResults);
 
+  const slots = new Array(refs.length).fill(null);
+  const slotDiagnostics = new Array(refs.length).fill(null);
+  const attempts = new Array(refs.length).fill(0);
+  const refresh = () => {
+    latestResults = slots.filter(Boolean);
+    latestDiagnostics = slotDiagnostics.filter((_, index) => slots[index]);
+    renderResults(latestResults);
+    updateSummary(latestResults);
+    statusText.textContent = `${latestResults.length}/${refs.length} チェック済み...`;
+  };
+  const fail = (index, message) => {
+    slots[index] = failedResult(refs[index], message);
+    slotDiagnostics[index] = { error: message };
+  };
+
   try {
-    for (let index = 0; index < refs.length; index += 1) {
-      const ref = refs[index];
-      statusText.textContent = `${index + 1}/${refs.length} チェック中...`;
-      try {
-        const { result, diagnostics } = await checkReference(ref, email);
-        latestResults.push(result);
-        latestDiagnostics.push(diagnostics);
-      } catch (error) {
-        latestResults.push({
-          input_text: ref,
-          found: false,
-          status: "not_found",
-          retracted: false,
-          is_website: false,
-          error: true,
-          message: error instanceof Error ? error.message : "request_failed",
-          retraction_details: [],
+    const config = await fetchConfig();
+    const queue = refs.map((_, index) => index);
+    let limit = config.max_concurrency;
+    let backoffMs = 0;
+    let inFlight = 0;
+
+    // Any worker may send while fewer than `limit` requests are in flight;
+    // 429/504 halve the limit and back off, successes restore it one step at a time.
+    // Workers stay alive while others are running, since those may requeue work.
+    const worker = async () => {
+      while (queue.length || inFlight) {
+        if (!queue.length || inFlight >= limit) {
+          await sleep(250);
+          continue;
+        }
+        const batch = queue.splice(0, config.batch_size);
+        inFlight += 1;
+        if (backoffMs) {
+          await sleep(backoffMs);
+        }
+        const retry = [];
+        let retryReason = "budget_exhausted";
+        let finished = 0;
+        try {
+          const diagnostics = await streamReferences(
+            batch.map((index) => refs[index]),
+            email,
+            (entry) => {
+              const index = batch[entry.index];
+              if (entry.ok) {
+                slots[index] = entry.result;
+                finished += 1;
+                refresh();
+              } else {
+                retry.push(index);
+              }
+            },
+          );
+          batch.forEach((index) => {
+            if (slots[index]) {
+              slotDiagnostics[index] = diagnostics;
+            }
+          });
+          backoffMs = Math.floor(backoffMs / 2);
+          limit = Math.min(config.max_concurrency, limit + 1);
+        } catch (error) {
+          const unfinished = batch.filter((index) => !slots[index]);
+          if (error?.status === 429 || error?.status === 504) {
+            limit = Math.max(1, Math.floor(limit / 2));
+            backoffMs = Math.min(
+              MAX_BACKOFF_MS,
+              Math.max(error.retryAfter * 1000, backoffMs ? backoffMs * 2 : 1000),
+            );
+            retryReason = error.message;
+            retry.push(...unfinished);
+          } else {
+            const message = error instanceof Error ? error.message : "request_failed";
+            unfinished.forEach((index) => fail(index, message));
+          }
+        }
+        // A budget-exhausted batch that made no progress gets one more try.
+        const stalled = retryReason === "budget_exhausted" && !finished;
+        const requeue = [];
+        retry.forEach((index) => {
+          attempts[index] += 1;
+          if (attempts[index] >= MAX_ATTEMPTS || (stalled && attempts[index] > 1)) {
+            fail(index, retryReason);
+          } else {
+            requeue.push(index);
+          }
         });
-        latestDiagnostics.push({ error: error instanceof Error ? error.message : "request_failed" });
+        queue.unshift(...requeue.sort((a, b) => a - b));
+        inFlight -= 1;
+        refresh();
       }
-      renderResults(latestResults);
-      updateSummary(latestResults);
-    }
+    };
+    await Promise.all(Array.from({ length: config.max_concurrency }, () => worker()));
 
     statusText.textContent = `${refs.length}件のチェックが完了しました。`;
     downloadButton.disabled = false;
@@ -0,0 +1,138 @@
+"""Micro-benchmark for candidate scoring across similarity backends.
+
+Usage: python scripts/bench_scoring.py [--refs 500] [--candidates 5] [--repeat 3] [--field-diffs]
+
+``--field-diffs`` compares building field diffs for every candidate (the old
+eager behaviour) with building them only for the best candidate per reference.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from refaudit import scoring
+from refaudit.scoring import ReferenceRecord, score_candidate
+
+WORDS = (
+    "randomized", "controlled", "trial", "effect", "of", "exercise", "on", "depression", "in",
+    "older", "adults", "systematic", "review", "meta", "analysis", "cohort", "study", "risk",
+    "factors", "mortality", "outcomes", "machine", "learning", "prediction", "model", "clinical",
+    "practice", "guideline", "association", "between", "sleep", "and", "cognitive", "decline",
+)
+VENUES = [
+    ("JAMA", ["Journal of the American Medical Association"]),
+    ("N Engl J Med", ["The New England journal of medicine"]),
+    ("BMJ", ["British Medical Journal"]),
+    ("Lancet", ["The Lancet"]),
+]
+
+
+def _record(rng: random.Random, title_words: list[str], venue: tuple[str, list[str]]) -> ReferenceRecord:
+    return ReferenceRecord(
+        title=" ".join(title_words).capitalize(),
+        authors=[rng.choice(["Smith", "Tanaka", "Garcia", "Chen", "Muller"]) for _ in range(3)],
+        year=rng.randint(1995, 2024),
+        venue=venue[0],
+        venue_aliases=venue[1],
+        volume=str(rng.randint(1, 400)),
+        issue=str(rng.randint(1, 12)),
+        page=f"{rng.randint(1, 900)}-{rng.randint(901, 999)}",
+    )
+
+
+def build_pairs(refs: int, candidates: int, seed: int = 0) -> list[tuple[ReferenceRecord, ReferenceRecord]]:
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(refs):
+        words = rng.sample(WORDS, 10)
+        reference = _record(rng, words, rng.choice(VENUES))
+        for index in range(candidates):
+            variant = words if index == 0 else rng.sample(words, len(words) - 2) + rng.sample(WORDS, 2)
+            pairs.append((reference, _record(rng, variant, rng.choice(VENUES))))
+    return pairs
+
+
+def _clear_caches() -> None:
+    for func in (
+        scoring.normalize_text,
+        scoring.normalize_venue,
+        scoring.normalize_token,
+        scoring.normalize_author_name,
+        scoring._pair_ratio,
+    ):
+        func.cache_clear()
+
+
+def run(pairs, backend: str, repeat: int) -> tuple[float, list[str]]:
+    scoring.set_similarity_backend(backend)
+    best = float("inf")
+    decisions: list[str] = []
+    for _ in range(repeat):
+        _clear_caches()
+        started = time.perf_counter()
+        decisions = [
+            score_candidate(reference, candidate, mode="verification").decision
+            for reference, candidate in pairs
+        ]
+        best = min(best, time.perf_counter() - started)
+    return best, decisions
+
+
+def run_field_diffs(pairs, candidates: int, eager: bool) -> tuple[float, int]:
+    _clear_caches()
+    tracemalloc.start()
+    started = time.perf_counter()
+    for start in range(0, len(pairs), candidates):
+        scores = [score_candidate(reference, candidate) for reference, candidate in pairs[start:start + candidates]]
+        shown = scores if eager else [max(scores, key=lambda score: score.total)]
+        for score in shown:
+            _ = score.field_diffs
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--refs", type=int, default=500)
+    p.add_argument("--candidates", type=int, default=5)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--field-diffs", action="store_true", help="Compare eager vs on-demand field diffs.")
+    args = p.parse_args()
+
+    pairs = build_pairs(args.refs, args.candidates)
+    if args.field_diffs:
+        for label, eager in (("eager", True), ("on-demand", False)):
+            elapsed, peak = run_field_diffs(pairs, args.candidates, eager)
+            print(
+                f"{label:>10}: {elapsed / args.refs * 1e6:8.1f} us/ref, "
+                f"peak traced memory {peak / 1024:,.0f} KiB"
+            )
+        return 0
+    baseline = None
+    for backend in scoring.SIMILARITY_BACKENDS:
+        elapsed, decisions = run(pairs, backend, args.repeat)
+        if baseline is None:
+            baseline = (elapsed, decisions)
+        agree = sum(a == b for a, b in zip(decisions, baseline[1])) / len(decisions)
+        print(
+            f"{backend:>10}: {elapsed * 1000:8.1f} ms for {len(pairs)} pairs "
+            f"({len(pairs) / elapsed:,.0f} pairs/sec, x{baseline[0] / elapsed:.2f} vs difflib, "
+            f"{agree:.1%} same decisions)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,7 @@
 """Windows-friendly local dev server (replaces `vercel dev`).
 
-Serves `public/` as static files and routes POST /api/check to api.check.handle_check.
+Serves `public/` as static files and routes POST /api/check to api.check.handle_check
+(or handle_check_stream when the client accepts NDJSON / SSE).
 Run: python scripts/local_server.py  (then open http://localhost:3000)
 """
 from __future__ import annotations
@@ -15,7 +16,13 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 sys.path.insert(0, str(ROOT / "src"))
 
-from api.check import handle_check  # noqa: E402
+from api.check import (  # noqa: E402
+    handle_check,
+    handle_check_stream,
+    handle_config,
+    stream_format,
+    write_stream,
+)
 
 PUBLIC = ROOT / "public"
 PORT = 3000
@@ -36,6 +43,9 @@ class Handler(BaseHTTPRequestHandler):
 
     def do_GET(self) -> None:  # noqa: N802
         path = self.path.split("?", 1)[0]
+        if path == "/api/check":
+            self._send_json(*handle_config())
+            return
         if path == "/":
             path = "/index.html"
         target = (PUBLIC / path.lstrip("/")).resolve()
@@ -71,7 +81,11 @@ class Handler(BaseHTTPRequestHandler):
         except json.JSONDecodeError:
             self._send_json(400, {"ok": False, "error": "invalid_json"})
             return
+        fmt = stream_format(self.headers.get("Accept"))
         try:
+            if fmt is not None:
+                write_stream(self, fmt, handle_check_stream(payload, fmt))
+                return
             status, response = handle_check(payload)
             self._send_json(status, response)
         except ValueError as exc:
@@ -13,13 +13,26 @@ for item in (ROOT, SRC):
     if str(item) not in sys.path:
         sys.path.insert(0, str(item))
 
-from api.check import build_json_response, handle_check
+from api.check import (
+    build_json_response,
+    handle_check,
+    handle_check_stream,
+    handle_config,
+    stream_format,
+    write_stream,
+)
 
 
 class LocalHandler(SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(PUBLIC), **kwargs)
 
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] == "/api/check":
+            self._write_json(*handle_config())
+            return
+        super().do_GET()
+
     def do_POST(self) -> None:
         if self.path != "/api/check":
             self.send_error(HTTPStatus.NOT_FOUND, "Not found")
@@ -37,7 +50,11 @@ class LocalHandler(SimpleHTTPRequestHandler):
             self._write_json(400, {"ok": False, "error": "invalid_json"})
             return
 
+        fmt = stream_format(self.headers.get("Accept"))
         try:
+            if fmt is not None:
+                write_stream(self, fmt, handle_check_stream(payload, fmt))
+                return
             status, response = handle_check(payload)
             self._write_json(status, response)
         except ValueError as exc:
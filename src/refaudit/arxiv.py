@@ -11,18 +11,30 @@ Rate limit: arXiv recommends max 1 request per 3 seconds.
 from __future__ import annotations
 
 import re
-import time
 import unicodedata
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from threading import Lock
+from typing import TYPE_CHECKING
 
 import requests
 
 from .budget import NO_BUDGET, TimeBudget
+from .cache import DEFAULT_TTLS, NO_CACHE, CacheStore, LRUDict
+from .ratelimit import HostRateLimiter
+from .transport import Transport
+
+if TYPE_CHECKING:
+    from .arxiv_index import ArxivIndex
 
 ARXIV_API = "https://export.arxiv.org/api/query"
 ATOM_NS = "http://www.w3.org/2005/Atom"
 ARXIV_NS = "http://arxiv.org/schemas/atom"
+OPENSEARCH_NS = "http://a9.com/-/spec/opensearch/1.1/"
+# IDs per id_list query when prefetching a bibliography.
+ARXIV_BATCH_SIZE = 100
+# Memo value for IDs a successful batch query did not return.
+_NOT_FOUND = object()
 
 
 @dataclass
@@ -62,23 +74,42 @@ def _normalize_arxiv_text(s: str) -> str:
 class ArxivClient:
     """Client for arXiv ATOM API."""
 
-    def __init__(self, pause_sec: float = 3.0, budget: TimeBudget | None = None):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        pause_sec: float = 3.0,
+        budget: TimeBudget | None = None,
+        limiter: HostRateLimiter | None = None,
+        cache: CacheStore | None = None,
+        transport: Transport | None = None,
+        index: ArxivIndex | None = None,
+    ):
+        self.session = (transport or Transport()).session()
         self.session.headers.update({
             "User-Agent": "ref-audit/0.1 (citation checker tool)"
         })
         self.pause_sec = pause_sec
         self.budget = budget or NO_BUDGET
+        self.limiter = limiter or HostRateLimiter.from_pause(pause_sec)
+        self.cache = cache or NO_CACHE
+        # arXiv asks for one connection at a time; serialize across batch workers.
+        self._request_lock = Lock()
+        self._id_cache = LRUDict(ttl=DEFAULT_TTLS["arxiv"])
+        # Local snapshot index, answered before the live API.
+        self.index = index
 
     def _get_xml(self, params: dict, *, ignore_budget: bool = False) -> ET.Element | None:
         """Fetch arXiv API and parse XML response."""
         if self.budget.expired and not ignore_budget:
             return None
         try:
-            timeout = 10.0 if ignore_budget else self.budget.http_timeout(10.0)
-            r = self.session.get(ARXIV_API, params=params, timeout=timeout)
-            r.raise_for_status()
-            time.sleep(self.pause_sec)
+            # ID lookups may outlive the budget once sent, but never queue past
+            # it: at arXiv's rate a wait for a token alone can exceed the budget.
+            if not self.limiter.acquire(ARXIV_API, self.budget.usable):
+                return None
+            with self._request_lock:
+                timeout = 10.0 if ignore_budget else self.budget.http_timeout(10.0)
+                r = self.session.get(ARXIV_API, params=params, timeout=timeout)
+                r.raise_for_status()
             return ET.fromstring(r.text)
         except (requests.RequestException, ET.ParseError):
             return None
@@ -157,12 +188,22 @@ class ArxivClient:
             ArxivMatch if found, None otherwise.
         """
         clean_id = _strip_version(arxiv_id)
+        memo = self._id_cache.get(clean_id)
+        if memo is not None:
+            return None if memo is _NOT_FOUND else memo
+        if self.index is not None and (match := self.index.lookup(clean_id)):
+            self._id_cache[clean_id] = match
+            return match
+        stored = self.cache.get("arxiv", clean_id)
+        if stored is not None:
+            self._id_cache[clean_id] = match = ArxivMatch(**stored)
+            return match
         root = self._get_xml({"id_list": clean_id, "max_results": "1"}, ignore_budget=True)
         if root is None:
             return None
 
         # Check totalResults
-        total_elem = root.find(".//{http://a9.com/-/spec/opensearch/1.1/}totalResults")
+        total_elem = root.find(f".//{{{OPENSEARCH_NS}}}totalResults")
         if total_elem is not None and total_elem.text == "0":
             return None
 
@@ -175,7 +216,58 @@ class ArxivClient:
         if title_elem is None or not title_elem.text or title_elem.text.strip() == "Error":
             return None
 
-        return self._parse_entry(entry)
+        match = self._parse_entry(entry)
+        if match:
+            self.cache.set("arxiv", clean_id, asdict(match))
+        return match
+
+    def lookup_ids(self, arxiv_ids: list[str], chunk_size: int = ARXIV_BATCH_SIZE) -> int:
+        """Fetch many IDs with comma-separated ``id_list`` queries.
+
+        Results are memoised so later :meth:`lookup_by_id` calls skip the
+        network (and the 3-second pause). Like ``lookup_by_id`` this ignores
+        the time budget. Returns the number of IDs found.
+        """
+        pending: list[str] = []
+        for arxiv_id in arxiv_ids:
+            clean_id = _strip_version(arxiv_id or "")
+            if not clean_id or "," in clean_id or clean_id in pending or clean_id in self._id_cache:
+                continue
+            if self.index is not None and (match := self.index.lookup(clean_id)):
+                self._id_cache[clean_id] = match
+                continue
+            stored = self.cache.get("arxiv", clean_id)
+            if stored is not None:
+                self._id_cache[clean_id] = ArxivMatch(**stored)
+                continue
+            pending.append(clean_id)
+
+        found = 0
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            root = self._get_xml({"id_list": ",".join(chunk), "max_results": str(len(chunk))}, ignore_budget=True)
+            if root is None:
+                continue
+            matches: dict[str, ArxivMatch] = {}
+            failed = False
+            for entry in root.findall(f"{{{ATOM_NS}}}entry"):
+                title_elem = entry.find(f"{{{ATOM_NS}}}title")
+                if title_elem is None or not title_elem.text or title_elem.text.strip() == "Error":
+                    # A malformed ID fails the whole query; leave the chunk to lookup_by_id.
+                    failed = True
+                    break
+                match = self._parse_entry(entry)
+                if match:
+                    matches[_strip_version(match.arxiv_id)] = match
+            if failed:
+                continue
+            for clean_id in chunk:
+                match = matches.get(clean_id)
+                self._id_cache[clean_id] = match or _NOT_FOUND
+                if match:
+                    self.cache.set("arxiv", clean_id, asdict(match))
+                    found += 1
+        return found
 
     def search_by_title(self, title: str, max_results: int = 5) -> list[ArxivMatch]:
         """Search arXiv by title text.
@@ -268,30 +360,38 @@ class ArxivClient:
             return None, "arxiv-id-not-found"
 
         if title:
+            if self.index is not None:
+                match = self._best_title_match(title, self.index.search_title(title))
+                if match:
+                    return match, "arxiv-title-search"
             first_author = authors[0] if authors else None
             results = self.search_by_title_and_author(title, first_author)
             if not results:
                 # Try without author constraint
                 results = self.search_by_title(title)
-
-            # Score results by title similarity
-            title_norm = _normalize_arxiv_text(title)
-            for result in results:
-                result_title_norm = _normalize_arxiv_text(result.title or "")
-                if title_norm and result_title_norm:
-                    # Check containment or high overlap
-                    if title_norm in result_title_norm or result_title_norm in title_norm:
-                        return result, "arxiv-title-search"
-                    # Token-based comparison
-                    title_tokens = set(title_norm.split())
-                    result_tokens = set(result_title_norm.split())
-                    if title_tokens and result_tokens:
-                        overlap = len(title_tokens & result_tokens) / max(
-                            len(title_tokens), len(result_tokens)
-                        )
-                        if overlap >= 0.8:
-                            return result, "arxiv-title-search"
-
+            match = self._best_title_match(title, results)
+            if match:
+                return match, "arxiv-title-search"
             return None, "arxiv-title-not-found"
 
         return None, "arxiv-no-query"
+
+    def _best_title_match(self, title: str, results: list[ArxivMatch]) -> ArxivMatch | None:
+        """First result whose title contains, or mostly overlaps, ``title``."""
+        title_norm = _normalize_arxiv_text(title)
+        for result in results:
+            result_title_norm = _normalize_arxiv_text(result.title or "")
+            if title_norm and result_title_norm:
+                # Check containment or high overlap
+                if title_norm in result_title_norm or result_title_norm in title_norm:
+                    return result
+                # Token-based comparison
+                title_tokens = set(title_norm.split())
+                result_tokens = set(result_title_norm.split())
+                if title_tokens and result_tokens:
+                    overlap = len(title_tokens & result_tokens) / max(
+                        len(title_tokens), len(result_tokens)
+                    )
+                    if overlap >= 0.8:
+                        return result
+        return None
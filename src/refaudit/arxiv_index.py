@@ -0,0 +1,285 @@
+"""Offline arXiv metadata index built from the public metadata snapshot.
+
+Ingests the arXiv metadata snapshot (one JSON object per line, optionally
+gzipped) into a single SQLite file keyed by base arXiv ID, with a
+title-token inverted index for title search. Abstracts are not stored, so
+the file stays compact; opening it is a plain ``sqlite3.connect``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import re
+import sqlite3
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from threading import Lock
+
+from .arxiv import ArxivMatch, _normalize_arxiv_text, _strip_version
+from .cache import connect_readonly
+
+# Rows per executemany while ingesting a multi-million-line snapshot.
+INGEST_CHUNK = 10000
+# IDs per ``IN (...)`` query, under SQLite's bound-parameter limit.
+LOOKUP_CHUNK = 500
+# Title tokens used to fetch candidates, rarest first.
+QUERY_TOKENS = 3
+# Candidates scored per title search.
+CANDIDATE_LIMIT = 200
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "by", "for", "from", "in", "into", "is",
+    "of", "on", "or", "the", "to", "with", "via", "using", "towards", "toward",
+})
+
+
+def title_tokens(title: str | None) -> list[str]:
+    """Distinct indexable tokens of a title, in order."""
+    tokens: list[str] = []
+    for token in _normalize_arxiv_text(title or "").split():
+        if len(token) > 1 and token not in STOPWORDS and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def _iso_date(value: str | None) -> str | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).strftime("%Y-%m-%dT%H:%M:%SZ")
+    except (TypeError, ValueError):
+        return None
+
+
+def _authors(item: dict) -> list[str]:
+    parsed = item.get("authors_parsed")
+    if parsed:
+        return [" ".join(part for part in (first, last) if part).strip() for last, first, *_ in parsed if last]
+    return [name.strip() for name in re.split(r",| and ", item.get("authors") or "") if name.strip()]
+
+
+def _from_snapshot(item: dict) -> dict | None:
+    arxiv_id = _strip_version((item.get("id") or "").strip())
+    title = re.sub(r"\s+", " ", item.get("title") or "").strip()
+    if not arxiv_id or not title:
+        return None
+    versions = item.get("versions") or []
+    return {
+        "arxiv_id": arxiv_id,
+        "title": title,
+        "authors": _authors(item),
+        "published": _iso_date(versions[0].get("created")) if versions else None,
+        "updated": item.get("update_date"),
+        "doi": (item.get("doi") or "").split()[0] if item.get("doi") else None,
+        "journal_ref": item.get("journal-ref"),
+        "categories": (item.get("categories") or "").split(),
+    }
+
+
+def read_snapshot(path: str | Path) -> Iterator[dict]:
+    """Yield normalised records from a JSON Lines snapshot (``.gz`` allowed)."""
+    path = Path(path)
+    opener = gzip.open if path.suffix.lower() == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            record = _from_snapshot(item)
+            if record:
+                yield record
+
+
+class ArxivIndex:
+    """Read/write SQLite index of arXiv metadata.
+
+    With ``readonly`` the file must already exist and is never created or
+    modified; only the ingest command opens it for writing.
+    """
+
+    def __init__(self, path: str | Path, readonly: bool = False):
+        self.path = Path(path)
+        self._lock = Lock()
+        if readonly:
+            self._conn = connect_readonly(self.path, "papers", "arXiv index")
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS papers ("
+            " key INTEGER PRIMARY KEY,"
+            " arxiv_id TEXT NOT NULL UNIQUE,"
+            " title TEXT NOT NULL,"
+            " authors TEXT NOT NULL,"
+            " published TEXT,"
+            " updated TEXT,"
+            " doi TEXT,"
+            " journal_ref TEXT,"
+            " categories TEXT);"
+            "CREATE TABLE IF NOT EXISTS postings ("
+            " token TEXT NOT NULL,"
+            " paper INTEGER NOT NULL,"
+            " PRIMARY KEY (token, paper)) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        )
+        self._conn.commit()
+
+    def ingest(self, records: Iterable[dict]) -> int:
+        """Upsert ``records`` by arXiv ID, re-indexing their title tokens."""
+        count = 0
+        batch: list[dict] = []
+        with self._lock:
+            self._conn.execute("PRAGMA synchronous=OFF")
+            for record in records:
+                batch.append(record)
+                if len(batch) >= INGEST_CHUNK:
+                    count += self._ingest_chunk(batch)
+                    batch = []
+            count += self._ingest_chunk(batch)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed_at', ?)",
+                (str(time.time()),),
+            )
+            self._conn.commit()
+            self._conn.execute("PRAGMA synchronous=FULL")
+        return count
+
+    def _existing(self, arxiv_ids: list[str]) -> list[tuple[int, str]]:
+        """``(key, title)`` of the papers already indexed under ``arxiv_ids``."""
+        rows: list[tuple[int, str]] = []
+        for start in range(0, len(arxiv_ids), LOOKUP_CHUNK):
+            chunk = arxiv_ids[start:start + LOOKUP_CHUNK]
+            rows += self._conn.execute(
+                f"SELECT key, title FROM papers WHERE arxiv_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+        return rows
+
+    def _ingest_chunk(self, records: list[dict]) -> int:
+        # Postings of a paper being replaced go by its old title's tokens,
+        # which hits the (token, paper) primary key instead of a scan.
+        stale = self._existing([record["arxiv_id"] for record in records])
+        # Upsert keeps each paper's key, so postings can be re-pointed by arXiv ID.
+        self._conn.executemany(
+            "INSERT INTO papers"
+            " (arxiv_id, title, authors, published, updated, doi, journal_ref, categories)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (arxiv_id) DO UPDATE SET title = excluded.title, authors = excluded.authors,"
+            " published = excluded.published, updated = excluded.updated, doi = excluded.doi,"
+            " journal_ref = excluded.journal_ref, categories = excluded.categories",
+            [
+                (
+                    record["arxiv_id"],
+                    record["title"],
+                    json.dumps(record.get("authors") or [], ensure_ascii=False),
+                    record.get("published"),
+                    record.get("updated"),
+                    record.get("doi"),
+                    record.get("journal_ref"),
+                    " ".join(record.get("categories") or []),
+                )
+                for record in records
+            ],
+        )
+        if stale:
+            self._conn.executemany(
+                "DELETE FROM postings WHERE token = ? AND paper = ?",
+                [(token, key) for key, title in stale for token in title_tokens(title)],
+            )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO postings (token, paper) SELECT ?, key FROM papers WHERE arxiv_id = ?",
+            [(token, record["arxiv_id"]) for record in records for token in title_tokens(record["title"])],
+        )
+        self._conn.commit()
+        return len(records)
+
+    def _match(self, row: tuple) -> ArxivMatch:
+        arxiv_id, title, authors, published, updated, doi, journal_ref, categories = row
+        return ArxivMatch(
+            arxiv_id=arxiv_id,
+            title=title,
+            authors=json.loads(authors),
+            published=published,
+            updated=updated,
+            doi=doi,
+            journal_ref=journal_ref,
+            categories=(categories or "").split(),
+        )
+
+    def lookup(self, arxiv_id: str) -> ArxivMatch | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT arxiv_id, title, authors, published, updated, doi, journal_ref, categories"
+                " FROM papers WHERE arxiv_id = ?",
+                (_strip_version(arxiv_id.strip()),),
+            ).fetchone()
+        return self._match(row) if row else None
+
+    def search_title(self, title: str, limit: int = 5) -> list[ArxivMatch]:
+        """Papers sharing the most title tokens with ``title``, best first."""
+        tokens = title_tokens(title)
+        if not tokens:
+            return []
+        marks = ",".join("?" * len(tokens))
+        with self._lock:
+            frequencies = self._conn.execute(
+                f"SELECT token, COUNT(*) FROM postings WHERE token IN ({marks}) GROUP BY token",
+                tokens,
+            ).fetchall()
+            if not frequencies:
+                return []
+            rare = [token for token, _ in sorted(frequencies, key=lambda item: item[1])[:QUERY_TOKENS]]
+            rows = self._conn.execute(
+                "SELECT arxiv_id, title, authors, published, updated, doi, journal_ref, categories"
+                f" FROM papers WHERE key IN (SELECT paper FROM postings WHERE token IN ({','.join('?' * len(rare))})"
+                " GROUP BY paper ORDER BY COUNT(*) DESC LIMIT ?)",
+                (*rare, CANDIDATE_LIMIT),
+            ).fetchall()
+        wanted = set(tokens)
+
+        def overlap(row: tuple) -> float:
+            found = set(title_tokens(row[1]))
+            return len(wanted & found) / max(len(wanted), len(found))
+
+        return [self._match(row) for row in sorted(rows, key=overlap, reverse=True)[:limit]]
+
+    def stats(self) -> dict:
+        with self._lock:
+            papers = self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'refreshed_at'").fetchone()
+        return {"papers": papers, "refreshed_at": float(row[0]) if row else None}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="citeguard-arxiv-index",
+        description="Build or refresh an offline arXiv index from the arXiv metadata snapshot.",
+    )
+    p.add_argument("index", type=Path, help="SQLite index file to create or update.")
+    p.add_argument("snapshots", type=Path, nargs="*", help="JSON Lines snapshot files (.json or .json.gz).")
+    args = p.parse_args(argv)
+
+    index = ArxivIndex(args.index)
+    try:
+        for snapshot in args.snapshots:
+            count = index.ingest(read_snapshot(snapshot))
+            print(f"{snapshot}: {count} papers", file=sys.stderr)
+        stats = index.stats()
+    finally:
+        index.close()
+    print(f"{args.index}: {stats['papers']} papers", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+"""Concurrent batch checking of many references against one shared client."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from .crossref import CrossrefClient, MatchResult
+
+MAX_JOBS = 16
+
+
+@dataclass
+class BatchStats:
+    total: int
+    elapsed_sec: float
+    jobs: int
+    executor: dict | None = None
+    prefetched: dict[str, int] | None = None
+    connections: dict[str, dict[str, int]] | None = None
+    # References answered from a resume journal without being re-checked.
+    reused: int = 0
+
+    @property
+    def refs_per_sec(self) -> float:
+        if self.elapsed_sec <= 0:
+            return 0.0
+        return self.total / self.elapsed_sec
+
+    def summary(self) -> str:
+        text = (
+            f"checked {self.total} references in {self.elapsed_sec:.1f}s "
+            f"({self.refs_per_sec:.2f} refs/sec, jobs={self.jobs})"
+        )
+        if self.reused:
+            text += f"; reused {self.reused} from journal"
+        if self.prefetched:
+            text += "; prefetched " + ", ".join(f"{count} {kind}" for kind, count in self.prefetched.items())
+        if self.executor:
+            text += (
+                f"; source pool {self.executor['workers']} workers, "
+                f"utilisation {self.executor['utilisation']:.0%}, "
+                f"peak queue {self.executor['peak_queued']}"
+            )
+        if self.connections:
+            opened = sum(entry["connections"] for entry in self.connections.values())
+            reused = sum(entry["reused"] for entry in self.connections.values())
+            text += f"; {opened} connections opened, {reused} reused"
+        return text
+
+
+def check_batch(
+    client: CrossrefClient,
+    refs: list[str],
+    jobs: int = 1,
+    prefetch: bool = True,
+    on_result: Callable[[int, MatchResult], None] | None = None,
+    ordered: bool = True,
+    on_complete: Callable[[int, MatchResult], None] | None = None,
+) -> tuple[list[MatchResult], BatchStats]:
+    """Check ``refs`` with up to ``jobs`` references in flight.
+
+    Results are returned in input order regardless of completion order.
+    With ``prefetch`` the client first warms its caches for the whole list
+    (e.g. batched DOI lookups) so per-reference checks hit memory. Matched
+    DOIs are then screened for retractions in batched calls.
+
+    ``on_result(index, result)`` is called on the calling thread as each
+    check finishes: in input order when ``ordered`` (later results wait in
+    a reorder buffer), otherwise in completion order. ``on_complete`` is
+    always called in completion order, before any reordering, so a
+    checkpoint never waits on a slow earlier reference.
+    """
+    jobs = max(1, min(jobs, MAX_JOBS, len(refs) or 1))
+    started = time.monotonic()
+    warm = getattr(client, "prefetch", None) if prefetch else None
+    prefetched = warm(refs) if warm and refs else None
+    results: list[MatchResult | None] = [None] * len(refs)
+    if jobs == 1:
+        for index, line in enumerate(refs):
+            results[index] = client.check_one(line)
+            if on_complete is not None:
+                on_complete(index, results[index])
+            if on_result is not None:
+                on_result(index, results[index])
+    else:
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="refaudit-batch") as executor:
+            futures = {executor.submit(client.check_one, line): index for index, line in enumerate(refs)}
+            next_index = 0
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                if on_complete is not None:
+                    on_complete(index, results[index])
+                if on_result is None:
+                    continue
+                if not ordered:
+                    on_result(index, results[index])
+                    continue
+                while next_index < len(refs) and results[next_index] is not None:
+                    on_result(next_index, results[next_index])
+                    next_index += 1
+    screen = getattr(client, "screen_retractions", None)
+    if screen and results:
+        screen(results)
+    executor_stats = getattr(client, "executor_stats", None)
+    connection_stats = getattr(client, "connection_stats", None)
+    stats = BatchStats(
+        total=len(refs),
+        elapsed_sec=time.monotonic() - started,
+        jobs=jobs,
+        executor=executor_stats() if executor_stats else None,
+        prefetched=prefetched,
+        connections=connection_stats() if connection_stats else None,
+    )
+    return results, stats
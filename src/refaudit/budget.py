@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import math
 import time
-from threading import Lock
+from threading import Event, Lock
 
 
 class TimeBudget:
@@ -24,6 +25,11 @@ class TimeBudget:
     def remaining(self) -> float:
         return max(0.0, self._total - self.elapsed)
 
+    @property
+    def usable(self) -> float:
+        """Seconds left before the budget counts as expired."""
+        return max(0.0, self.remaining - 1.0)
+
     @property
     def expired(self) -> bool:
         return self.remaining <= 1.0
@@ -57,5 +63,35 @@ class TimeBudget:
             self.source_errors[source] = error
 
 
-# Sentinel: no budget constraint (CLI usage).
-NO_BUDGET = TimeBudget(total_seconds=600.0)
+class CancellableBudget(TimeBudget):
+    """A view of ``parent`` that also runs out as soon as ``cancel`` is set.
+
+    Lookups stop at their next request, and a cancelled miss reads like an
+    expired one, so nothing caches it as a verdict.
+    """
+
+    def __init__(self, parent: TimeBudget, cancel: Event):
+        self._parent = parent
+        self.cancel = cancel
+
+    @property
+    def elapsed(self) -> float:
+        return self._parent.elapsed
+
+    @property
+    def remaining(self) -> float:
+        return 0.0 if self.cancel.is_set() else self._parent.remaining
+
+    def diagnostics(self) -> dict:
+        return self._parent.diagnostics()
+
+    def mark_skipped(self, source: str) -> None:
+        self._parent.mark_skipped(source)
+
+    def mark_source_error(self, source: str, error: str) -> None:
+        self._parent.mark_source_error(source, error)
+
+
+# Sentinel: no budget constraint (CLI usage). Unbounded, so a long batch run
+# never starts treating lookups as out of time.
+NO_BUDGET = TimeBudget(total_seconds=math.inf)
@@ -0,0 +1,210 @@
+"""Persistent metadata cache shared by the API clients.
+
+Clients keep their per-run dicts as a first level and consult a
+:class:`CacheStore` behind them, so repeat audits of the same references
+skip the network. Entries are JSON values grouped into namespaces, each
+with its own time-to-live.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+DAY = 86400.0
+
+# Work metadata rarely changes; retraction status is what we re-check most.
+DEFAULT_TTLS: dict[str, float] = {
+    "work": 30 * DAY,
+    "bibliographic": 7 * DAY,
+    "retraction": 1 * DAY,
+    "nlm_alias": 90 * DAY,
+    "doi_ra": 180 * DAY,
+    "pubmed_summary": 30 * DAY,
+    "pubmed_citmatch": 30 * DAY,
+    "arxiv": 30 * DAY,
+}
+
+
+# Entries kept per in-memory memo; a long-lived client must not grow forever.
+MEMO_SIZE = 4096
+
+
+def cache_key(*parts: Any) -> str:
+    """Build a stable string key from JSON-serialisable parts."""
+    return json.dumps(parts, ensure_ascii=False, separators=(",", ":"))
+
+
+class CacheStore:
+    """Cache interface. The base class stores nothing.
+
+    ``get`` returns ``None`` on a miss, so ``None`` itself is never stored.
+    """
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        return None
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def connect_readonly(path: Path, table: str, kind: str) -> sqlite3.Connection:
+    """Open an existing SQLite index read-only; never creates the file."""
+    if not path.is_file():
+        raise FileNotFoundError(f"{kind} not found: {path}")
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+    try:
+        found = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    except sqlite3.DatabaseError as exc:
+        conn.close()
+        raise ValueError(f"not a {kind}: {path}") from exc
+    if found is None:
+        conn.close()
+        raise ValueError(f"not a {kind}: {path}")
+    return conn
+
+
+class SQLiteCache(CacheStore):
+    """Single-file SQLite cache with per-namespace TTLs."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttls: dict[str, float] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._clock = clock
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            pass
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        self._conn.commit()
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None:
+            return None
+        value, stored_at = row
+        ttl = self.ttls.get(namespace)
+        if ttl is not None and self._clock() - stored_at > ttl:
+            with self._lock:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                self._conn.commit()
+            return None
+        return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        if value is None:
+            return
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, encoded, self._clock()),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        now = self._clock()
+        removed = 0
+        with self._lock:
+            for namespace, ttl in self.ttls.items():
+                cursor = self._conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND stored_at < ?",
+                    (namespace, now - ttl),
+                )
+                removed += cursor.rowcount
+            self._conn.commit()
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_MISSING = object()
+
+
+class LRUDict:
+    """Thread-safe in-memory memo that drops the least recently used entries.
+
+    Used as the first cache level inside the clients. ``ttl`` bounds how long
+    an entry is trusted, which matters once a client outlives one run.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = MEMO_SIZE,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if self.ttl is not None and self._clock() - entry[1] > self.ttl:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Sentinel: no persistent cache (default).
+NO_CACHE = CacheStore()
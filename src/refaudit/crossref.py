@@ -1,21 +1,24 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import copy
+from concurrent.futures import as_completed
 from dataclasses import dataclass, replace
 from datetime import datetime
-from threading import Lock
-import time
-from typing import Literal
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Literal, Self
 import urllib.parse
 
 import requests
 
 from .arxiv import ArxivClient, ArxivMatch
-from .budget import NO_BUDGET, TimeBudget
+from .arxiv_index import ArxivIndex
+from .budget import NO_BUDGET, CancellableBudget, TimeBudget
+from .cache import DEFAULT_TTLS, NO_CACHE, CacheStore, LRUDict, cache_key
 from .doi_resolver import DOIResolver
 from .jalc import JALCClient
 from .nlm import NLMCatalogClient
 from .etiquette import build_user_agent
+from .executor import DEFAULT_SOURCE_WORKERS, InstrumentedExecutor
 from .parser import (
     contains_japanese_text,
     extract_arxiv_id,
@@ -24,7 +27,8 @@ from .parser import (
     is_website_reference,
     parse_reference_metadata,
 )
-from .pubmed import PubMedClient, PubMedMatch
+from .pubmed import PubMedBatcher, PubMedClient, PubMedMatch
+from .ratelimit import HostRateLimiter
 from .scoring import (
     CandidateScore,
     ReferenceRecord,
@@ -33,10 +37,27 @@ from .scoring import (
     score_candidate,
     year_similarity,
 )
+from .transport import Transport
+
+if TYPE_CHECKING:
+    from .retraction_index import RetractionIndex
 
 API = "https://api.crossref.org/works"
+WORK_SELECT = (
+    "DOI,title,issued,published-print,published-online,"
+    "container-title,ISSN,volume,issue,page,type,author,update-to,relation"
+)
+# DOIs per filter=doi:... query when prefetching a bibliography.
+DOI_BATCH_SIZE = 20
+# DOIs per filter=updates:... query when screening for retractions.
+RETRACTION_BATCH_SIZE = 20
+RETRACTION_ROWS = 1000
 RETRACTION_TYPES = {"retraction", "withdrawal", "removal", "partial_retraction"}
 ALIAS_ENRICH_FLOOR = max(0.0, SUGGEST_THRESHOLD - 0.1)
+# Stop waiting for slower sources once a candidate scores at least this
+# high and its title, first author and year all match outright.
+EARLY_EXIT_SCORE = 0.85
+EARLY_EXIT_TITLE = 0.9
 
 
 @dataclass
@@ -65,6 +86,7 @@ class MatchResult:
     verification_status: Literal["complete", "partial"] = "complete"
     unchecked_sources: list[str] | None = None
     source_errors: dict[str, str] | None = None
+    early_exit: dict | None = None
 
 
 @dataclass
@@ -74,6 +96,14 @@ class CandidateMatch:
     score: CandidateScore
 
 
+@dataclass
+class CandidateEvaluation:
+    """Candidates ranked under both decision modes from one scoring pass."""
+
+    verified: list[CandidateMatch]
+    correction: list[CandidateMatch]
+
+
 @dataclass
 class SourceCollectionResult:
     source: str
@@ -118,6 +148,40 @@ def _is_preprint_work(work: dict) -> bool:
     return work_type == "posted-content" or "preprint" in container or "arxiv" in container
 
 
+def _retraction_hits(notices: list[dict], doi: str, require_doi: bool = False) -> list[dict]:
+    """Retraction-type ``update-to`` entries among ``notices`` that target ``doi``.
+
+    An entry without a ``DOI`` is taken to target ``doi`` unless
+    ``require_doi`` is set, as it must be when the notices answer a query
+    for several DOIs at once.
+    """
+    target = doi.lower()
+    hits: list[dict] = []
+    seen: set[tuple[str | None, str | None]] = set()
+    for notice in notices:
+        for update in notice.get("update-to", []):
+            update_type = (update.get("type") or "").lower()
+            if update_type not in RETRACTION_TYPES:
+                continue
+            updated_doi = (update.get("DOI") or "").lower()
+            if updated_doi != target and (updated_doi or require_doi):
+                continue
+            key = (notice.get("DOI"), update_type)
+            if key in seen:
+                continue
+            seen.add(key)
+            hits.append(
+                {
+                    "notice_doi": notice.get("DOI"),
+                    "update_type": update.get("type"),
+                    "source": update.get("source"),
+                    "updated": update.get("updated", {}),
+                    "label": update.get("label"),
+                }
+            )
+    return hits
+
+
 def _merge_records(primary: ReferenceRecord, secondary: ReferenceRecord | None) -> ReferenceRecord:
     if secondary is None:
         return primary
@@ -155,23 +219,117 @@ class CrossrefClient:
         debug: bool = False,
         email: str | None = None,
         budget: TimeBudget | None = None,
+        limiter: HostRateLimiter | None = None,
+        rates: dict[str, float] | None = None,
+        cache: CacheStore | None = None,
+        early_exit_score: float | None = EARLY_EXIT_SCORE,
+        source_workers: int = DEFAULT_SOURCE_WORKERS,
+        defer_retractions: bool = False,
+        retraction_index: RetractionIndex | None = None,
+        offline_retractions: bool = False,
+        transport: Transport | None = None,
+        speculative_pubmed: bool = False,
+        pubmed_batching: bool = False,
+        arxiv_index: ArxivIndex | None = None,
     ):
-        self.session = requests.Session()
+        # One thread per source worker plus the caller's own lookups.
+        self.transport = transport or Transport(pool_size=source_workers + 1)
+        self.session = self.transport.session()
         self.session.headers.update({"User-Agent": build_user_agent(email)})
         self.pause_sec = pause_sec
         self.strict = strict
         self.debug = debug
         self.email = email
         self.budget = budget or NO_BUDGET
+        self.limiter = limiter or HostRateLimiter.from_pause(pause_sec, rates)
+        self.cache = cache or NO_CACHE
+        self.early_exit_score = early_exit_score
+        self.source_workers = source_workers
+        self.defer_retractions = defer_retractions
+        self.retraction_index = retraction_index
+        # Trust the local index as complete: DOIs it does not list are clean.
+        self.offline_retractions = offline_retractions and retraction_index is not None
+        if self.offline_retractions and not retraction_index.populated:
+            # An empty index would clear every reference without a single lookup.
+            raise ValueError(f"offline retraction checks need a populated index: {retraction_index.path}")
+        self._executor: InstrumentedExecutor | None = None
         self._lock = Lock()
-        self._doi_cache: dict[str, tuple[dict | None, str]] = {}
-        self._retraction_cache: dict[str, tuple[bool, list[dict]]] = {}
-        self._bibliographic_cache: dict[tuple[str, int], list[dict]] = {}
-        self._nlm = NLMCatalogClient(pause_sec=pause_sec, email=email, budget=self.budget)
-        self._resolver = DOIResolver(pause_sec=pause_sec, email=email, budget=self.budget)
-        self._pubmed = PubMedClient(pause_sec=pause_sec, email=email, budget=self.budget)
-        self._arxiv = ArxivClient(pause_sec=max(self.pause_sec, 3.0), budget=self.budget)
-        self._jalc = JALCClient(pause_sec=self.pause_sec, email=self.email, budget=self.budget)
+        self._doi_cache = LRUDict(ttl=DEFAULT_TTLS["work"])
+        self._retraction_cache = LRUDict(ttl=DEFAULT_TTLS["retraction"])
+        self._bibliographic_cache = LRUDict(ttl=DEFAULT_TTLS["bibliographic"])
+        # PMIDs found by the ECitMatch pre-pass, by reference line.
+        self._citmatch_cache = LRUDict(ttl=DEFAULT_TTLS["pubmed_citmatch"])
+        shared = {"budget": self.budget, "limiter": self.limiter, "cache": self.cache, "transport": self.transport}
+        self._nlm = NLMCatalogClient(pause_sec=pause_sec, email=email, **shared)
+        self._resolver = DOIResolver(pause_sec=pause_sec, email=email, **shared)
+        self._pubmed = PubMedClient(
+            pause_sec=pause_sec,
+            email=email,
+            speculative=speculative_pubmed,
+            # Only worth the batching window when several checks run at once.
+            batcher=PubMedBatcher() if pubmed_batching else None,
+            pool=self._source_executor,
+            **shared,
+        )
+        self._arxiv = ArxivClient(pause_sec=max(self.pause_sec, 3.0), index=arxiv_index, **shared)
+        self._jalc = JALCClient(
+            pause_sec=self.pause_sec,
+            email=self.email,
+            budget=self.budget,
+            limiter=self.limiter,
+            transport=self.transport,
+        )
+
+    def fork(self, budget: TimeBudget | None = None) -> CrossrefClient:
+        """A client for one request that reuses this client's sessions and caches.
+
+        Connections, the rate limiter and the in-memory memos are shared; the
+        budget and the source pool belong to the fork, so closing it leaves
+        the parent usable.
+        """
+        clone = self._with_budget(budget or NO_BUDGET)
+        clone._lock = Lock()
+        clone._executor = None
+        clone._pubmed.pool = clone._source_executor
+        return clone
+
+    def _with_budget(self, budget: TimeBudget) -> CrossrefClient:
+        """A shallow copy whose own lookups and sources all run on ``budget``."""
+        clone = copy.copy(self)
+        clone.budget = budget
+        for name in ("_nlm", "_resolver", "_pubmed", "_arxiv", "_jalc"):
+            source = copy.copy(getattr(self, name))
+            source.budget = budget
+            setattr(clone, name, source)
+        return clone
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _source_executor(self) -> InstrumentedExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = InstrumentedExecutor(max_workers=self.source_workers)
+            return self._executor
+
+    def executor_stats(self) -> dict | None:
+        """Queue depth and utilisation of the shared source pool, if started."""
+        with self._lock:
+            executor = self._executor
+        return executor.stats() if executor is not None else None
+
+    def connection_stats(self) -> dict[str, dict[str, int]]:
+        """Connection reuse per host on the shared transport."""
+        return self.transport.stats()
 
     def _source_exception(self, exc: Exception) -> str:
         message = str(exc).strip()
@@ -181,9 +339,10 @@ class CrossrefClient:
         if self.budget.expired:
             return None
         try:
+            if not self.limiter.acquire(url, self.budget.usable):
+                return None
             response = self.session.get(url, params=params, timeout=self.budget.http_timeout(10.0))
             response.raise_for_status()
-            time.sleep(self.pause_sec)
             return response.json()
         except requests.RequestException:
             return None
@@ -193,10 +352,15 @@ class CrossrefClient:
         return items[0] if items else None
 
     def search_bibliographic_items(self, ref: str, rows: int = 5) -> list[dict]:
-        cache_key = (ref, rows)
-        with self._lock:
-            if cache_key in self._bibliographic_cache:
-                return self._bibliographic_cache[cache_key]
+        memo_key = (ref, rows)
+        memo = self._bibliographic_cache.get(memo_key)
+        if memo is not None:
+            return memo
+        store_key = cache_key(ref, rows)
+        stored = self.cache.get("bibliographic", store_key)
+        if stored is not None:
+            self._bibliographic_cache[memo_key] = stored
+            return stored
         params = {
             "query.bibliographic": ref,
             "rows": rows,
@@ -206,65 +370,218 @@ class CrossrefClient:
         if not payload:
             return []
         items = payload.get("message", {}).get("items", [])
-        with self._lock:
-            self._bibliographic_cache[cache_key] = items
+        self._bibliographic_cache[memo_key] = items
+        self.cache.set("bibliographic", store_key, items)
         return items
 
     def get_work(self, doi: str) -> dict | None:
-        payload = self._get(
-            f"{API}/{urllib.parse.quote(doi)}",
-            {
-                "select": (
-                    "DOI,title,issued,published-print,published-online,"
-                    "container-title,ISSN,volume,issue,page,type,author,update-to,relation"
-                )
-            },
-        )
+        payload = self._get(f"{API}/{urllib.parse.quote(doi)}", {"select": WORK_SELECT})
         if not payload:
             return None
         return payload.get("message")
 
-    def find_updates_for(self, doi: str) -> list[dict]:
+    def prefetch_dois(self, dois: list[str], chunk_size: int = DOI_BATCH_SIZE) -> int:
+        """Fill ``_doi_cache`` for many DOIs with one Crossref query per chunk.
+
+        DOIs that Crossref does not return (other registration agencies,
+        typos) are left for the normal per-reference resolution chain.
+        Returns the number of DOIs resolved.
+        """
+        pending: list[str] = []
+        seen: set[str] = set()
+        for doi in dois:
+            key = (doi or "").lower()
+            # Commas would split the filter expression.
+            if not key or "," in key or key in seen:
+                continue
+            seen.add(key)
+            if key in self._doi_cache:
+                continue
+            if self.cache.get("work", key) is not None:
+                continue
+            pending.append(doi)
+
+        resolved = 0
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            payload = self._get(
+                API,
+                {
+                    "filter": ",".join(f"doi:{doi}" for doi in chunk),
+                    "rows": len(chunk),
+                    "select": WORK_SELECT,
+                },
+            )
+            if not payload:
+                continue
+            works = {
+                (item.get("DOI") or "").lower(): item
+                for item in payload.get("message", {}).get("items", [])
+            }
+            for doi in chunk:
+                work = works.get(doi.lower())
+                if work is None:
+                    continue
+                result = (work, "doi-crossref")
+                self._doi_cache[doi.lower()] = result
+                self.cache.set("work", doi.lower(), list(result))
+                resolved += 1
+        return resolved
+
+    def prefetch_pmids(self, refs: list[str]) -> int:
+        """Resolve journal-style references to PMIDs in bulk with ECitMatch.
+
+        Only lines without a DOI and with a journal, year, first author and
+        a volume or first page are sent; lines with a DOI are resolved by it
+        and never consult these matches. Matched lines skip the PubMed
+        free-text searches. Returns the number of references matched.
+        """
+        citations: dict[str, tuple[str, str, str, str, str]] = {}
+        for line in refs:
+            if line in citations or line in self._citmatch_cache or is_website_reference(line):
+                continue
+            if extract_doi(line):
+                continue
+            record = parse_reference_metadata(line)
+            first_page = (record.page or "").split("-")[0].strip()
+            if not (record.venue and record.year and record.authors and (record.volume or first_page)):
+                continue
+            citations[line] = (record.venue, str(record.year), record.volume or "", first_page, record.authors[0])
+        if not citations:
+            return 0
+        found = self._pubmed.match_citations(citations)
+        for line, pmid in found.items():
+            self._citmatch_cache[line] = pmid
+        return len(found)
+
+    def prefetch(self, refs: list[str]) -> dict[str, int]:
+        """Warm the caches for a whole bibliography before checking it."""
+        dois = [
+            doi
+            for line in refs
+            if not is_website_reference(line) and (doi := extract_doi(line))
+        ]
+        arxiv_ids = [arxiv_id for line in refs if (arxiv_id := extract_arxiv_id(line))]
+        return {
+            "dois": self.prefetch_dois(dois),
+            "retractions": len(self.check_retractions(dois)),
+            "pmids": self.prefetch_pmids(refs),
+            "arxiv": self._arxiv.lookup_ids(arxiv_ids),
+        }
+
+    def _fetch_updates(self, doi: str) -> list[dict] | None:
         payload = self._get(
             API,
             {"filter": f"updates:{doi},is-update:true", "rows": 1000, "select": "DOI,update-to"},
         )
         if not payload:
-            return []
+            return None
         return payload.get("message", {}).get("items", [])
 
+    def find_updates_for(self, doi: str) -> list[dict]:
+        return self._fetch_updates(doi) or []
+
+    def _cached_retraction(self, doi: str) -> tuple[bool, list[dict]] | None:
+        key = doi.lower()
+        memo = self._retraction_cache.get(key)
+        if memo is not None:
+            return memo
+        if self.retraction_index is not None:
+            hits = self.retraction_index.lookup(doi=key)
+            if hits or self.offline_retractions:
+                result = (bool(hits), hits)
+                self._store_retraction(key, result, persist=False)
+                return result
+        stored = self.cache.get("retraction", key)
+        if stored is None:
+            return None
+        result = (bool(stored[0]), stored[1])
+        self._retraction_cache[key] = result
+        return result
+
+    def _store_retraction(self, doi: str, result: tuple[bool, list[dict]], persist: bool = True) -> None:
+        self._retraction_cache[doi.lower()] = result
+        if persist:
+            self.cache.set("retraction", doi.lower(), list(result))
+
     def is_retracted(self, doi: str | None) -> tuple[bool, list[dict]]:
         if not doi:
             return False, []
-        with self._lock:
-            if doi in self._retraction_cache:
-                return self._retraction_cache[doi]
-        notices = self.find_updates_for(doi)
-        hits: list[dict] = []
-        seen: set[tuple[str | None, str | None]] = set()
-        for notice in notices:
-            for update in notice.get("update-to", []):
-                update_type = (update.get("type") or "").lower()
-                if update_type not in RETRACTION_TYPES:
-                    continue
-                key = (notice.get("DOI"), update_type)
-                if key in seen:
-                    continue
-                seen.add(key)
-                hits.append(
-                    {
-                        "notice_doi": notice.get("DOI"),
-                        "update_type": update.get("type"),
-                        "source": update.get("source"),
-                        "updated": update.get("updated", {}),
-                        "label": update.get("label"),
-                    }
-                )
+        cached = self._cached_retraction(doi)
+        if cached is not None:
+            return cached
+        notices = self._fetch_updates(doi)
+        hits = _retraction_hits(notices or [], doi)
         result = (bool(hits), hits)
-        with self._lock:
-            self._retraction_cache[doi] = result
+        if notices is not None:
+            self._store_retraction(doi, result)
         return result
 
+    def check_retractions(
+        self,
+        dois: list[str],
+        chunk_size: int = RETRACTION_BATCH_SIZE,
+    ) -> dict[str, tuple[bool, list[dict]]]:
+        """Screen many DOIs for retraction notices with one query per chunk.
+
+        Notices are attributed to the DOIs named in their ``update-to``
+        entries. Returns ``{doi.lower(): (retracted, details)}`` for every
+        DOI answered from cache or by a successful query; DOIs in failed or
+        truncated chunks are left for :meth:`is_retracted`.
+        """
+        results: dict[str, tuple[bool, list[dict]]] = {}
+        pending: list[str] = []
+        for doi in dois:
+            key = (doi or "").lower()
+            if not key or "," in key or key in results or key in pending:
+                continue
+            cached = self._cached_retraction(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending.append(key)
+
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            payload = self._get(
+                API,
+                {
+                    "filter": ",".join(f"updates:{doi}" for doi in chunk) + ",is-update:true",
+                    "rows": RETRACTION_ROWS,
+                    "select": "DOI,update-to",
+                },
+            )
+            if not payload:
+                continue
+            notices = payload.get("message", {}).get("items", [])
+            if len(notices) >= RETRACTION_ROWS:
+                # Possibly truncated; an empty answer here would be a false negative.
+                continue
+            for doi in chunk:
+                hits = _retraction_hits(notices, doi, require_doi=len(chunk) > 1)
+                results[doi] = (bool(hits), hits)
+                self._store_retraction(doi, results[doi])
+        return results
+
+    def screen_retractions(self, results: list[MatchResult]) -> int:
+        """Fill retraction status on matched results in a few batched calls.
+
+        Used at the end of a run when ``defer_retractions`` skipped the
+        per-reference check. Returns the number of retracted results.
+        """
+        dois = [result.doi for result in results if result.doi and not result.is_website]
+        if not dois:
+            return 0
+        screened = self.check_retractions(dois)
+        retracted = 0
+        for result in results:
+            if not result.doi or result.is_website:
+                continue
+            status = screened.get(result.doi.lower()) or self.is_retracted(result.doi)
+            result.retracted, result.retraction_details = status
+            retracted += int(status[0])
+        return retracted
+
     def _doi_metadata_to_work(self, doi_meta) -> dict:
         work = {
             "DOI": doi_meta.doi,
@@ -284,9 +601,15 @@ class CrossrefClient:
         return work
 
     def _resolve_doi_work(self, doi: str) -> tuple[dict | None, str]:
-        with self._lock:
-            if doi in self._doi_cache:
-                return self._doi_cache[doi]
+        key = doi.lower()
+        memo = self._doi_cache.get(key)
+        if memo is not None:
+            return memo
+        stored = self.cache.get("work", key)
+        if stored is not None:
+            result = (stored[0], stored[1])
+            self._doi_cache[key] = result
+            return result
 
         ra = self._resolver.detect_ra(doi)
         if ra == "Crossref":
@@ -308,8 +631,12 @@ class CrossrefClient:
                 doi_meta = self._resolver.resolve_via_content_negotiation(doi)
                 result = ((self._doi_metadata_to_work(doi_meta) if doi_meta else None), "doi-content-negotiation")
 
-        with self._lock:
-            self._doi_cache[doi] = result
+        # A miss after the budget ran out says nothing about the DOI; do not
+        # let it stick in a memo that later requests may share.
+        if result[0] is not None or not self.budget.expired:
+            self._doi_cache[key] = result
+        if result[0] is not None:
+            self.cache.set("work", key, list(result))
         return result
 
     def _work_to_record(
@@ -437,8 +764,16 @@ class CrossrefClient:
         verification_status: Literal["complete", "partial"] = "complete",
         unchecked_sources: list[str] | None = None,
         source_errors: dict[str, str] | None = None,
+        early_exit: dict | None = None,
     ) -> MatchResult:
-        retracted, details = self.is_retracted(candidate.record.doi)
+        if not candidate.record.doi and self.retraction_index is not None and candidate.method.startswith("pubmed"):
+            details = self.retraction_index.lookup(pmid=candidate.record.source_id)
+            retracted = bool(details)
+        elif self.defer_retractions:
+            # Filled in later by screen_retractions().
+            retracted, details = False, []
+        else:
+            retracted, details = self.is_retracted(candidate.record.doi)
         candidates_payload = [self._candidate_payload(item) for item in (extra_candidates or [])] or None
         suggestions = None
         if candidates_payload:
@@ -471,6 +806,7 @@ class CrossrefClient:
             verification_status=verification_status,
             unchecked_sources=unchecked_sources or None,
             source_errors=source_errors or None,
+            early_exit=early_exit,
         )
 
     def _sort_candidates(self, candidates: list[CandidateMatch]) -> list[CandidateMatch]:
@@ -527,6 +863,11 @@ class CrossrefClient:
         ]
 
     def _collect_pubmed_candidates(self, input_text: str, title_guess: str | None) -> list[tuple[ReferenceRecord, str]]:
+        pmid = self._citmatch_cache.get(input_text)
+        if pmid:
+            hits = self._pubmed.fetch_pmids([pmid])
+            if hits:
+                return [(self._pubmed_to_record(hits[0]), "pubmed-citmatch")]
         seen: set[tuple[str | None, str | None]] = set()
         collected: list[tuple[ReferenceRecord, str]] = []
         for hit in self._pubmed.search_full_citation(input_text):
@@ -677,32 +1018,95 @@ class CrossrefClient:
         except Exception as exc:
             return SourceCollectionResult(source="jalc", candidates=[], error=self._source_exception(exc))
 
+    def _early_exit_hit(
+        self,
+        input_record: ReferenceRecord,
+        outcome: SourceCollectionResult,
+        scores: dict[int, CandidateScore],
+    ) -> dict | None:
+        """Return an audit record if ``outcome`` holds an unambiguous accept.
+
+        Every score computed here is kept in ``scores`` (by record id) so
+        :meth:`_evaluate_candidates` does not score the candidate again.
+        """
+        if self.early_exit_score is None:
+            return None
+        for record, method in outcome.candidates:
+            score = score_candidate(input_record, record, mode="verification", strict=self.strict)
+            scores[id(record)] = score
+            signals = score.signals
+            if (
+                score.decision == "accept"
+                and score.total >= self.early_exit_score
+                and signals["title_similarity"] >= EARLY_EXIT_TITLE
+                and signals["first_author_match"] == 1.0
+                and (input_record.year is None or signals["year_similarity"] == 1.0)
+            ):
+                return {
+                    "source": outcome.source,
+                    "method": method,
+                    "doi": record.doi,
+                    "score": score.total,
+                    "threshold": self.early_exit_score,
+                }
+        return None
+
     def _collect_candidates_parallel(
         self,
         input_text: str,
         title_guess: str | None,
         input_arxiv_id: str | None,
         input_authors: list[str],
-    ) -> tuple[list[tuple[ReferenceRecord, str]], str | None, str | None, str | None, list[str], dict[str, str]]:
+        input_record: ReferenceRecord | None = None,
+    ) -> tuple[
+        list[tuple[ReferenceRecord, str]],
+        str | None,
+        str | None,
+        str | None,
+        list[str],
+        dict[str, str],
+        dict | None,
+        dict[int, CandidateScore],
+    ]:
+        executor = self._source_executor()
+        # Sources run on a copy whose budget also runs out on early exit, so
+        # lookups already in flight stop at their next request instead of
+        # holding pool slots and rate-limit tokens other references need.
+        cancel = Event()
+        sources = self._with_budget(CancellableBudget(self.budget, cancel))
         tasks = [
-            lambda: self._collect_crossref_source(input_text),
-            lambda: self._collect_pubmed_source(input_text, title_guess),
+            ("crossref", lambda: sources._collect_crossref_source(input_text)),
+            ("pubmed", lambda: sources._collect_pubmed_source(input_text, title_guess)),
         ]
         if input_arxiv_id or title_guess:
-            tasks.append(lambda: self._collect_arxiv_source(input_arxiv_id, title_guess, input_authors))
+            tasks.append(("arxiv", lambda: sources._collect_arxiv_source(input_arxiv_id, title_guess, input_authors)))
         if title_guess and contains_japanese_text(title_guess):
-            tasks.append(lambda: self._collect_jalc_source(title_guess))
-
-        outcomes: list[SourceCollectionResult] = []
-        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
-            futures = [executor.submit(task) for task in tasks]
-            for future in futures:
-                outcomes.append(future.result())
+            tasks.append(("jalc", lambda: sources._collect_jalc_source(title_guess)))
+
+        # Score each source as it finishes; an unambiguous accept means the
+        # remaining sources cannot change the verdict, so stop waiting.
+        finished: dict[str, SourceCollectionResult] = {}
+        early_exit: dict | None = None
+        scores: dict[int, CandidateScore] = {}
+        futures = {executor.submit(task): source for source, task in tasks}
+        for future in as_completed(futures):
+            outcome = future.result()
+            finished[futures[future]] = outcome
+            if input_record is None or len(finished) == len(tasks):
+                continue
+            early_exit = self._early_exit_hit(input_record, outcome, scores)
+            if early_exit:
+                early_exit["skipped_sources"] = [source for source, _ in tasks if source not in finished]
+                cancel.set()
+                for pending in futures:
+                    pending.cancel()
+                break
+        outcomes = [finished[source] for source, _ in tasks if source in finished]
 
         raw_candidates: list[tuple[ReferenceRecord, str]] = []
         unchecked_sources: list[str] = []
         source_errors: dict[str, str] = {}
-        arxiv_id = None
+        arxiv_id = input_arxiv_id if "arxiv" not in finished else None
         arxiv_doi = None
         journal_ref = None
 
@@ -719,14 +1123,20 @@ class CrossrefClient:
                 arxiv_doi = outcome.arxiv_doi
                 journal_ref = outcome.journal_ref
 
-        return raw_candidates, arxiv_id, arxiv_doi, journal_ref, unchecked_sources, source_errors
+        return raw_candidates, arxiv_id, arxiv_doi, journal_ref, unchecked_sources, source_errors, early_exit, scores
 
     def _evaluate_candidates(
         self,
         input_record: ReferenceRecord,
         raw_candidates: list[tuple[ReferenceRecord, str]],
-        mode: Literal["verification", "correction"] = "verification",
-    ) -> list[CandidateMatch]:
+        scores: dict[int, CandidateScore] | None = None,
+    ) -> CandidateEvaluation:
+        """Score candidates once and rank them for both decision modes.
+
+        ``scores`` holds verification scores already computed for some of
+        the records (by record id), e.g. during the early-exit check.
+        """
+        scores = scores or {}
         deduped: list[tuple[ReferenceRecord, str]] = []
         seen: set[tuple[str | None, str | None, str | None]] = set()
         for record, method in raw_candidates:
@@ -740,7 +1150,8 @@ class CrossrefClient:
             CandidateMatch(
                 record=record,
                 method=method,
-                score=score_candidate(input_record, record, mode=mode, strict=self.strict),
+                score=scores.get(id(record))
+                or score_candidate(input_record, record, mode="verification", strict=self.strict),
             )
             for record, method in deduped
         ]
@@ -752,18 +1163,23 @@ class CrossrefClient:
                     candidate = CandidateMatch(
                         record=record,
                         method=candidate.method,
-                        score=score_candidate(input_record, record, mode=mode, strict=self.strict),
+                        score=score_candidate(input_record, record, mode="verification", strict=self.strict),
                     )
                 alias_enriched.append(candidate)
             evaluated = alias_enriched
-        if mode == "verification":
-            verified_enriched: list[CandidateMatch] = []
-            for candidate in evaluated:
-                if candidate.score.decision == "accept":
-                    candidate = self._enrich_pubmed_candidate(input_record, candidate, mode)
-                verified_enriched.append(candidate)
-            evaluated = verified_enriched
-        return self._sort_candidates(evaluated)
+        verified_enriched: list[CandidateMatch] = []
+        for candidate in evaluated:
+            if candidate.score.decision == "accept":
+                candidate = self._enrich_pubmed_candidate(input_record, candidate, "verification")
+            verified_enriched.append(candidate)
+        correction = [
+            replace(candidate, score=candidate.score.for_mode("correction"))
+            for candidate in evaluated
+        ]
+        return CandidateEvaluation(
+            verified=self._sort_candidates(verified_enriched),
+            correction=self._sort_candidates(correction),
+        )
 
     def check_one(self, input_text: str) -> MatchResult:
         input_record = parse_reference_metadata(input_text)
@@ -804,6 +1220,9 @@ class CrossrefClient:
                         f"DOI解決失敗: {input_doi}",
                         f"doi.orgで確認: https://doi.org/{input_doi}",
                     ],
+                    # A miss after the budget ran out is not a verdict on the DOI.
+                    verification_status="partial" if self.budget.expired else "complete",
+                    unchecked_sources=["doi"] if self.budget.expired else None,
                 )
 
             record = self._work_to_record(work, source="doi", source_id=input_doi, resolve_aliases=False)
@@ -823,14 +1242,24 @@ class CrossrefClient:
                 note = score.note or note or "candidate_mismatch"
             return self._result_from_candidate(input_text, input_record, candidate, status, note)
 
-        raw_candidates, arxiv_id, arxiv_doi, journal_ref, unchecked_sources, source_errors = self._collect_candidates_parallel(
+        (
+            raw_candidates,
+            arxiv_id,
+            arxiv_doi,
+            journal_ref,
+            unchecked_sources,
+            source_errors,
+            early_exit,
+            scores,
+        ) = self._collect_candidates_parallel(
             input_text,
             title_guess,
             input_arxiv_id,
             input_record.authors,
+            input_record=input_record,
         )
-        verified = self._evaluate_candidates(input_record, raw_candidates, mode="verification")
-        accepted = [candidate for candidate in verified if candidate.score.decision == "accept"]
+        evaluation = self._evaluate_candidates(input_record, raw_candidates, scores)
+        accepted = [candidate for candidate in evaluation.verified if candidate.score.decision == "accept"]
         if accepted:
             chosen = accepted[0]
             note = None
@@ -845,13 +1274,16 @@ class CrossrefClient:
                 arxiv_id=arxiv_id,
                 arxiv_doi=arxiv_doi,
                 journal_ref=journal_ref,
+                early_exit=early_exit,
             )
 
+        if early_exit:
+            unchecked_sources = [*unchecked_sources, *early_exit["skipped_sources"]]
         verification_status: Literal["complete", "partial"] = (
             "partial" if unchecked_sources or source_errors else "complete"
         )
 
-        correction = self._evaluate_candidates(input_record, raw_candidates, mode="correction")
+        correction = evaluation.correction
         suggestions = [candidate for candidate in correction if candidate.score.decision == "suggest"]
         if suggestions:
             chosen = suggestions[0]
@@ -14,12 +14,14 @@ The fallback chain is:
 """
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass
 
 import requests
 from .budget import NO_BUDGET, TimeBudget
+from .cache import NO_CACHE, CacheStore
 from .etiquette import build_user_agent
+from .ratelimit import HostRateLimiter
+from .transport import Transport
 
 DOIRA_API = "https://doi.org/doiRA"
 DATACITE_API = "https://api.datacite.org/dois"
@@ -51,11 +53,21 @@ class DOIResolver:
     3. Fall back to doi.org content negotiation (universal)
     """
     
-    def __init__(self, pause_sec: float = 0.2, email: str | None = None, budget: TimeBudget | None = None):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        pause_sec: float = 0.2,
+        email: str | None = None,
+        budget: TimeBudget | None = None,
+        limiter: HostRateLimiter | None = None,
+        cache: CacheStore | None = None,
+        transport: Transport | None = None,
+    ):
+        self.session = (transport or Transport()).session()
         self.session.headers.update({"User-Agent": build_user_agent(email)})
         self.pause_sec = pause_sec
         self.budget = budget or NO_BUDGET
+        self.limiter = limiter or HostRateLimiter.from_pause(pause_sec)
+        self.cache = cache or NO_CACHE
 
     def _get_json(self, url: str, params: dict | None = None, headers: dict | None = None) -> dict | None:
         if self.budget.expired:
@@ -64,9 +76,10 @@ class DOIResolver:
             req_headers = {**self.session.headers}
             if headers:
                 req_headers.update(headers)
+            if not self.limiter.acquire(url, self.budget.usable):
+                return None
             r = self.session.get(url, params=params, headers=req_headers, timeout=self.budget.http_timeout(10.0))
             r.raise_for_status()
-            time.sleep(self.pause_sec)
             return r.json()
         except requests.RequestException:
             return None
@@ -77,16 +90,22 @@ class DOIResolver:
 
         Returns the RA name (e.g., 'Crossref', 'DataCite', 'JaLC') or None if detection fails.
         """
+        stored = self.cache.get("doi_ra", doi.lower())
+        if stored is not None:
+            return stored
         if self.budget.expired:
             return None
         url = f"{DOIRA_API}/{doi}"
         try:
+            if not self.limiter.acquire(url, self.budget.usable):
+                return None
             r = self.session.get(url, timeout=self.budget.http_timeout(10.0))
             r.raise_for_status()
-            time.sleep(self.pause_sec)
             data = r.json()
             if isinstance(data, list) and len(data) > 0:
-                return data[0].get("RA")
+                ra = data[0].get("RA")
+                self.cache.set("doi_ra", doi.lower(), ra)
+                return ra
             return None
         except requests.RequestException:
             return None
@@ -103,9 +122,10 @@ class DOIResolver:
         if self.budget.expired:
             return None
         try:
+            if not self.limiter.acquire(url, self.budget.usable):
+                return None
             r = self.session.get(url, headers=headers, timeout=self.budget.http_timeout(10.0), allow_redirects=True)
             r.raise_for_status()
-            time.sleep(self.pause_sec)
             data = r.json()
             
             return self._parse_csl_json(data, doi, method="content-negotiation")
@@ -0,0 +1,80 @@
+"""Long-lived worker pool for source lookups, with queue and utilisation stats."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any
+
+DEFAULT_SOURCE_WORKERS = 8
+
+
+class InstrumentedExecutor:
+    """Wrap a :class:`ThreadPoolExecutor` and count what passes through it.
+
+    One instance is shared by every reference checked by a client, so its
+    size caps the number of source lookups in flight across a whole batch.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_SOURCE_WORKERS, thread_name_prefix: str = "refaudit-source"):
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=thread_name_prefix)
+        self._lock = Lock()
+        self._created = time.monotonic()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._cancelled = 0
+        self._peak_queued = 0
+        self._peak_running = 0
+        self._busy_sec = 0.0
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+        def run() -> Any:
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._peak_running = max(self._peak_running, self._running)
+            started = time.monotonic()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.monotonic() - started
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._busy_sec += elapsed
+
+        future = self._executor.submit(run)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+                self._cancelled += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            wall = max(time.monotonic() - self._created, 1e-9)
+            return {
+                "workers": self.max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "cancelled": self._cancelled,
+                "peak_queued": self._peak_queued,
+                "peak_running": self._peak_running,
+                "busy_sec": round(self._busy_sec, 3),
+                "utilisation": round(self._busy_sec / (self.max_workers * wall), 3),
+            }
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import re
-import time
 
 import requests
 
 from .budget import NO_BUDGET, TimeBudget
 from .etiquette import build_user_agent
 from .parser import contains_japanese_text
+from .ratelimit import HostRateLimiter
+from .transport import Transport
 
 API = "https://api.japanlinkcenter.org/search"
 
@@ -18,19 +19,28 @@ def _normalize_title_query(title: str) -> str:
 
 
 class JALCClient:
-    def __init__(self, pause_sec: float = 0.2, email: str | None = None, budget: TimeBudget | None = None):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        pause_sec: float = 0.2,
+        email: str | None = None,
+        budget: TimeBudget | None = None,
+        limiter: HostRateLimiter | None = None,
+        transport: Transport | None = None,
+    ):
+        self.session = (transport or Transport()).session()
         self.session.headers.update({"User-Agent": build_user_agent(email)})
         self.pause_sec = pause_sec
         self.budget = budget or NO_BUDGET
+        self.limiter = limiter or HostRateLimiter.from_pause(pause_sec)
 
     def _get(self, params: dict[str, str | int]) -> dict | None:
         if self.budget.expired:
             return None
         try:
+            if not self.limiter.acquire(API, self.budget.usable):
+                return None
             response = self.session.get(API, params=params, timeout=self.budget.http_timeout(10.0))
             response.raise_for_status()
-            time.sleep(self.pause_sec)
             return response.json()
         except requests.RequestException:
             return None
@@ -0,0 +1,71 @@
+"""Append-only checkpoint journal for resumable batch runs.
+
+Each finished check is appended as one JSON line keyed by a hash of the
+reference text, so a rerun with ``--resume`` can skip references that were
+already verified and redo only partial or failed ones.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from dataclasses import asdict
+from pathlib import Path
+from threading import Lock
+
+from .crossref import MatchResult
+from .jsonl import result_from_dict
+
+
+def reference_key(line: str) -> str:
+    """Content hash of a reference line, insensitive to whitespace changes."""
+    normalized = re.sub(r"\s+", " ", line).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def is_final(result: MatchResult) -> bool:
+    """Whether a result can be reused instead of re-checking the reference."""
+    return result.verification_status != "partial" and not result.source_errors
+
+
+def load_results(path: str | Path) -> dict[str, MatchResult]:
+    """Results from a journal or ``--format jsonl`` output, by reference key.
+
+    Later lines win; a half-written final line (from a crash) is skipped.
+    """
+    entries: dict[str, MatchResult] = {}
+    with Path(path).open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            key = data.get("key") or reference_key(data.get("input_text") or "")
+            entries[key] = result_from_dict(data)
+    return entries
+
+
+class Journal:
+    def __init__(self, path: str | Path, resume: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._entries = load_results(self.path) if resume and self.path.exists() else {}
+        self._handle = self.path.open("a" if resume else "w", encoding="utf-8")
+
+    def completed(self) -> dict[str, MatchResult]:
+        """Reusable results from earlier runs, by reference key."""
+        return {key: result for key, result in self._entries.items() if is_final(result)}
+
+    def record(self, line: str, result: MatchResult) -> None:
+        key = reference_key(line)
+        payload = json.dumps({"key": key, **asdict(result)}, ensure_ascii=False)
+        with self._lock:
+            self._entries[key] = result
+            self._handle.write(payload + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._handle.close()
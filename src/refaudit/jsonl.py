@@ -0,0 +1,46 @@
+"""JSON Lines output: one ``MatchResult`` per line, flushed as each check finishes."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import TextIO
+
+from .crossref import MatchResult
+
+_RESULT_FIELDS = {item.name for item in fields(MatchResult)}
+
+
+def result_to_dict(index: int, result: MatchResult) -> dict:
+    return {"index": index, **asdict(result)}
+
+
+def result_from_dict(data: dict) -> MatchResult:
+    return MatchResult(**{key: value for key, value in data.items() if key in _RESULT_FIELDS})
+
+
+class JsonlWriter:
+    """Write results to ``stream`` and flush after every line."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, index: int, result: MatchResult) -> None:
+        self.stream.write(json.dumps(result_to_dict(index, result), ensure_ascii=False) + "\n")
+        self.stream.flush()
+        self.count += 1
+
+
+def read_results(path: str | Path) -> list[tuple[int, MatchResult]]:
+    """Read ``(index, result)`` pairs, skipping a truncated final line."""
+    pairs: list[tuple[int, MatchResult]] = []
+    with Path(path).open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            pairs.append((data.get("index", len(pairs)), result_from_dict(data)))
+    return pairs
@@ -2,27 +2,181 @@ import argparse
 import os
 import pathlib
 import sys
+from dataclasses import replace
 
 from . import __version__
+from .ratelimit import parse_rate_overrides
 
 
-def run(text: str, out_path: pathlib.Path | None, show_all: bool = False, debug: bool = False) -> int:
-    from .crossref import CrossrefClient
+def run(
+    text: str,
+    out_path: pathlib.Path | None,
+    show_all: bool = False,
+    debug: bool = False,
+    jobs: int = 1,
+    rates: dict[str, float] | None = None,
+    cache_path: pathlib.Path | None = None,
+    early_exit: bool = True,
+    source_workers: int | None = None,
+    retraction_index_path: pathlib.Path | None = None,
+    offline_retractions: bool = False,
+    output_format: str = "markdown",
+    report_path: pathlib.Path | None = None,
+    ordered: bool = True,
+    journal_path: pathlib.Path | None = None,
+    resume: bool = False,
+    previous_path: pathlib.Path | None = None,
+    speculative_pubmed: bool = False,
+    arxiv_index_path: pathlib.Path | None = None,
+) -> int:
+    from .arxiv_index import ArxivIndex
+    from .batch import check_batch
+    from .cache import SQLiteCache
+    from .crossref import EARLY_EXIT_SCORE, CrossrefClient, MatchResult
+    from .executor import DEFAULT_SOURCE_WORKERS
+    from .journal import Journal, is_final, load_results, reference_key
+    from .jsonl import JsonlWriter, result_from_dict, result_to_dict
     from .parser import split_references
-    from .report import make_markdown_bad_only, make_markdown_full
+    from .report import make_markdown_bad_only, make_markdown_diff, make_markdown_full
+    from .retraction_index import RetractionIndex
+    from .transport import Transport
 
-    client = CrossrefClient(debug=debug, email=os.getenv("CONTACT_EMAIL"))
+    cache = SQLiteCache(cache_path) if cache_path is not None else None
+    # Lookups never create an index; only the ingest commands do.
+    retraction_index = (
+        RetractionIndex(retraction_index_path, readonly=True) if retraction_index_path is not None else None
+    )
+    arxiv_index = ArxivIndex(arxiv_index_path, readonly=True) if arxiv_index_path is not None else None
+    workers = source_workers or max(DEFAULT_SOURCE_WORKERS, jobs * 2)
+    client = CrossrefClient(
+        debug=debug,
+        email=os.getenv("CONTACT_EMAIL"),
+        rates=rates,
+        cache=cache,
+        early_exit_score=EARLY_EXIT_SCORE if early_exit else None,
+        source_workers=workers,
+        # Streamed and journaled lines are final, so check retractions inline there.
+        defer_retractions=output_format != "jsonl" and journal_path is None,
+        retraction_index=retraction_index,
+        offline_retractions=offline_retractions,
+        speculative_pubmed=speculative_pubmed,
+        pubmed_batching=jobs > 1,
+        arxiv_index=arxiv_index,
+        # Every thread that sends: source workers (which also run the
+        # speculative PubMed variants), batch threads and the main thread.
+        transport=Transport(pool_size=workers + jobs + 1),
+    )
     refs = split_references(text)
-    results = [client.check_one(line) for line in refs]
+    # Load before opening the output or journal, either of which may be the same file.
+    previous = load_results(previous_path) if previous_path is not None else {}
+    stream = None
+    writer = None
+    if output_format == "jsonl":
+        if out_path is not None:
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            stream = out_path.open("w", encoding="utf-8")
+            if report_path is None:
+                report_path = out_path.with_suffix(".md")
+                if report_path == out_path:
+                    report_path = out_path.with_suffix(".report.md")
+        writer = JsonlWriter(stream or sys.stdout)
+    journal = Journal(journal_path, resume=resume) if journal_path is not None else None
+    completed = {key: result for key, result in previous.items() if is_final(result)}
+    if journal is not None:
+        completed.update(journal.completed())
+    results: list = [
+        replace(completed[key]) if (key := reference_key(line)) in completed else None
+        for line in refs
+    ]
+    pending = [index for index, result in enumerate(results) if result is None]
+    screen = getattr(client, "screen_retractions", None)
+    if previous and screen is not None:
+        # Verdicts are reused, but retraction status can change between runs.
+        screen([result for result in results if result is not None])
+    # What was actually written, so the report cannot disagree with the stream.
+    streamed: dict[int, MatchResult] = {}
+
+    def emit(index: int, result) -> None:
+        writer.write(index, result)
+        streamed[index] = result_from_dict(result_to_dict(index, result))
+
+    if writer is not None:
+        for index, result in enumerate(results):
+            if result is not None:
+                emit(index, result)
+
+    def on_complete(position: int, result) -> None:
+        index = pending[position]
+        journal.record(refs[index], result)
+
+    def on_result(position: int, result) -> None:
+        emit(pending[position], result)
+
+    try:
+        checked, stats = check_batch(
+            client,
+            [refs[index] for index in pending],
+            jobs=jobs,
+            on_result=on_result if writer is not None else None,
+            ordered=ordered,
+            # Checkpoint as soon as a check finishes, not when its turn in the output comes.
+            on_complete=on_complete if journal is not None else None,
+        )
+    finally:
+        if stream is not None:
+            stream.close()
+        if journal is not None:
+            journal.close()
+        close = getattr(client, "close", None)
+        if close is not None:
+            close()
+        if cache is not None:
+            cache.close()
+        if retraction_index is not None:
+            retraction_index.close()
+        if arxiv_index is not None:
+            arxiv_index.close()
+    for index, result in zip(pending, checked):
+        results[index] = result
+    stats.reused = len(refs) - len(pending)
+    if writer is not None:
+        results = [streamed[index] for index in range(len(refs))]
     md = make_markdown_full(results) if show_all else make_markdown_bad_only(results)
-    if out_path is not None:
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(md, encoding="utf-8")
-    else:
+    if previous_path is not None:
+        md += "\n\n" + make_markdown_diff(previous.values(), results)
+    md_path = report_path if output_format == "jsonl" else out_path
+    if md_path is not None:
+        md_path.parent.mkdir(parents=True, exist_ok=True)
+        md_path.write_text(md, encoding="utf-8")
+    elif output_format != "jsonl":
         sys.stdout.write(md)
+    print(stats.summary(), file=sys.stderr)
     return 0
 
 
+def _check_indexes(
+    retraction_index_path: pathlib.Path | None,
+    arxiv_index_path: pathlib.Path | None,
+    offline_retractions: bool,
+) -> None:
+    """Fail before any lookup if an index is missing, not an index, or unusably empty."""
+    from .arxiv_index import ArxivIndex
+    from .retraction_index import RetractionIndex
+
+    if retraction_index_path is not None:
+        index = RetractionIndex(retraction_index_path, readonly=True)
+        try:
+            if offline_retractions and not index.populated:
+                raise ValueError(
+                    f"--offline-retractions: {retraction_index_path} has no ingested notices; "
+                    "build it with citeguard-retractions"
+                )
+        finally:
+            index.close()
+    if arxiv_index_path is not None:
+        ArxivIndex(arxiv_index_path, readonly=True).close()
+
+
 def main() -> None:
     p = argparse.ArgumentParser(
         prog="citeguard",
@@ -38,8 +192,73 @@ def main() -> None:
     )
 
     p.add_argument("--out", help="Path to Markdown report. If omitted, print to stdout.", default=None)
+    p.add_argument(
+        "--format", choices=("markdown", "jsonl"), default="markdown",
+        help="jsonl streams one JSON result per line to --out (or stdout) as each check finishes.",
+    )
+    p.add_argument(
+        "--report", type=pathlib.Path, default=None, metavar="PATH",
+        help="Markdown report path for --format jsonl (default: --out with a .md suffix; "
+             "required when streaming to stdout).",
+    )
+    p.add_argument(
+        "--unordered", action="store_true",
+        help="With --format jsonl, write results in completion order instead of input order.",
+    )
     p.add_argument("--all", action="store_true", help="Include all references (not just problems).")
     p.add_argument("--debug", action="store_true", help="Show Crossref candidates for unmatched refs.")
+    p.add_argument(
+        "--jobs", type=int, default=1,
+        help="Number of references to check concurrently (default: 1).",
+    )
+    p.add_argument(
+        "--rate", action="append", default=None, metavar="HOST=RPS",
+        help="Override the request rate for an API host, e.g. api.crossref.org=20. Repeatable.",
+    )
+    p.add_argument(
+        "--cache", type=pathlib.Path, default=None, metavar="PATH",
+        help="SQLite file for caching API metadata across runs. "
+             "Alternatively set CITEGUARD_CACHE env var.",
+    )
+    p.add_argument(
+        "--source-workers", type=int, default=None, metavar="N",
+        help="Size of the shared pool for source lookups (default: max(8, 2 x --jobs)).",
+    )
+    p.add_argument(
+        "--no-early-exit", action="store_true",
+        help="Wait for every source even after an unambiguous match is found.",
+    )
+    p.add_argument(
+        "--speculative-pubmed", action="store_true",
+        help="Run the PubMed query variants for a reference in turn, keeping the next one in flight.",
+    )
+    p.add_argument(
+        "--retraction-index", type=pathlib.Path, default=None, metavar="PATH",
+        help="Offline retraction index built with citeguard-retractions; consulted before Crossref. "
+             "Alternatively set CITEGUARD_RETRACTION_INDEX env var.",
+    )
+    p.add_argument(
+        "--arxiv-index", type=pathlib.Path, default=None, metavar="PATH",
+        help="Offline arXiv index built with citeguard-arxiv-index; consulted before the arXiv API. "
+             "Alternatively set CITEGUARD_ARXIV_INDEX env var.",
+    )
+    p.add_argument(
+        "--offline-retractions", action="store_true",
+        help="Trust the retraction index as complete and skip Crossref retraction queries.",
+    )
+    p.add_argument(
+        "--journal", type=pathlib.Path, default=None, metavar="PATH",
+        help="Append each finished result to this checkpoint journal (JSON Lines).",
+    )
+    p.add_argument(
+        "--resume", action="store_true",
+        help="Reuse finished results from --journal and only check new, partial or failed references.",
+    )
+    p.add_argument(
+        "--previous", type=pathlib.Path, default=None, metavar="PATH",
+        help="Journal or JSONL output of an earlier run: reuse verdicts for unchanged references, "
+             "re-check retractions in batch and add a diff section to the report.",
+    )
     p.add_argument(
         "--email",
         help="Contact email for API etiquette (Crossref/PubMed). "
@@ -62,8 +281,54 @@ def main() -> None:
             sys.exit(2)
         text = sys.stdin.read()
 
+    try:
+        rates = parse_rate_overrides(args.rate)
+    except ValueError as exc:
+        p.error(str(exc))
+
     out = pathlib.Path(args.out) if args.out else None
-    sys.exit(run(text, out, show_all=args.all, debug=args.debug))
+    cache_path = args.cache
+    if cache_path is None and os.getenv("CITEGUARD_CACHE"):
+        cache_path = pathlib.Path(os.environ["CITEGUARD_CACHE"])
+    retraction_index_path = args.retraction_index
+    if retraction_index_path is None and os.getenv("CITEGUARD_RETRACTION_INDEX"):
+        retraction_index_path = pathlib.Path(os.environ["CITEGUARD_RETRACTION_INDEX"])
+    arxiv_index_path = args.arxiv_index
+    if arxiv_index_path is None and os.getenv("CITEGUARD_ARXIV_INDEX"):
+        arxiv_index_path = pathlib.Path(os.environ["CITEGUARD_ARXIV_INDEX"])
+    if args.resume and args.journal is None:
+        p.error("--resume requires --journal")
+    if args.format == "jsonl" and out is None and args.report is None:
+        p.error("--format jsonl without --out streams to stdout; pass --report PATH for the Markdown report")
+    if args.offline_retractions and retraction_index_path is None:
+        p.error("--offline-retractions requires --retraction-index")
+    try:
+        _check_indexes(retraction_index_path, arxiv_index_path, args.offline_retractions)
+    except (OSError, ValueError) as exc:
+        p.error(str(exc))
+    sys.exit(
+        run(
+            text,
+            out,
+            show_all=args.all,
+            debug=args.debug,
+            jobs=args.jobs,
+            rates=rates,
+            cache_path=cache_path,
+            early_exit=not args.no_early_exit,
+            source_workers=args.source_workers,
+            retraction_index_path=retraction_index_path,
+            offline_retractions=args.offline_retractions,
+            output_format=args.format,
+            report_path=args.report,
+            ordered=not args.unordered,
+            journal_path=args.journal,
+            resume=args.resume,
+            previous_path=args.previous,
+            speculative_pubmed=args.speculative_pubmed,
+            arxiv_index_path=arxiv_index_path,
+        )
+    )
 
 
 if __name__ == "__main__":
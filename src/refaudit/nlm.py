@@ -1,31 +1,44 @@
 from __future__ import annotations
 
-import time
 import xml.etree.ElementTree as ET
 
 import requests
 
 from .budget import NO_BUDGET, TimeBudget
+from .cache import DEFAULT_TTLS, NO_CACHE, CacheStore, LRUDict, cache_key
 from .etiquette import build_user_agent, resolve_contact_email
+from .ratelimit import HostRateLimiter
+from .transport import Transport
 
 
 class NLMCatalogClient:
-    def __init__(self, pause_sec: float = 0.2, email: str | None = None, budget: TimeBudget | None = None):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        pause_sec: float = 0.2,
+        email: str | None = None,
+        budget: TimeBudget | None = None,
+        limiter: HostRateLimiter | None = None,
+        cache: CacheStore | None = None,
+        transport: Transport | None = None,
+    ):
+        self.session = (transport or Transport()).session()
         self.email = resolve_contact_email(email)
         self.session.headers.update({"User-Agent": build_user_agent(self.email)})
         self.pause_sec = pause_sec
         self.budget = budget or NO_BUDGET
-        self._alias_cache: dict[tuple[tuple[str, ...], str | None], list[str]] = {}
+        self.limiter = limiter or HostRateLimiter.from_pause(pause_sec)
+        self.cache = cache or NO_CACHE
+        self._alias_cache = LRUDict(ttl=DEFAULT_TTLS["nlm_alias"])
 
     def _get_json(self, url: str, params: dict) -> dict | None:
         if self.budget.expired:
             return None
         params = {**params, "tool": "ref-audit", "email": self.email}
         try:
+            if not self.limiter.acquire(url, self.budget.usable):
+                return None
             response = self.session.get(url, params=params, timeout=self.budget.http_timeout(10.0))
             response.raise_for_status()
-            time.sleep(self.pause_sec)
             return response.json()
         except requests.RequestException:
             return None
@@ -35,18 +48,25 @@ class NLMCatalogClient:
             return None
         params = {**params, "tool": "ref-audit", "email": self.email}
         try:
+            if not self.limiter.acquire(url, self.budget.usable):
+                return None
             response = self.session.get(url, params=params, timeout=self.budget.http_timeout(10.0))
             response.raise_for_status()
-            time.sleep(self.pause_sec)
             return response.text
         except requests.RequestException:
             return None
 
     def journal_aliases(self, title: str | None = None, issns: list[str] | None = None) -> list[str]:
         normalized_issns = tuple(sorted({(issn or "").strip() for issn in (issns or []) if (issn or "").strip()}))
-        cache_key = (normalized_issns, (title or "").strip().lower() or None)
-        if cache_key in self._alias_cache:
-            return self._alias_cache[cache_key]
+        memo_key = (normalized_issns, (title or "").strip().lower() or None)
+        memo = self._alias_cache.get(memo_key)
+        if memo is not None:
+            return memo
+        store_key = cache_key(list(normalized_issns), memo_key[1])
+        stored = self.cache.get("nlm_alias", store_key)
+        if stored is not None:
+            self._alias_cache[memo_key] = stored
+            return stored
 
         terms = [f"{issn}[issn]" for issn in normalized_issns]
         if not terms and title:
@@ -68,7 +88,10 @@ class NLMCatalogClient:
             if cleaned and cleaned not in seen:
                 seen.add(cleaned)
         result = list(seen)
-        self._alias_cache[cache_key] = result
+        if result or not self.budget.expired:
+            self._alias_cache[memo_key] = result
+        if result:
+            self.cache.set("nlm_alias", store_key, result)
         return result
 
     def _search(self, term: str) -> list[str]:
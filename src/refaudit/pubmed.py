@@ -1,13 +1,33 @@
 from __future__ import annotations
 
+import math
 import time
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from dataclasses import asdict, dataclass, field, replace
+from threading import Event, Lock
 import re
 
 import requests
 from .budget import NO_BUDGET, TimeBudget
+from .cache import NO_CACHE, CacheStore, cache_key
 from .etiquette import build_user_agent, resolve_contact_email
+from .ratelimit import HostRateLimiter
+from .transport import Transport
+
+ESEARCH = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+ESUMMARY = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+EFETCH = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+ECITMATCH = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/ecitmatch.cgi"
+# Citations per ECitMatch request; they travel in the query string.
+CITMATCH_BATCH_SIZE = 50
+# NCBI asks for POST above ~200 IDs; stay below that per request.
+EUTILS_MAX_IDS = 200
+# How long the first caller waits for other checks to add PMIDs to a batch.
+BATCH_WINDOW_SEC = 0.05
+# Unbatched searches look up missing DOIs for their first few hits only.
+EFETCH_DOI_LIMIT = 3
 
 
 def _norm(s: str) -> str:
@@ -28,23 +48,117 @@ class PubMedMatch:
     pages: str | None = None
 
 
+@dataclass
+class _BatchRequest:
+    pmids: list[str]
+    budget: TimeBudget
+    summaries: Callable[[list[str]], dict[str, PubMedMatch]]
+    dois: Callable[[list[str]], dict[str, str]]
+    future: Future = field(default_factory=Future)
+
+
+class PubMedBatcher:
+    """Coalesce PMID lookups from concurrent checks into shared E-utilities calls.
+
+    The first caller in a tick waits ``window`` seconds (or less, if its
+    budget is shorter), then sends one esummary for every PMID queued
+    meanwhile and one efetch for the DOI-less ones. Each caller picks its
+    own first :data:`EFETCH_DOI_LIMIT` DOI-less hits, as it would unbatched,
+    and gets copies with only those DOIs filled in. The pooled calls use
+    the fetchers of whichever caller has the most budget left, and each
+    caller stops waiting when its own budget runs out. There is no
+    background thread.
+    """
+
+    def __init__(self, window: float = BATCH_WINDOW_SEC):
+        self.window = window
+        self._lock = Lock()
+        self._requests: list[_BatchRequest] = []
+        self._leading = False
+
+    def get(
+        self,
+        pmids: list[str],
+        summaries: Callable[[list[str]], dict[str, PubMedMatch]],
+        dois: Callable[[list[str]], dict[str, str]],
+        budget: TimeBudget = NO_BUDGET,
+    ) -> dict[str, PubMedMatch]:
+        request = _BatchRequest(list(pmids), budget, summaries, dois)
+        with self._lock:
+            self._requests.append(request)
+            lead = not self._leading
+            self._leading = True
+        if lead:
+            time.sleep(min(self.window, budget.usable))
+            self._flush()
+        usable = budget.usable
+        try:
+            return request.future.result(timeout=usable if math.isfinite(usable) else None)
+        except TimeoutError:
+            return {}
+
+    def _flush(self) -> None:
+        with self._lock:
+            requests, self._requests = self._requests, []
+            self._leading = False
+        lead = max(requests, key=lambda request: request.budget.remaining)
+        found: dict[str, PubMedMatch] = {}
+        picks: list[list[str]] = [[] for _ in requests]
+        dois: dict[str, str] = {}
+        try:
+            found = lead.summaries(list(dict.fromkeys(pmid for request in requests for pmid in request.pmids)))
+            for position, request in enumerate(requests):
+                missing = [pmid for pmid in request.pmids if pmid in found and not found[pmid].doi]
+                picks[position] = missing[:EFETCH_DOI_LIMIT]
+            wanted = list(dict.fromkeys(pmid for pick in picks for pmid in pick))
+            if wanted:
+                dois = lead.dois(wanted)
+        finally:
+            for request, pick in zip(requests, picks):
+                results: dict[str, PubMedMatch] = {}
+                for pmid in request.pmids:
+                    if pmid in found:
+                        results[pmid] = match = replace(found[pmid])
+                        if pmid in pick:
+                            match.doi = dois.get(pmid)
+                request.future.set_result(results)
+
+
 class PubMedClient:
-    def __init__(self, pause_sec: float = 0.2, email: str | None = None, budget: TimeBudget | None = None):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        pause_sec: float = 0.2,
+        email: str | None = None,
+        budget: TimeBudget | None = None,
+        limiter: HostRateLimiter | None = None,
+        cache: CacheStore | None = None,
+        transport: Transport | None = None,
+        speculative: bool = False,
+        batcher: PubMedBatcher | None = None,
+        pool: Callable[[], Executor] | None = None,
+    ):
+        self.session = (transport or Transport()).session()
         self.email = resolve_contact_email(email)
         self.session.headers.update({"User-Agent": build_user_agent(self.email)})
         self.pause_sec = pause_sec
         self.budget = budget or NO_BUDGET
+        self.limiter = limiter or HostRateLimiter.from_pause(pause_sec)
+        self.cache = cache or NO_CACHE
+        # Keep the next search_full_citation variant in flight on ``pool``.
+        self.speculative = speculative
+        self.pool = pool
+        self.batcher = batcher
 
-    def _get_json(self, url: str, params: dict) -> dict | None:
-        if self.budget.expired:
+    def _get_json(self, url: str, params: dict, cancel: Event | None = None) -> dict | None:
+        if self.budget.expired or (cancel is not None and cancel.is_set()):
             return None
         # E-utilities etiquette
         params = {**params, "tool": "ref-audit", "email": self.email}
         try:
+            if not self.limiter.acquire(url, self.budget.usable):
+                return None
             r = self.session.get(url, params=params, timeout=self.budget.http_timeout(10.0))
             r.raise_for_status()
-            time.sleep(self.pause_sec)
             return r.json()
         except requests.RequestException:
             return None
@@ -54,45 +168,122 @@ class PubMedClient:
             return None
         params = {**params, "tool": "ref-audit", "email": self.email}
         try:
+            if not self.limiter.acquire(url, self.budget.usable):
+                return None
             r = self.session.get(url, params=params, timeout=self.budget.http_timeout(10.0))
             r.raise_for_status()
-            time.sleep(self.pause_sec)
             return r.text
         except requests.RequestException:
             return None
 
+    def match_citations(
+        self,
+        citations: dict[str, tuple[str, str, str, str, str]],
+        chunk_size: int = CITMATCH_BATCH_SIZE,
+    ) -> dict[str, str]:
+        """Resolve citations to PMIDs in bulk with ECitMatch.
+
+        ``citations`` maps a caller key to ``(journal, year, volume,
+        first_page, first_author)``. Returns ``{key: pmid}`` for citations
+        NCBI matches to exactly one article.
+        """
+        found: dict[str, str] = {}
+        pending: list[tuple[str, tuple[str, ...]]] = []
+        for key, fields in citations.items():
+            # "|" and line breaks delimit ECitMatch records.
+            fields = tuple(re.sub(r"[|\r\n]+", " ", value or "").strip() for value in fields)
+            stored = self.cache.get("pubmed_citmatch", cache_key(*fields))
+            if stored is not None:
+                found[key] = stored
+            else:
+                pending.append((key, fields))
+
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            bdata = "\r".join("|".join((*fields, str(index))) + "|" for index, (_, fields) in enumerate(chunk))
+            text = self._get_text(ECITMATCH, {"db": "pubmed", "retmode": "xml", "bdata": bdata})
+            if not text:
+                continue
+            for line in text.splitlines():
+                parts = line.strip().split("|")
+                if len(parts) < 7 or not parts[5].isdigit() or not parts[6].strip().isdigit():
+                    continue
+                index = int(parts[5])
+                if index >= len(chunk):
+                    continue
+                key, fields = chunk[index]
+                found[key] = parts[6].strip()
+                self.cache.set("pubmed_citmatch", cache_key(*fields), found[key])
+        return found
+
+    def fetch_pmids(self, pmids: list[str]) -> list[PubMedMatch]:
+        """Summaries for known PMIDs, in the given order."""
+        return self._fetch_details(pmids)
+
     def search_full_citation(self, citation: str, retmax: int = 5) -> list[PubMedMatch]:
         """
         Search PubMed using the full citation text with multiple fallback strategies.
         This is more flexible than title-only search and can handle various citation formats.
         """
-        results = self._try_search(citation, retmax)
-        if results:
-            return results
-        
+        variants = self._search_variants(citation)
+        if self.speculative and self.pool is not None and len(variants) > 1:
+            return self._search_speculative(variants, retmax)
+        for query in variants:
+            results = self._try_search(query, retmax)
+            if results:
+                return results
+        return []
+    
+    def _search_variants(self, citation: str) -> list[str]:
+        """Query variants for a citation, most specific first."""
         cleaned = re.sub(r'[&;,\.\(\)\[\]]', ' ', citation)
         cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        results = self._try_search(cleaned, retmax)
-        if results:
-            return results
-        
+
         simplified = re.sub(r'\b10\.\d{4,9}/[^\s]+', '', citation)
         simplified = re.sub(r'\b\d+\(\d+\):\d+-\d+', '', simplified)
         simplified = re.sub(r'\b\d+:\d+', '', simplified)
         simplified = re.sub(r'[&;,\.\(\)\[\]]', ' ', simplified)
         simplified = re.sub(r'\s+', ' ', simplified).strip()
-        results = self._try_search(simplified, retmax)
-        if results:
-            return results
-        
-        key_terms = self._extract_key_terms(citation)
-        if key_terms:
-            results = self._try_search(key_terms, retmax)
-            if results:
-                return results
-        
-        return []
-    
+
+        variants: list[str] = []
+        for query in (citation, cleaned, simplified, self._extract_key_terms(citation)):
+            if query and query not in variants:
+                variants.append(query)
+        return variants
+
+    def _search_speculative(self, variants: list[str], retmax: int) -> list[PubMedMatch]:
+        """Search the variants in priority order with the next one already in flight.
+
+        Each variant runs on the calling thread while the following one is
+        queued on the shared source pool. A queued variant that has not
+        started by the time it is needed is run inline instead, and once a
+        variant yields matches the cancel flag stops the one in flight
+        before it takes a rate-limit token. Only the winner's IDs are
+        summarised, as on the sequential path.
+        """
+        executor = self.pool()
+        cancel = Event()
+        ahead: Future | None = None
+        try:
+            for position, query in enumerate(variants):
+                current, ahead = ahead, None
+                if position + 1 < len(variants):
+                    ahead = executor.submit(self._esearch_ids, variants[position + 1], retmax, cancel)
+                if current is None or current.cancel():
+                    ids = self._esearch_ids(query, retmax)
+                else:
+                    ids = current.result()
+                if not ids:
+                    continue
+                results = self._fetch_details(ids)
+                if results:
+                    return results
+            return []
+        finally:
+            cancel.set()
+            if ahead is not None:
+                ahead.cancel()
+
     def _extract_key_terms(self, citation: str) -> str:
         """Extract key terms from citation: authors, year, journal, important title words."""
         parts = []
@@ -146,15 +337,19 @@ class PubMedClient:
         
         return ' '.join(parts)
     
-    def _try_search(self, query: str, retmax: int = 5) -> list[PubMedMatch]:
-        """Helper method to try a single search query."""
+    def _esearch_ids(self, query: str, retmax: int = 5, cancel: Event | None = None) -> list[str]:
         esearch = self._get_json(
-            "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi",
+            ESEARCH,
             {"db": "pubmed", "retmode": "json", "retmax": str(retmax), "term": query},
+            cancel,
         )
         if not esearch:
             return []
-        ids = (esearch.get("esearchresult", {}) or {}).get("idlist", [])
+        return (esearch.get("esearchresult", {}) or {}).get("idlist", [])
+
+    def _try_search(self, query: str, retmax: int = 5) -> list[PubMedMatch]:
+        """Helper method to try a single search query."""
+        ids = self._esearch_ids(query, retmax)
         if not ids:
             return []
 
@@ -164,7 +359,7 @@ class PubMedClient:
         # Use phrase search limited to Title field
         term = f'"{title}"[Title]'
         esearch = self._get_json(
-            "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi",
+            ESEARCH,
             {"db": "pubmed", "retmode": "json", "retmax": str(retmax), "term": term},
         )
         if not esearch:
@@ -176,9 +371,45 @@ class PubMedClient:
         return self._fetch_details(ids)
 
     def _fetch_details(self, pmids: list[str]) -> list[PubMedMatch]:
-        """Fetch detailed information for a list of PMIDs."""
+        """Fetch detailed information for a list of PMIDs, reusing cached summaries."""
+        known: dict[str, PubMedMatch] = {}
+        for pmid in pmids:
+            stored = self.cache.get("pubmed_summary", pmid)
+            if stored is not None:
+                known[pmid] = PubMedMatch(**stored)
+        missing = [pmid for pmid in pmids if pmid not in known]
+        if missing:
+            if self.batcher is not None:
+                found = self.batcher.get(missing, self._fetch_batch, self._efetch_batch, self.budget)
+                fetched = [found[pmid] for pmid in missing if pmid in found]
+            else:
+                fetched = self._fetch_summaries(missing)
+            for match in fetched:
+                known[match.pmid] = match
+                if match.title:
+                    self.cache.set("pubmed_summary", match.pmid, asdict(match))
+        return [known[pmid] for pmid in pmids if pmid in known]
+
+    def _efetch_batch(self, pmids: list[str]) -> dict[str, str]:
+        """DOIs for a pooled batch, one efetch per :data:`EUTILS_MAX_IDS` PMIDs."""
+        dois: dict[str, str] = {}
+        for start in range(0, len(pmids), EUTILS_MAX_IDS):
+            dois.update(self._efetch_dois(pmids[start:start + EUTILS_MAX_IDS]))
+        return dois
+
+    def _fetch_batch(self, pmids: list[str]) -> dict[str, PubMedMatch]:
+        """Summaries for a pooled batch; the batcher looks up the missing DOIs."""
+        results: dict[str, PubMedMatch] = {}
+        for start in range(0, len(pmids), EUTILS_MAX_IDS):
+            chunk = pmids[start:start + EUTILS_MAX_IDS]
+            for match in self._fetch_summaries(chunk, doi_limit=0):
+                results[match.pmid] = match
+        return results
+
+    def _fetch_summaries(self, pmids: list[str], doi_limit: int = EFETCH_DOI_LIMIT) -> list[PubMedMatch]:
+        """Run esummary, then one efetch for up to ``doi_limit`` hits without a DOI."""
         esum = self._get_json(
-            "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi",
+            ESUMMARY,
             {"db": "pubmed", "retmode": "json", "id": ",".join(pmids)},
         )
         results: list[PubMedMatch] = []
@@ -219,22 +450,45 @@ class PubMedClient:
                         pages=pages,
                     )
                 )
-        # If DOI missing, try efetch XML for the first few
-        for i, pm in enumerate(results[:3]):
-            if pm.doi:
-                continue
-            xml = self._get_text(
-                "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi",
-                {"db": "pubmed", "retmode": "xml", "id": pm.pmid},
-            )
-            if not xml:
-                continue
-            try:
-                root = ET.fromstring(xml)
-                for aid in root.iterfind(".//ArticleIdList/ArticleId"):
-                    if aid.get("IdType", "").lower() == "doi":
-                        results[i].doi = (aid.text or "").strip()
-                        break
-            except ET.ParseError:
-                pass
+        self._fill_dois(results, doi_limit)
         return results
+
+    def _fill_dois(self, results: list[PubMedMatch], doi_limit: int = EFETCH_DOI_LIMIT) -> None:
+        """If DOI missing, try efetch XML for the first ``doi_limit`` hits."""
+        missing = [pm for pm in results if not pm.doi][:doi_limit]
+        if missing:
+            dois = self._efetch_dois([pm.pmid for pm in missing])
+            for pm in missing:
+                pm.doi = dois.get(pm.pmid)
+
+    def _efetch_dois(self, pmids: list[str]) -> dict[str, str]:
+        """DOIs for ``pmids`` from one efetch, parsed article by article as it streams."""
+        if self.budget.expired:
+            return {}
+        params = {
+            "db": "pubmed",
+            "retmode": "xml",
+            "id": ",".join(pmids),
+            "tool": "ref-audit",
+            "email": self.email,
+        }
+        dois: dict[str, str] = {}
+        try:
+            if not self.limiter.acquire(EFETCH, self.budget.usable):
+                return dois
+            with self.session.get(EFETCH, params=params, timeout=self.budget.http_timeout(10.0), stream=True) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True
+                for _, elem in ET.iterparse(r.raw, events=("end",)):
+                    if elem.tag != "PubmedArticle":
+                        continue
+                    pmid = (elem.findtext("MedlineCitation/PMID") or "").strip()
+                    # Only the article's own IDs; the ReferenceList repeats ArticleIdList.
+                    for aid in elem.iterfind("PubmedData/ArticleIdList/ArticleId"):
+                        if aid.get("IdType", "").lower() == "doi" and (aid.text or "").strip():
+                            dois[pmid] = aid.text.strip()
+                            break
+                    elem.clear()
+        except (requests.RequestException, ET.ParseError):
+            pass
+        return dois
@@ -0,0 +1,154 @@
+"""Per-host token-bucket rate limiting shared by all API clients.
+
+Each upstream host gets one bucket. Worker threads reserve a token before
+sending a request and sleep only until that token becomes available, so
+parallel checks can use a host's full allowance without exceeding it.
+"""
+
+from __future__ import annotations
+
+import time
+import urllib.parse
+from collections.abc import Callable
+from threading import Lock
+
+# Requests per second per host. Crossref's polite pool (mailto in the
+# User-Agent) and E-utilities without an API key are the binding limits;
+# arXiv asks for one request every three seconds.
+DEFAULT_HOST_RATES: dict[str, float] = {
+    "api.crossref.org": 10.0,
+    "eutils.ncbi.nlm.nih.gov": 3.0,
+    "export.arxiv.org": 1 / 3,
+    "doi.org": 10.0,
+    "api.datacite.org": 10.0,
+    "api.japanlinkcenter.org": 5.0,
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out reservations."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = Lock()
+        self.requests = 0
+        self.refused = 0
+        self.waited_sec = 0.0
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        """Take one token and return how long the caller must wait for it.
+
+        If the wait would exceed ``max_wait``, no token is taken and
+        ``None`` is returned.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = (1.0 - self._tokens) / self.rate if self._tokens < 1.0 else 0.0
+            if max_wait is not None and wait > max_wait:
+                self.refused += 1
+                return None
+            self._tokens -= 1.0
+            self.requests += 1
+            self.waited_sec += wait
+            return wait
+
+    def acquire(self, max_wait: float | None = None) -> bool:
+        """Sleep until a token is ours; ``False`` at once if that is past ``max_wait``."""
+        wait = self.reserve(max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+class HostRateLimiter:
+    """Route requests to one :class:`TokenBucket` per host."""
+
+    def __init__(
+        self,
+        rates: dict[str, float] | None = None,
+        default_rate: float | None = None,
+        burst: float = 1.0,
+    ):
+        self.rates = {host.lower(): rate for host, rate in (rates or {}).items()}
+        self.default_rate = default_rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket | None] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def from_pause(cls, pause_sec: float, rates: dict[str, float] | None = None) -> HostRateLimiter:
+        """Build the limiter implied by the legacy ``pause_sec`` setting.
+
+        ``pause_sec <= 0`` disables pacing entirely (tests, local mocks).
+        Otherwise known hosts use :data:`DEFAULT_HOST_RATES` (overridden by
+        ``rates``) and any other host is limited to ``1 / pause_sec``.
+        """
+        if pause_sec <= 0:
+            return cls(rates=rates or {}, default_rate=None)
+        return cls(rates={**DEFAULT_HOST_RATES, **(rates or {})}, default_rate=1.0 / pause_sec)
+
+    def _bucket(self, host: str) -> TokenBucket | None:
+        with self._lock:
+            if host not in self._buckets:
+                rate = self.rates.get(host, self.default_rate)
+                self._buckets[host] = TokenBucket(rate, self.burst) if rate and rate > 0 else None
+            return self._buckets[host]
+
+    def acquire(self, url: str, max_wait: float | None = None) -> bool:
+        """Block until a request to ``url``'s host may be sent.
+
+        Returns ``False`` without waiting when the host's next slot is more
+        than ``max_wait`` seconds away, so a caller on a time budget fails
+        fast instead of sleeping past it.
+        """
+        host = (urllib.parse.urlsplit(url).hostname or "").lower()
+        bucket = self._bucket(host)
+        if bucket is None:
+            return True
+        return bucket.acquire(max_wait)
+
+    def stats(self) -> dict[str, dict]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            host: {
+                "rate": bucket.rate,
+                "requests": bucket.requests,
+                "refused": bucket.refused,
+                "waited_sec": round(bucket.waited_sec, 3),
+            }
+            for host, bucket in buckets.items()
+            if bucket is not None
+        }
+
+
+def parse_rate_overrides(values: list[str] | None) -> dict[str, float]:
+    """Parse ``HOST=RPS`` strings from the command line."""
+    rates: dict[str, float] = {}
+    for value in values or []:
+        host, sep, rate = value.partition("=")
+        if not sep or not host.strip():
+            raise ValueError(f"expected HOST=RPS, got {value!r}")
+        try:
+            parsed = float(rate)
+        except ValueError:
+            raise ValueError(f"invalid rate for {host.strip()}: {rate!r}") from None
+        if parsed <= 0:
+            raise ValueError(f"rate for {host.strip()} must be positive")
+        rates[host.strip().lower()] = parsed
+    return rates
@@ -291,3 +291,50 @@ def make_markdown_full(results: Iterable[MatchResult]) -> str:
         for result in websites:
             lines += _section_website(result)
     return "\n".join(lines)
+
+
+def _diff_label(result: MatchResult) -> str:
+    label = result.status
+    if result.retracted:
+        label += "・撤回"
+    if result.verification_status == "partial":
+        label += "・partial"
+    return label
+
+
+def make_markdown_diff(previous: Iterable[MatchResult], current: Iterable[MatchResult]) -> str:
+    """前回の結果と今回の結果を参考文献テキストのハッシュで突き合わせた差分。"""
+    from .journal import reference_key
+
+    previous_by_key = {reference_key(result.input_text): result for result in previous}
+    current_by_key = {reference_key(result.input_text): result for result in current}
+    added = [result for key, result in current_by_key.items() if key not in previous_by_key]
+    removed = [result for key, result in previous_by_key.items() if key not in current_by_key]
+    changed = [
+        (previous_by_key[key], result)
+        for key, result in current_by_key.items()
+        if key in previous_by_key and _diff_label(previous_by_key[key]) != _diff_label(result)
+    ]
+    unchanged = len(current_by_key) - len(added) - len(changed)
+    lines = [
+        "## 前回からの差分",
+        "",
+        f"変更なし: {unchanged}、追加・編集: {len(added)}、削除: {len(removed)}、判定の変化: {len(changed)}",
+        "",
+    ]
+    if added:
+        lines += ["### ➕ 追加・編集された書誌", ""]
+        lines += [f"- `{result.input_text}` → {_diff_label(result)}" for result in added]
+        lines.append("")
+    if removed:
+        lines += ["### ➖ 削除された書誌", ""]
+        lines += [f"- `{result.input_text}`（前回: {_diff_label(result)}）" for result in removed]
+        lines.append("")
+    if changed:
+        lines += ["### 🔁 判定が変わった書誌", ""]
+        lines += [
+            f"- `{result.input_text}`: {_diff_label(before)} → {_diff_label(result)}"
+            for before, result in changed
+        ]
+        lines.append("")
+    return "\n".join(lines)
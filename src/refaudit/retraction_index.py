@@ -0,0 +1,287 @@
+"""Offline retraction index built from a downloaded retraction dataset.
+
+Ingests Retraction Watch CSV exports (or JSON lists of the same records, or
+Crossref ``update-to`` notices) into a single SQLite file keyed by
+normalised DOI and PMID. Re-ingesting a newer dump upserts by record id, so
+refreshes only need the delta. A later reinstatement notice clears the
+retractions before it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+
+from .cache import connect_readonly
+from .crossref import RETRACTION_TYPES
+
+# Retraction Watch "RetractionNature" values mapped onto Crossref update types.
+NATURE_TYPES = {
+    "retraction": "retraction",
+    "withdrawal": "withdrawal",
+    "removal": "removal",
+    "partial retraction": "partial_retraction",
+    "partial_retraction": "partial_retraction",
+    "reinstatement": "reinstatement",
+}
+REINSTATEMENT = "reinstatement"
+
+_DOI_PREFIX = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)", re.IGNORECASE)
+
+
+def normalize_doi(value: str | None) -> str | None:
+    if not value:
+        return None
+    doi = _DOI_PREFIX.sub("", value.strip()).strip().lower()
+    return doi if doi.startswith("10.") else None
+
+
+def normalize_pmid(value: str | int | None) -> str | None:
+    if value is None:
+        return None
+    pmid = str(value).strip()
+    pmid = pmid.removesuffix(".0")
+    return pmid if pmid.isdigit() and int(pmid) > 0 else None
+
+
+def _parse_date(value: str | None) -> str | None:
+    if not value:
+        return None
+    text = value.strip()
+    for fmt in ("%m/%d/%Y %H:%M", "%m/%d/%Y", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%SZ"):
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%dT%H:%M:%SZ")
+        except ValueError:
+            continue
+    return None
+
+
+def _record_id(*parts: str | None) -> str:
+    return hashlib.sha1("|".join(part or "" for part in parts).encode("utf-8")).hexdigest()
+
+
+def _from_watch_row(row: dict) -> dict | None:
+    doi = normalize_doi(row.get("OriginalPaperDOI"))
+    pmid = normalize_pmid(row.get("OriginalPaperPubMedID"))
+    if not doi and not pmid:
+        return None
+    nature = (row.get("RetractionNature") or "Retraction").strip()
+    notice_doi = normalize_doi(row.get("RetractionDOI"))
+    return {
+        "record_id": "rw:" + (str(row.get("Record ID") or "").strip() or _record_id(doi, pmid, nature, notice_doi)),
+        "doi": doi,
+        "pmid": pmid,
+        "update_type": NATURE_TYPES.get(nature.lower(), nature.lower().replace(" ", "_")),
+        "notice_doi": notice_doi,
+        "date": _parse_date(row.get("RetractionDate")),
+        "reason": (row.get("Reason") or "").strip() or None,
+        "source": "retraction-watch",
+    }
+
+
+def _from_crossref_notice(notice: dict) -> Iterator[dict]:
+    notice_doi = normalize_doi(notice.get("DOI"))
+    for update in notice.get("update-to", []):
+        doi = normalize_doi(update.get("DOI"))
+        update_type = (update.get("type") or "").lower()
+        if not doi or not update_type:
+            continue
+        date = (update.get("updated") or {}).get("date-time")
+        yield {
+            "record_id": "cr:" + _record_id(notice_doi, doi, update_type),
+            "doi": doi,
+            "pmid": None,
+            "update_type": update_type,
+            "notice_doi": notice_doi,
+            "date": date,
+            "reason": update.get("label"),
+            "source": update.get("source") or "crossref",
+        }
+
+
+def read_records(path: str | Path) -> Iterator[dict]:
+    """Yield normalised records from a CSV or JSON dump."""
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with path.open(encoding="utf-8-sig", errors="replace", newline="") as handle:
+            for row in csv.DictReader(handle):
+                record = _from_watch_row(row)
+                if record:
+                    yield record
+        return
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(payload, dict):
+        payload = payload.get("message", {}).get("items", payload.get("items", []))
+    for item in payload:
+        if "update-to" in item:
+            yield from _from_crossref_notice(item)
+        else:
+            record = _from_watch_row(item)
+            if record:
+                yield record
+
+
+class RetractionIndex:
+    """Read/write SQLite index of retraction notices.
+
+    With ``readonly`` the file must already exist and is never created or
+    modified; only the ingest command opens it for writing.
+    """
+
+    def __init__(self, path: str | Path, readonly: bool = False):
+        self.path = Path(path)
+        self._lock = Lock()
+        if readonly:
+            self._conn = connect_readonly(self.path, "notices", "retraction index")
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS notices ("
+            " record_id TEXT PRIMARY KEY,"
+            " doi TEXT,"
+            " pmid TEXT,"
+            " update_type TEXT NOT NULL,"
+            " notice_doi TEXT,"
+            " date TEXT,"
+            " reason TEXT,"
+            " source TEXT,"
+            " ingested_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS notices_doi ON notices (doi);"
+            "CREATE INDEX IF NOT EXISTS notices_pmid ON notices (pmid);"
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        )
+        self._conn.commit()
+
+    def ingest(self, records: Iterable[dict], replace: bool = False) -> int:
+        """Upsert ``records`` as they stream in; with ``replace`` drop existing rows first."""
+        now = time.time()
+        count = 0
+
+        def rows() -> Iterator[tuple]:
+            nonlocal count
+            for record in records:
+                count += 1
+                yield (
+                    record["record_id"],
+                    record.get("doi"),
+                    record.get("pmid"),
+                    record["update_type"],
+                    record.get("notice_doi"),
+                    record.get("date"),
+                    record.get("reason"),
+                    record.get("source"),
+                    now,
+                )
+
+        with self._lock:
+            if replace:
+                self._conn.execute("DELETE FROM notices")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO notices"
+                " (record_id, doi, pmid, update_type, notice_doi, date, reason, source, ingested_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows(),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed_at', ?)",
+                (str(now),),
+            )
+            self._conn.commit()
+        return count
+
+    def lookup(self, doi: str | None = None, pmid: str | None = None) -> list[dict]:
+        """Retraction-type notices for ``doi`` or ``pmid`` (empty if none).
+
+        Notices are replayed by date, so a reinstatement drops the
+        retractions issued before it.
+        """
+        doi = normalize_doi(doi)
+        pmid = normalize_pmid(pmid)
+        if not doi and not pmid:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT update_type, notice_doi, date, reason, source FROM notices"
+                " WHERE doi = ? OR pmid = ? ORDER BY date",
+                (doi, pmid),
+            ).fetchall()
+        hits: list[dict] = []
+        seen: set[tuple[str | None, str]] = set()
+        for update_type, notice_doi, date, reason, source in rows:
+            if update_type == REINSTATEMENT:
+                hits.clear()
+                seen.clear()
+                continue
+            if update_type not in RETRACTION_TYPES or (notice_doi, update_type) in seen:
+                continue
+            seen.add((notice_doi, update_type))
+            hits.append(
+                {
+                    "notice_doi": notice_doi,
+                    "update_type": update_type,
+                    "source": source,
+                    "updated": {"date-time": date} if date else {},
+                    "label": reason,
+                }
+            )
+        return hits
+
+    @property
+    def populated(self) -> bool:
+        """Whether anything has been ingested, so a miss can mean "not retracted"."""
+        stats = self.stats()
+        return stats["notices"] > 0 and stats["refreshed_at"] is not None
+
+    def stats(self) -> dict:
+        with self._lock:
+            total, dois, pmids = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT doi), COUNT(DISTINCT pmid) FROM notices"
+            ).fetchone()
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'refreshed_at'").fetchone()
+        return {
+            "notices": total,
+            "dois": dois,
+            "pmids": pmids,
+            "refreshed_at": float(row[0]) if row else None,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="citeguard-retractions",
+        description="Build or refresh an offline retraction index from Retraction Watch / Crossref dumps.",
+    )
+    p.add_argument("index", type=Path, help="SQLite index file to create or update.")
+    p.add_argument("dumps", type=Path, nargs="*", help="CSV or JSON files to ingest.")
+    p.add_argument("--replace", action="store_true", help="Drop existing notices before ingesting.")
+    args = p.parse_args(argv)
+
+    index = RetractionIndex(args.index)
+    try:
+        for position, dump in enumerate(args.dumps):
+            count = index.ingest(read_records(dump), replace=args.replace and position == 0)
+            print(f"{dump}: {count} notices", file=sys.stderr)
+        stats = index.stats()
+    finally:
+        index.close()
+    print(f"{args.index}: {stats['notices']} notices, {stats['dois']} DOIs, {stats['pmids']} PMIDs", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
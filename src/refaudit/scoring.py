@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import os
 import re
 import unicodedata
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from difflib import SequenceMatcher
+from functools import cached_property, lru_cache, partial
 from typing import Literal
 
+try:
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+except ImportError:  # optional: pip install citeguard[fast]
+    _rapidfuzz_ratio = None
+
 
 ACCEPT_THRESHOLD = 0.74
 SUGGEST_THRESHOLD = 0.45
@@ -35,6 +43,47 @@ class ReferenceRecord:
     is_preprint: bool = False
     aliases_resolved: bool = False
 
+    # Normalised forms are computed on first use and reused for every
+    # candidate pair. Records are treated as immutable once scored.
+    @cached_property
+    def title_norm(self) -> str:
+        return normalize_text(self.title)
+
+    @cached_property
+    def title_tokens(self) -> frozenset[str]:
+        return _content_tokens(self.title_norm)
+
+    @cached_property
+    def author_keys(self) -> frozenset[str]:
+        return frozenset(key for key in map(normalize_author_name, self.authors) if key)
+
+    @cached_property
+    def first_author_key(self) -> str:
+        return normalize_author_name(self.authors[0]) if self.authors else ""
+
+    @cached_property
+    def venue_variants(self) -> tuple[str, ...]:
+        variants: list[str] = []
+        for value in [self.venue, *self.venue_aliases]:
+            normalized = normalize_venue(value)
+            if normalized and normalized not in variants:
+                variants.append(normalized)
+        return tuple(variants)
+
+    @cached_property
+    def has_pages(self) -> bool:
+        return bool(self.page or self.article_number or self.volume or self.issue)
+
+    @cached_property
+    def preprint_like(self) -> bool:
+        if self.is_preprint:
+            return True
+        source = normalize_text(self.source)
+        venue = normalize_text(self.venue)
+        title = self.title_norm
+        preprint_markers = {"arxiv", "preprints", "biorxiv", "medrxiv"}
+        return any(marker in source or marker in venue or marker in title for marker in preprint_markers)
+
 
 @dataclass
 class CandidateScore:
@@ -43,16 +92,40 @@ class CandidateScore:
     signals: dict[str, float]
     field_states: dict[str, str]
     summary: str
-    field_diffs: dict[str, dict] = field(default_factory=dict)
+    # None means "not built yet": ``diff_builder`` fills it on first access.
+    _field_diffs: dict[str, dict] | None = field(default=None, repr=False)
     note: str | None = None
+    # Decision for the same signals under mode="correction"; None means same as ``decision``.
+    correction_decision: Literal["accept", "suggest", "reject"] | None = None
+    correction_note: str | None = None
+    diff_builder: Callable[[], dict[str, dict]] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def field_diffs(self) -> dict[str, dict]:
+        """Per-field comparison, built on first access (most candidates never need it)."""
+        if self._field_diffs is None:
+            self._field_diffs = self.diff_builder() if self.diff_builder is not None else {}
+        return self._field_diffs
+
+    def for_mode(self, mode: Literal["verification", "correction"]) -> CandidateScore:
+        """This score with ``decision``/``note`` taken from ``mode``."""
+        if mode == "verification" or self.correction_decision is None:
+            return self
+        return replace(self, decision=self.correction_decision, note=self.correction_note)
+
 
+# Normalisers are pure and see the same titles/venues for every candidate pair.
+NORMALIZE_CACHE_SIZE = 16384
 
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_text(value: str | None) -> str:
     text = unicodedata.normalize("NFKC", value or "").lower()
     text = re.sub(r"[^\w\s]", " ", text)
     return re.sub(r"\s+", " ", text).strip()
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_venue(value: str | None) -> str:
     text = unicodedata.normalize("NFKC", value or "").lower()
     text = re.sub(r"\[(?:internet|online|electronic resource|print)\]", " ", text)
@@ -61,12 +134,14 @@ def normalize_venue(value: str | None) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_token(value: str | None) -> str:
     token = unicodedata.normalize("NFKC", value or "").strip().lower()
     token = re.sub(r"[^\w\u3040-\u30ff\u3400-\u9fff-]", "", token)
     return token
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_author_name(name: str | None) -> str:
     raw = unicodedata.normalize("NFKC", name or "").strip()
     token = normalize_token(raw)
@@ -85,12 +160,58 @@ def normalize_author_name(name: str | None) -> str:
     return parts[0]
 
 
-def _token_overlap(left: str | None, right: str | None) -> float:
-    left_tokens = {token for token in normalize_text(left).split() if len(token) > 1}
-    right_tokens = {token for token in normalize_text(right).split() if len(token) > 1}
-    if not left_tokens or not right_tokens:
+def _content_tokens(normalized: str) -> frozenset[str]:
+    return frozenset(token for token in normalized.split() if len(token) > 1)
+
+
+def _set_overlap(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left or not right:
         return 0.0
-    return len(left_tokens & right_tokens) / max(len(left_tokens), len(right_tokens))
+    return len(left & right) / max(len(left), len(right))
+
+
+def _token_overlap(left: str | None, right: str | None) -> float:
+    return _set_overlap(_content_tokens(normalize_text(left)), _content_tokens(normalize_text(right)))
+
+
+def _difflib_ratio(a: str, b: str) -> float:
+    return SequenceMatcher(None, a, b).ratio()
+
+
+SIMILARITY_BACKENDS: dict[str, Callable[[str, str], float]] = {"difflib": _difflib_ratio}
+if _rapidfuzz_ratio is not None:
+    SIMILARITY_BACKENDS["rapidfuzz"] = lambda a, b: _rapidfuzz_ratio(a, b) / 100.0
+
+
+def _default_backend() -> str:
+    # rapidfuzz's Indel ratio is not SequenceMatcher's and can flip borderline
+    # decisions, so it is only used when asked for.
+    requested = os.getenv("CITEGUARD_SIMILARITY")
+    return requested if requested in SIMILARITY_BACKENDS else "difflib"
+
+
+_backend_name = _default_backend()
+_ratio = SIMILARITY_BACKENDS[_backend_name]
+
+
+def similarity_backend() -> str:
+    return _backend_name
+
+
+def set_similarity_backend(name: str) -> str:
+    """Switch the string-ratio backend; returns the previous backend name."""
+    global _backend_name, _ratio
+    if name not in SIMILARITY_BACKENDS:
+        raise ValueError(f"unknown similarity backend {name!r}; available: {', '.join(SIMILARITY_BACKENDS)}")
+    previous = _backend_name
+    _backend_name, _ratio = name, SIMILARITY_BACKENDS[name]
+    _pair_ratio.cache_clear()
+    return previous
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _pair_ratio(a: str, b: str) -> float:
+    return _ratio(a, b)
 
 
 def _sequence_similarity(left: str | None, right: str | None) -> float:
@@ -98,7 +219,7 @@ def _sequence_similarity(left: str | None, right: str | None) -> float:
     b = normalize_text(right)
     if not a or not b:
         return 0.0
-    return SequenceMatcher(None, a, b).ratio()
+    return _pair_ratio(a, b)
 
 
 def title_similarity(left: str | None, right: str | None) -> float:
@@ -107,6 +228,21 @@ def title_similarity(left: str | None, right: str | None) -> float:
     return round(max(overlap, seq), 3)
 
 
+def _record_title_similarity(reference: ReferenceRecord, candidate: ReferenceRecord) -> float:
+    overlap = _set_overlap(reference.title_tokens, candidate.title_tokens)
+    seq = _pair_ratio(reference.title_norm, candidate.title_norm) if reference.title_norm and candidate.title_norm else 0.0
+    return round(max(overlap, seq), 3)
+
+
+def _record_author_overlap(reference: ReferenceRecord, candidate: ReferenceRecord) -> float:
+    return round(_set_overlap(reference.author_keys, candidate.author_keys), 3)
+
+
+def _record_first_author_match(reference: ReferenceRecord, candidate: ReferenceRecord) -> float:
+    left, right = reference.first_author_key, candidate.first_author_key
+    return 1.0 if left and right and left == right else 0.0
+
+
 def author_overlap(input_authors: list[str], candidate_authors: list[str]) -> float:
     left = {normalize_author_name(author) for author in input_authors if normalize_author_name(author)}
     right = {normalize_author_name(author) for author in candidate_authors if normalize_author_name(author)}
@@ -196,13 +332,7 @@ def page_similarity(
 
 
 def is_preprint_like(record: ReferenceRecord) -> bool:
-    if record.is_preprint:
-        return True
-    source = normalize_text(record.source)
-    venue = normalize_text(record.venue)
-    title = normalize_text(record.title)
-    preprint_markers = {"arxiv", "preprints", "biorxiv", "medrxiv"}
-    return any(marker in source or marker in venue or marker in title for marker in preprint_markers)
+    return record.preprint_like
 
 
 def _field_state(score: float, available: bool) -> str:
@@ -268,14 +398,7 @@ def _looks_like_abbrev(short: str | None, long: str | None) -> bool:
 
 
 def _venue_variants(record: ReferenceRecord) -> list[str]:
-    variants: list[str] = []
-    seen: set[str] = set()
-    for value in [record.venue, *record.venue_aliases]:
-        normalized = normalize_venue(value)
-        if normalized and normalized not in seen:
-            seen.add(normalized)
-            variants.append(normalized)
-    return variants
+    return list(record.venue_variants)
 
 
 def venue_match_analysis(reference: ReferenceRecord, candidate: ReferenceRecord) -> tuple[float, str | None]:
@@ -364,8 +487,8 @@ def _build_field_diffs(
 
     ref_pages_display = _format_pages_display(reference)
     cand_pages_display = _format_pages_display(candidate)
-    has_ref_pages = bool(reference.page or reference.article_number or reference.volume or reference.issue)
-    has_cand_pages = bool(candidate.page or candidate.article_number or candidate.volume or candidate.issue)
+    has_ref_pages = reference.has_pages
+    has_cand_pages = candidate.has_pages
 
     fields = [
         (
@@ -440,9 +563,9 @@ def score_candidate(
     mode: Literal["verification", "correction"] = "verification",
     strict: bool = True,
 ) -> CandidateScore:
-    title_score = title_similarity(reference.title, candidate.title)
-    author_score = author_overlap(reference.authors, candidate.authors)
-    first_author_score = first_author_match(reference.authors, candidate.authors)
+    title_score = _record_title_similarity(reference, candidate)
+    author_score = _record_author_overlap(reference, candidate)
+    first_author_score = _record_first_author_match(reference, candidate)
     year_score = year_similarity(reference.year, candidate.year)
     venue_score, _ = venue_match_analysis(reference, candidate)
     volume_issue_score = volume_issue_similarity(
@@ -493,8 +616,7 @@ def score_candidate(
         "venue": _field_state(venue_score, bool(reference.venue and candidate.venue)),
         "pages": _field_state(
             max(volume_issue_score, page_score),
-            bool(reference.page or reference.article_number or reference.volume or reference.issue)
-            and bool(candidate.page or candidate.article_number or candidate.volume or candidate.issue),
+            reference.has_pages and candidate.has_pages,
         ),
     }
 
@@ -531,16 +653,21 @@ def score_candidate(
     else:
         decision = "reject"
 
-    if mode == "correction" and decision == "reject" and total >= SUGGEST_THRESHOLD and strong_support_count >= 2:
-        decision = "suggest"
-        note = note or "candidate_mismatch"
+    correction_decision = decision
+    correction_note = note
+    if decision == "reject" and total >= SUGGEST_THRESHOLD and strong_support_count >= 2:
+        correction_decision = "suggest"
+        correction_note = note or "candidate_mismatch"
 
-    return CandidateScore(
+    score = CandidateScore(
         total=total,
         decision=decision,
         signals=signals,
         field_states=field_states,
         summary=_build_summary(field_states),
-        field_diffs=_build_field_diffs(reference, candidate, signals),
+        diff_builder=partial(_build_field_diffs, reference, candidate, signals),
         note=note,
+        correction_decision=correction_decision,
+        correction_note=correction_note,
     )
+    return score.for_mode(mode)
@@ -0,0 +1,63 @@
+"""Shared HTTP connection pools for all source clients.
+
+Every client gets its own :class:`requests.Session` (for its own headers),
+but all of them mount the same :class:`HTTPAdapter`, so connections to a
+host are pooled and kept alive across clients. Crossref and the DOI
+resolver, or PubMed and the NLM Catalog, then reuse each other's sockets.
+"""
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .executor import DEFAULT_SOURCE_WORKERS
+
+# Distinct hosts kept pooled; more than the sources we talk to.
+POOL_HOSTS = 16
+
+
+class Transport:
+    """Keep-alive connection pools, one per host, shared by many sessions.
+
+    ``pool_size`` caps the sockets kept alive to any one host and should
+    cover every thread that may send at once. A request beyond it opens a
+    short-lived extra connection rather than waiting for a free one, since
+    requests offers no pool timeout and an unbounded wait would ignore the
+    caller's :class:`TimeBudget`.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_SOURCE_WORKERS + 1):
+        self.pool_size = max(1, pool_size)
+        self.adapter = HTTPAdapter(
+            pool_connections=POOL_HOSTS,
+            pool_maxsize=self.pool_size,
+            pool_block=False,
+        )
+
+    def session(self, headers: dict[str, str] | None = None) -> requests.Session:
+        session = requests.Session()
+        if headers:
+            session.headers.update(headers)
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Requests, connections opened and connection reuses, per host."""
+        pools = self.adapter.poolmanager.pools
+        stats: dict[str, dict[str, int]] = {}
+        # RecentlyUsedContainer refuses iteration; keys() returns a locked snapshot.
+        keys = pools.keys()
+        for key in keys:
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            entry = stats.setdefault(pool.host, {"requests": 0, "connections": 0, "reused": 0})
+            entry["requests"] += pool.num_requests
+            entry["connections"] += pool.num_connections
+            entry["reused"] += max(0, pool.num_requests - pool.num_connections)
+        return stats
+
+    def close(self) -> None:
+        self.adapter.close()
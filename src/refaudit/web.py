@@ -1,9 +1,91 @@
 from __future__ import annotations
 
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict
+from threading import Lock
 
 from .budget import TimeBudget
+from .cache import NO_CACHE, CacheStore, SQLiteCache
 from .crossref import CrossrefClient, MatchResult
+from .executor import DEFAULT_SOURCE_WORKERS
+from .ratelimit import DEFAULT_HOST_RATES
+from .transport import Transport
+
+# References checked concurrently within one batch request.
+WEB_BATCH_JOBS = 4
+# Requests a browser keeps in flight, advertised via GET /api/check. Each
+# serverless instance rate-limits on its own, so host rates are divided by
+# this to keep the combined traffic within the upstream limits.
+WEB_MAX_CONCURRENCY = max(1, int(os.getenv("CITEGUARD_WEB_CONCURRENCY") or 3))
+WEB_CLIENT_BATCH = 5
+# Warm clients kept per process, one per contact email.
+WEB_CLIENT_REGISTRY_SIZE = 16
+
+_cache_lock = Lock()
+_shared_cache: CacheStore | None = None
+_clients_lock = Lock()
+_clients: OrderedDict[tuple, CrossrefClient] = OrderedDict()
+# Connection pools shared by every registered client.
+_transport = Transport(pool_size=DEFAULT_SOURCE_WORKERS + WEB_BATCH_JOBS)
+
+
+def shared_cache() -> CacheStore:
+    """Return the process-wide cache configured by ``CITEGUARD_CACHE``."""
+    global _shared_cache
+    with _cache_lock:
+        if _shared_cache is None:
+            path = os.getenv("CITEGUARD_CACHE")
+            _shared_cache = SQLiteCache(path) if path else NO_CACHE
+        return _shared_cache
+
+
+def web_client(email: str | None, pause_sec: float = 0.2, debug: bool = False) -> CrossrefClient:
+    """Return the process-wide client for ``email``, creating it on first use.
+
+    Warm serverless invocations reuse its connections and memos; callers take
+    a per-request :meth:`CrossrefClient.fork` with their own budget.
+    """
+    key = (email, pause_sec, debug)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = CrossrefClient(
+                pause_sec=pause_sec,
+                debug=debug,
+                email=email,
+                rates=web_rates(),
+                cache=shared_cache(),
+                transport=_transport,
+                pubmed_batching=True,
+            )
+            _clients[key] = client
+            while len(_clients) > WEB_CLIENT_REGISTRY_SIZE:
+                _clients.popitem(last=False)[1].close()
+        _clients.move_to_end(key)
+        return client
+
+
+def clear_web_clients() -> None:
+    with _clients_lock:
+        while _clients:
+            _clients.popitem()[1].close()
+
+
+def web_rates(concurrency: int | None = None) -> dict[str, float]:
+    share = concurrency or WEB_MAX_CONCURRENCY
+    return {host: rate / share for host, rate in DEFAULT_HOST_RATES.items()}
+
+
+def client_config() -> dict:
+    """Limits the browser should follow when fanning out requests."""
+    return {
+        "max_concurrency": WEB_MAX_CONCURRENCY,
+        "batch_size": WEB_CLIENT_BATCH,
+        "host_rates": web_rates(),
+    }
 
 
 def check_reference_payload(
@@ -24,5 +106,64 @@ def check_reference(
     debug: bool = False,
     budget: TimeBudget | None = None,
 ) -> MatchResult:
-    client = CrossrefClient(pause_sec=pause_sec, debug=debug, email=email, budget=budget)
-    return client.check_one(ref)
+    with web_client(email, pause_sec=pause_sec, debug=debug).fork(budget) as client:
+        return client.check_one(ref)
+
+
+def iter_references_payload(
+    refs: list[str],
+    email: str | None = None,
+    pause_sec: float = 0.2,
+    debug: bool = False,
+    budget: TimeBudget | None = None,
+    jobs: int | None = None,
+) -> Iterator[dict]:
+    """Yield one entry per reference as soon as its check finishes.
+
+    Entries carry the input ``index`` and are ``{"ok": True, "result": {...}}``,
+    or ``{"ok": False, "ref": ..., "error": "budget_exhausted"}`` for references
+    not started before the budget ran out, so the caller can resend them.
+    """
+    with web_client(email, pause_sec=pause_sec, debug=debug).fork(budget) as client:
+        client.prefetch(refs)
+
+        def check(ref: str) -> MatchResult | None:
+            if client.budget.expired:
+                return None
+            return client.check_one(ref)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(jobs or WEB_BATCH_JOBS, len(refs))), thread_name_prefix="refaudit-web"
+        )
+        try:
+            futures = {executor.submit(check, ref): index for index, ref in enumerate(refs)}
+            for future in as_completed(futures):
+                index = futures[future]
+                result = future.result()
+                if result is None:
+                    yield {"index": index, "ok": False, "ref": refs[index], "error": "budget_exhausted"}
+                else:
+                    yield {"index": index, "ok": True, "result": asdict(result)}
+        finally:
+            # Closed early (e.g. the client disconnected): drop the checks not
+            # yet started and let only the running ones finish before the fork closes.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def check_references_payload(
+    refs: list[str],
+    email: str | None = None,
+    pause_sec: float = 0.2,
+    debug: bool = False,
+    budget: TimeBudget | None = None,
+    jobs: int | None = None,
+) -> list[dict]:
+    """Check many references with one client, one budget and shared caches.
+
+    Returns the :func:`iter_references_payload` entries in input order.
+    """
+    entries = sorted(
+        iter_references_payload(refs, email=email, pause_sec=pause_sec, debug=debug, budget=budget, jobs=jobs),
+        key=lambda entry: entry["index"],
+    )
+    return [{key: value for key, value in entry.items() if key != "index"} for entry in entries]
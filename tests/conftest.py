@@ -1,10 +1,66 @@
 from __future__ import annotations
 
 import sys
+import time
 from pathlib import Path
+from typing import ClassVar
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 for item in (ROOT, SRC):
     if str(item) not in sys.path:
         sys.path.insert(0, str(item))
+
+from refaudit.crossref import MatchResult
+
+
+def _make_result(line: str, **overrides) -> MatchResult:
+    values = {
+        "input_text": line,
+        "doi": None,
+        "title": None,
+        "found": False,
+        "retracted": False,
+        "retraction_details": [],
+        "status": "not_found",
+        "note": "no_match",
+    }
+    values.update(overrides)
+    return MatchResult(**values)
+
+
+@pytest.fixture
+def make_result():
+    """Build a not-found MatchResult for ``line``; keywords override fields."""
+    return _make_result
+
+
+@pytest.fixture
+def dummy_client(monkeypatch):
+    """Install a stand-in CrossrefClient for CLI runs and return its class.
+
+    Each check is recorded in ``checked`` and answered as not found, with
+    ``outcomes[line]`` applied as field overrides. ``delays`` (seconds per
+    line) makes checks slow for the batch tests.
+    """
+
+    class DummyClient:
+        checked: ClassVar[list[str]] = []
+        outcomes: ClassVar[dict[str, dict]] = {}
+
+        def __init__(self, delays: dict[str, float] | None = None, **options):
+            self.delays = delays or {}
+            self.options = options
+
+        def check_one(self, line):
+            time.sleep(self.delays.get(line, 0.0))
+            self.checked.append(line)
+            return _make_result(line, **self.outcomes.get(line, {}))
+
+        def screen_retractions(self, results):
+            return 0
+
+    monkeypatch.setattr("refaudit.crossref.CrossrefClient", DummyClient)
+    return DummyClient
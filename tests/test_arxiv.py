@@ -198,3 +198,55 @@ class TestStripVersion:
     def test_old_format(self):
         from refaudit.arxiv import _strip_version
         assert _strip_version("hep-th/9901001v1") == "hep-th/9901001"
+
+
+class TestLookupIds:
+    """Tests for ArxivClient.lookup_ids batch prefetch."""
+
+    FEED = """<?xml version="1.0" encoding="UTF-8"?>
+    <feed xmlns="http://www.w3.org/2005/Atom">
+      <entry><id>http://arxiv.org/abs/2307.06464v2</id><title>First paper</title></entry>
+      <entry><id>http://arxiv.org/abs/hep-th/9901001v1</id><title>Old style paper</title></entry>
+    </feed>"""
+
+    def test_one_query_then_lookups_hit_memory(self, monkeypatch):
+        import xml.etree.ElementTree as ET
+
+        from refaudit.arxiv import ArxivClient
+
+        queries = []
+        feed = self.FEED
+
+        def fake_get_xml(self, params, *, ignore_budget=False):
+            queries.append(params)
+            return ET.fromstring(feed)
+
+        monkeypatch.setattr(ArxivClient, "_get_xml", fake_get_xml)
+        client = ArxivClient(pause_sec=0)
+
+        found = client.lookup_ids(["2307.06464v1", "hep-th/9901001", "2401.00001", "2307.06464"])
+
+        assert found == 2
+        assert queries == [{"id_list": "2307.06464,hep-th/9901001,2401.00001", "max_results": "3"}]
+        assert client.lookup_by_id("2307.06464v2").title == "First paper"
+        assert client.verify_reference(arxiv_id="hep-th/9901001v1")[1] == "arxiv-id"
+        assert client.lookup_by_id("2401.00001") is None
+        assert len(queries) == 1
+
+    def test_prefetch_does_not_queue_past_the_budget(self, monkeypatch):
+        import time
+
+        from refaudit.arxiv import ARXIV_API, ArxivClient
+        from refaudit.budget import TimeBudget
+        from refaudit.ratelimit import HostRateLimiter
+
+        sent = []
+        limiter = HostRateLimiter(rates={"export.arxiv.org": 1 / 60})
+        assert limiter.acquire(ARXIV_API)  # the only token for the next minute
+        client = ArxivClient(pause_sec=0, budget=TimeBudget(total_seconds=3.0), limiter=limiter)
+        monkeypatch.setattr(client.session, "get", lambda *args, **kwargs: sent.append(args))
+
+        started = time.perf_counter()
+        assert client.lookup_ids(["2307.06464"]) == 0
+        assert time.perf_counter() - started < 1.0
+        assert sent == []
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+from refaudit.arxiv import ArxivClient
+from refaudit.arxiv_index import ArxivIndex, main, read_snapshot
+
+SNAPSHOT = [
+    {
+        "id": "1706.03762",
+        "authors": "Ashish Vaswani, Noam Shazeer",
+        "title": "Attention Is All\n  You Need",
+        "doi": None,
+        "journal-ref": None,
+        "categories": "cs.CL cs.LG",
+        "abstract": "long text",
+        "versions": [{"version": "v1", "created": "Mon, 12 Jun 2017 17:57:34 GMT"}],
+        "update_date": "2023-08-02",
+        "authors_parsed": [["Vaswani", "Ashish", ""], ["Shazeer", "Noam", ""]],
+    },
+    {
+        "id": "hep-th/9901001",
+        "authors": "A. Author",
+        "title": "Attention in string theory",
+        "categories": "hep-th",
+        "versions": [{"version": "v1", "created": "Fri, 1 Jan 1999 00:00:00 GMT"}],
+        "authors_parsed": [["Author", "A.", ""]],
+    },
+]
+
+
+def _write_snapshot(path, items):
+    with gzip.open(path, "wt", encoding="utf-8") as handle:
+        for item in items:
+            handle.write(json.dumps(item) + "\n")
+        handle.write('{"id": "truncated\n')
+
+
+def test_ingest_lookup_and_title_search(tmp_path):
+    snapshot = tmp_path / "snapshot.json.gz"
+    _write_snapshot(snapshot, SNAPSHOT)
+    path = tmp_path / "arxiv.sqlite"
+
+    assert main([str(path), str(snapshot)]) == 0
+    assert main([str(path), str(snapshot)]) == 0
+
+    index = ArxivIndex(path)
+    assert index.stats()["papers"] == 2
+    match = index.lookup("1706.03762v5")
+    assert match.title == "Attention Is All You Need"
+    assert match.authors == ["Ashish Vaswani", "Noam Shazeer"]
+    assert match.published == "2017-06-12T17:57:34Z"
+    assert match.categories == ["cs.CL", "cs.LG"]
+    assert index.search_title("Attention is all you need")[0].arxiv_id == "1706.03762"
+    assert index.search_title("Quantum gravity") == []
+    index.close()
+
+
+def test_client_answers_from_index_before_api(tmp_path, monkeypatch):
+    snapshot = tmp_path / "snapshot.json.gz"
+    _write_snapshot(snapshot, SNAPSHOT)
+    index = ArxivIndex(tmp_path / "arxiv.sqlite")
+    index.ingest(read_snapshot(snapshot))
+    calls: list[dict] = []
+    monkeypatch.setattr(ArxivClient, "_get_xml", lambda self, params, **kwargs: calls.append(params))
+
+    client = ArxivClient(pause_sec=0, index=index)
+    assert client.verify_reference(arxiv_id="hep-th/9901001v2")[1] == "arxiv-id"
+    match, method = client.verify_reference(title="Attention is all you need", authors=["vaswani"])
+    assert (match.arxiv_id, method) == ("1706.03762", "arxiv-title-search")
+    assert calls == []
+
+    assert client.verify_reference(title="A paper newer than the snapshot")[1] == "arxiv-title-not-found"
+    assert len(calls) == 2
+    index.close()
+
+
+def test_reingest_reindexes_changed_titles_and_id_hits_are_memoised(tmp_path):
+    index = ArxivIndex(tmp_path / "arxiv.sqlite")
+    record = {"arxiv_id": "2101.00001", "title": "Original quantum title", "authors": ["A B"]}
+    index.ingest([record])
+    index.ingest([{**record, "title": "Renamed graphene study"}])
+
+    assert index.stats()["papers"] == 1
+    assert index.search_title("Original quantum title") == []
+    assert index.search_title("Renamed graphene study")[0].arxiv_id == "2101.00001"
+
+    client = ArxivClient(pause_sec=0, index=index)
+    first = client.lookup_by_id("2101.00001v2")
+    index.close()
+    assert client.lookup_by_id("2101.00001") is first
+
+
+def test_readonly_open_requires_an_existing_index(tmp_path):
+    import pytest
+
+    missing = tmp_path / "arxiv.sqlite"
+    with pytest.raises(FileNotFoundError):
+        ArxivIndex(missing, readonly=True)
+    assert not missing.exists()
+
+    other = tmp_path / "other.sqlite"
+    other.write_bytes(b"not sqlite at all, just some text padding it out" * 4)
+    with pytest.raises(ValueError):
+        ArxivIndex(other, readonly=True)
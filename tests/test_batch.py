@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import time
+
+from refaudit.batch import check_batch
+
+
+def test_check_batch_preserves_input_order(dummy_client):
+    refs = ["a", "b", "c", "d"]
+    client = dummy_client(delays={"a": 0.08, "b": 0.0, "c": 0.04, "d": 0.0})
+
+    results, stats = check_batch(client, refs, jobs=4)
+
+    assert [result.input_text for result in results] == refs
+    assert stats.total == 4
+    assert stats.jobs == 4
+
+
+def test_check_batch_runs_references_concurrently(dummy_client):
+    refs = [f"ref-{i}" for i in range(4)]
+    client = dummy_client(delays={ref: 0.1 for ref in refs})
+
+    started = time.perf_counter()
+    results, stats = check_batch(client, refs, jobs=4)
+    elapsed = time.perf_counter() - started
+
+    assert len(results) == 4
+    assert elapsed < 0.3
+    assert stats.refs_per_sec > 0
+
+
+def test_check_batch_streams_results_in_order_or_completion_order(dummy_client):
+    refs = ["slow", "fast", "medium"]
+    client = dummy_client(delays={"slow": 0.1, "fast": 0.0, "medium": 0.05})
+
+    ordered: list[int] = []
+    check_batch(client, refs, jobs=3, on_result=lambda index, result: ordered.append(index))
+    assert ordered == [0, 1, 2]
+
+    completed: list[str] = []
+    results, _ = check_batch(
+        client,
+        refs,
+        jobs=3,
+        on_result=lambda index, result: completed.append(result.input_text),
+        ordered=False,
+    )
+    assert completed == ["fast", "medium", "slow"]
+    assert [result.input_text for result in results] == refs
+
+
+def test_check_batch_reports_completions_before_reordering(dummy_client):
+    refs = ["slow", "fast", "medium"]
+    client = dummy_client(delays={"slow": 0.1, "fast": 0.0, "medium": 0.05})
+
+    completed: list[str] = []
+    streamed: list[str] = []
+    check_batch(
+        client,
+        refs,
+        jobs=3,
+        on_result=lambda index, result: streamed.append(result.input_text),
+        on_complete=lambda index, result: completed.append(result.input_text),
+    )
+    assert completed == ["fast", "medium", "slow"]
+    assert streamed == refs
+
+
+def test_check_batch_clamps_jobs(dummy_client):
+    results, stats = check_batch(dummy_client(), ["only"], jobs=50)
+    assert [result.input_text for result in results] == ["only"]
+    assert stats.jobs == 1
+    _, empty_stats = check_batch(dummy_client(), [], jobs=0)
+    assert empty_stats.jobs == 1
+    assert empty_stats.refs_per_sec >= 0.0
+
+
+def test_prefetch_dois_fills_doi_cache_in_chunks(monkeypatch):
+    from refaudit.crossref import CrossrefClient
+
+    requests_seen: list[dict] = []
+
+    def fake_get(self, url, params=None):
+        if params["filter"].startswith("updates:"):
+            return {"message": {"items": []}}
+        requests_seen.append(params)
+        dois = [part.split(":", 1)[1] for part in params["filter"].split(",")]
+        items = [{"DOI": doi.lower(), "title": [f"T {doi}"]} for doi in dois if "datacite" not in doi]
+        return {"message": {"items": items}}
+
+    monkeypatch.setattr(CrossrefClient, "_get", fake_get)
+    monkeypatch.setattr(
+        "refaudit.crossref.DOIResolver.detect_ra",
+        lambda self, doi: (_ for _ in ()).throw(AssertionError("detect_ra should be skipped")),
+    )
+
+    client = CrossrefClient(pause_sec=0)
+    refs = [
+        "Smith J. A title. J Test 2020. DOI: 10.1000/ABC",
+        "Doe A. Another. J Test 2021. doi:10.1000/def",
+        "Roe B. Dataset. 2022. DOI: 10.5061/datacite.1",
+        "Duplicate. DOI: 10.1000/abc",
+        "No DOI here. J Test 2020.",
+    ]
+    counts = client.prefetch(refs)
+
+    assert counts == {"dois": 2, "retractions": 3, "pmids": 0, "arxiv": 0}
+    assert len(requests_seen) == 1
+    assert requests_seen[0]["rows"] == 3
+    assert client._resolve_doi_work("10.1000/ABC") == ({"DOI": "10.1000/abc", "title": ["T 10.1000/ABC"]}, "doi-crossref")
+    assert client._resolve_doi_work("10.1000/abc")[1] == "doi-crossref"
+    assert "10.5061/datacite.1" not in client._doi_cache
+
+    assert client.prefetch_dois(["10.1000/ABC", "10.1/x,y"]) == 0
+    assert len(requests_seen) == 1
+
+
+def test_check_retractions_attributes_notices_per_doi(monkeypatch):
+    from refaudit.crossref import CrossrefClient
+
+    requests_seen: list[str] = []
+    notices = [
+        {
+            "DOI": "10.1/notice-a",
+            "update-to": [
+                {"DOI": "10.1/A", "type": "retraction", "label": "Retraction"},
+                {"DOI": "10.1/b", "type": "correction"},
+            ],
+        },
+        {"DOI": "10.1/notice-b", "update-to": [{"DOI": "10.1/b", "type": "erratum"}]},
+    ]
+
+    def fake_get(self, url, params=None):
+        requests_seen.append(params["filter"])
+        return {"message": {"items": notices}}
+
+    monkeypatch.setattr(CrossrefClient, "_get", fake_get)
+    client = CrossrefClient(pause_sec=0)
+
+    screened = client.check_retractions(["10.1/a", "10.1/B", "10.1/c", "10.1/a"])
+
+    assert requests_seen == ["updates:10.1/a,updates:10.1/b,updates:10.1/c,is-update:true"]
+    assert screened["10.1/a"][0] is True
+    assert screened["10.1/a"][1][0]["notice_doi"] == "10.1/notice-a"
+    assert screened["10.1/b"] == (False, [])
+    assert screened["10.1/c"] == (False, [])
+    assert client.is_retracted("10.1/A")[0] is True
+    assert len(requests_seen) == 1
+
+
+def test_check_retractions_ignores_doi_less_entries_in_a_multi_doi_chunk(monkeypatch):
+    from refaudit.crossref import CrossrefClient
+
+    notices = [
+        {"DOI": "10.1/notice-a", "update-to": [{"DOI": "10.1/a", "type": "retraction"}]},
+        # Which of the queried DOIs this one retracts cannot be told.
+        {"DOI": "10.1/notice-x", "update-to": [{"type": "retraction"}]},
+    ]
+    monkeypatch.setattr(CrossrefClient, "_get", lambda self, url, params=None: {"message": {"items": notices}})
+    client = CrossrefClient(pause_sec=0)
+
+    screened = client.check_retractions(["10.1/a", "10.1/b"])
+
+    assert [hit["notice_doi"] for hit in screened["10.1/a"][1]] == ["10.1/notice-a"]
+    assert screened["10.1/b"] == (False, [])
+
+
+def test_screen_retractions_fills_deferred_results(monkeypatch, make_result):
+    from refaudit.crossref import CrossrefClient
+
+    monkeypatch.setattr(
+        CrossrefClient,
+        "_get",
+        lambda self, url, params=None: {
+            "message": {"items": [{"DOI": "10.1/n", "update-to": [{"DOI": "10.1/x", "type": "withdrawal"}]}]}
+        },
+    )
+    client = CrossrefClient(pause_sec=0, defer_retractions=True)
+    found = make_result("x")
+    found.doi = "10.1/X"
+    results = [found, make_result("missing")]
+
+    assert client.screen_retractions(results) == 1
+    assert found.retracted is True
+    assert found.retraction_details[0]["update_type"] == "withdrawal"
+    assert results[1].retracted is False
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from refaudit.budget import TimeBudget
+from refaudit.cache import NO_CACHE, LRUDict, SQLiteCache, cache_key
+from refaudit.crossref import CrossrefClient
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_sqlite_cache_round_trip_and_ttl(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteCache(tmp_path / "cache.sqlite", ttls={"retraction": 10.0, "work": 100.0}, clock=clock)
+
+    cache.set("work", "10.1/a", [{"DOI": "10.1/a"}, "doi-crossref"])
+    cache.set("retraction", "10.1/a", [False, []])
+    cache.set("work", "ignored", None)
+
+    assert cache.get("work", "10.1/a") == [{"DOI": "10.1/a"}, "doi-crossref"]
+    assert cache.get("work", "ignored") is None
+
+    clock.now += 50.0
+    assert cache.get("retraction", "10.1/a") is None
+    assert cache.get("work", "10.1/a") is not None
+    cache.close()
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    first = SQLiteCache(path)
+    first.set("bibliographic", cache_key("Some ref", 5), [{"DOI": "10.1/x"}])
+    first.close()
+
+    second = SQLiteCache(path)
+    assert second.get("bibliographic", cache_key("Some ref", 5)) == [{"DOI": "10.1/x"}]
+    assert second.purge_expired() == 0
+    second.close()
+
+
+def test_null_cache_stores_nothing():
+    NO_CACHE.set("work", "k", [1])
+    assert NO_CACHE.get("work", "k") is None
+
+
+def test_crossref_client_reuses_persistent_doi_and_retraction_entries(tmp_path, monkeypatch):
+    calls: list[str] = []
+    work = {"DOI": "10.1/abc", "title": ["Cached title"]}
+
+    monkeypatch.setattr(
+        "refaudit.crossref.DOIResolver.detect_ra",
+        lambda self, doi: calls.append("ra") or "Crossref",
+    )
+    monkeypatch.setattr(CrossrefClient, "get_work", lambda self, doi: calls.append("work") or work)
+    monkeypatch.setattr(
+        CrossrefClient,
+        "_fetch_updates",
+        lambda self, doi: calls.append("updates") or [],
+    )
+
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    first = CrossrefClient(pause_sec=0, cache=cache)
+    assert first._resolve_doi_work("10.1/ABC") == (work, "doi-crossref")
+    assert first.is_retracted("10.1/ABC") == (False, [])
+    assert calls == ["ra", "work", "updates"]
+
+    second = CrossrefClient(pause_sec=0, cache=cache)
+    assert second._resolve_doi_work("10.1/abc") == (work, "doi-crossref")
+    assert second.is_retracted("10.1/abc") == (False, [])
+    assert calls == ["ra", "work", "updates"]
+    cache.close()
+
+
+def test_failed_retraction_lookup_is_not_persisted(tmp_path, monkeypatch):
+    monkeypatch.setattr(CrossrefClient, "_fetch_updates", lambda self, doi: None)
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+
+    assert CrossrefClient(pause_sec=0, cache=cache).is_retracted("10.1/x") == (False, [])
+    assert cache.get("retraction", "10.1/x") is None
+    cache.close()
+
+
+def test_lru_dict_evicts_oldest_and_expires():
+    clock = FakeClock()
+    memo = LRUDict(maxsize=2, ttl=10, clock=clock)
+    memo["a"] = 1
+    memo["b"] = 2
+    assert memo["a"] == 1
+    memo["c"] = 3
+    assert "b" not in memo and "a" in memo and len(memo) == 2
+
+    clock.now += 11
+    assert memo.get("a") is None
+    assert "c" not in memo
+
+
+def test_fork_shares_sessions_and_memos_but_not_budget(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(CrossrefClient, "_fetch_updates", lambda self, doi: calls.append(doi) or [])
+    parent = CrossrefClient(pause_sec=0)
+    budget = TimeBudget(30)
+
+    with parent.fork(budget) as first:
+        assert first.budget is budget and first._pubmed.budget is budget
+        assert first.session is parent.session and first._pubmed.session is parent._pubmed.session
+        first.is_retracted("10.1/x")
+    with parent.fork(TimeBudget(30)) as second:
+        assert second.is_retracted("10.1/x") == (False, [])
+    assert parent.budget is not budget
+    assert calls == ["10.1/x"]
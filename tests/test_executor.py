@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from threading import Event
+
+from refaudit.crossref import CrossrefClient, SourceCollectionResult
+from refaudit.executor import InstrumentedExecutor
+
+
+def test_instrumented_executor_reports_queue_and_utilisation():
+    executor = InstrumentedExecutor(max_workers=1)
+    release = Event()
+    first = executor.submit(release.wait)
+    second = executor.submit(lambda: 42)
+    time.sleep(0.05)
+
+    stats = executor.stats()
+    assert stats["running"] == 1
+    assert stats["queued"] == 1
+
+    release.set()
+    assert first.result() is True
+    assert second.result() == 42
+    stats = executor.stats()
+    assert stats["completed"] == 2
+    assert stats["queued"] == 0
+    assert stats["peak_queued"] >= 1
+    assert stats["peak_running"] == 1
+    assert 0.0 < stats["utilisation"] <= 1.0
+    executor.shutdown()
+
+
+def test_cancelled_futures_leave_the_queue():
+    executor = InstrumentedExecutor(max_workers=1)
+    release = Event()
+    executor.submit(release.wait)
+    pending = executor.submit(lambda: None)
+    assert pending.cancel()
+
+    stats = executor.stats()
+    assert stats["queued"] == 0
+    assert stats["cancelled"] == 1
+    release.set()
+    executor.shutdown()
+
+
+def test_client_reuses_one_source_pool_across_references(monkeypatch):
+    monkeypatch.setattr(
+        CrossrefClient,
+        "_collect_crossref_source",
+        lambda self, input_text: SourceCollectionResult(source="crossref", candidates=[]),
+    )
+    monkeypatch.setattr(
+        CrossrefClient,
+        "_collect_pubmed_source",
+        lambda self, input_text, title_guess: SourceCollectionResult(source="pubmed", candidates=[]),
+    )
+    monkeypatch.setattr(
+        CrossrefClient,
+        "_collect_arxiv_source",
+        lambda self, arxiv_id, title_guess, input_authors: SourceCollectionResult(source="arxiv", candidates=[]),
+    )
+
+    with CrossrefClient(pause_sec=0, source_workers=2) as client:
+        assert client.executor_stats() is None
+        client.check_one("Smith J. First unknown reference title here. J Test 2020.")
+        pool = client._executor
+        client.check_one("Doe A. Second unknown reference title here. J Test 2021.")
+        assert client._executor is pool
+        stats = client.executor_stats()
+        assert stats["workers"] == 2
+        assert stats["completed"] == 6
+    assert client._executor is None
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+
+from refaudit.journal import Journal, reference_key
+from refaudit.main import run
+
+
+def test_reference_key_ignores_whitespace():
+    assert reference_key("Smith J.  A title.\t2020 ") == reference_key("Smith J. A title. 2020")
+    assert reference_key("Smith J. A title. 2020") != reference_key("Smith J. A title. 2021")
+
+
+def test_journal_skips_truncated_line_and_keeps_last_entry(tmp_path, make_result):
+    path = tmp_path / "journal.jsonl"
+    journal = Journal(path)
+    journal.record("ref", make_result("ref", verification_status="partial"))
+    journal.record("ref", make_result("ref"))
+    journal.close()
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"key": "half-writ')
+
+    resumed = Journal(path, resume=True)
+    assert list(resumed.completed()) == [reference_key("ref")]
+    resumed.close()
+
+
+def test_resume_rechecks_only_partial_and_failed_references(tmp_path, dummy_client):
+    checked = dummy_client.checked
+    outcomes = dummy_client.outcomes
+    outcomes.update(
+        {
+            "Partial reference": {"verification_status": "partial", "unchecked_sources": ["pubmed"]},
+            "Failed reference": {"source_errors": {"crossref": "HTTPError"}},
+        }
+    )
+    text = "Good reference\nPartial reference\nFailed reference"
+    journal_path = tmp_path / "journal.jsonl"
+
+    assert run(text, tmp_path / "first.md", journal_path=journal_path) == 0
+    assert checked == ["Good reference", "Partial reference", "Failed reference"]
+
+    checked.clear()
+    outcomes["Partial reference"] = {}
+    out_path = tmp_path / "second.jsonl"
+    assert run(text, out_path, journal_path=journal_path, resume=True, output_format="jsonl") == 0
+
+    assert checked == ["Partial reference", "Failed reference"]
+    lines = out_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    report = (tmp_path / "second.md").read_text(encoding="utf-8")
+    assert "Good reference" in report and "Failed reference" in report
+
+
+def test_previous_run_reuses_verdicts_rechecks_retractions_and_reports_diff(tmp_path, dummy_client):
+    checked = dummy_client.checked
+    screened: list[str] = []
+
+    def screen_retractions(self, results):
+        for result in results:
+            if result.doi:
+                screened.append(result.doi)
+                result.retracted = result.doi == "10.1/now-retracted"
+        return 0
+
+    dummy_client.screen_retractions = screen_retractions
+    previous_path = tmp_path / "previous.jsonl"
+    previous = [
+        {"index": 0, "input_text": "Kept reference", "doi": "10.1/now-retracted", "title": "T",
+         "found": True, "retracted": False, "retraction_details": [], "status": "found"},
+        {"index": 1, "input_text": "Dropped reference", "doi": None, "title": None,
+         "found": False, "retracted": False, "retraction_details": [], "status": "not_found"},
+    ]
+    previous_path.write_text("\n".join(json.dumps(entry) for entry in previous), encoding="utf-8")
+    out_path = tmp_path / "report.md"
+
+    assert run("Kept  reference\nEdited reference", out_path, show_all=True, previous_path=previous_path) == 0
+
+    assert checked == ["Edited reference"]
+    assert "10.1/now-retracted" in screened
+    report = out_path.read_text(encoding="utf-8")
+    assert "## 前回からの差分" in report
+    assert "変更なし: 0、追加・編集: 1、削除: 1、判定の変化: 1" in report
+    assert "`Kept reference`: found → found・撤回" in report
+    assert "`Dropped reference`（前回: not_found）" in report
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import threading
 import time
 
-from refaudit.crossref import CandidateMatch, CrossrefClient, MatchResult, SourceCollectionResult, _merge_records
+import pytest
+
+from refaudit import scoring
+from refaudit.crossref import (
+    CandidateEvaluation,
+    CandidateMatch,
+    CrossrefClient,
+    MatchResult,
+    SourceCollectionResult,
+    _merge_records,
+)
 from refaudit.main import run
 from refaudit.parser import extract_authors, parse_reference_metadata
 from refaudit.pubmed import PubMedMatch
@@ -10,6 +21,14 @@ from refaudit.report import make_markdown_bad_only
 from refaudit.scoring import CandidateScore, ReferenceRecord, score_candidate
 
 
+@pytest.fixture(autouse=True, params=sorted(scoring.SIMILARITY_BACKENDS))
+def similarity_backend(request):
+    """Run the whole corpus under every installed similarity backend."""
+    previous = scoring.set_similarity_backend(request.param)
+    yield request.param
+    scoring.set_similarity_backend(previous)
+
+
 def _work(
     doi: str,
     title: str,
@@ -205,6 +224,9 @@ def test_scorer_accepts_exact_match_and_suggests_miscitation():
 
     assert score_candidate(good_input, exact, mode="verification").decision == "accept"
     assert score_candidate(wrong_input, miscited, mode="correction").decision == "suggest"
+    single_pass = score_candidate(wrong_input, miscited, mode="verification")
+    assert single_pass.correction_decision == "suggest"
+    assert single_pass.for_mode("correction") == score_candidate(wrong_input, miscited, mode="correction")
 
 
 def test_crossref_client_flags_miscitations_with_suggestions(monkeypatch):
@@ -717,36 +739,23 @@ def test_report_renders_likely_wrong_section():
     assert "10.2196/29080" in markdown
 
 
-def test_cli_markdown_includes_likely_wrong_section(tmp_path, monkeypatch):
-    result = MatchResult(
-        input_text="Wrong citation",
-        doi="10.2196/29080",
-        title="Suggested title",
-        found=False,
-        retracted=False,
-        retraction_details=[],
-        status="likely_wrong",
-        note="candidate_mismatch",
-        comparison_summary="title x / authors ok / year ok / venue ok / pages ok",
-        field_diffs={
+def test_cli_markdown_includes_likely_wrong_section(tmp_path, dummy_client):
+    dummy_client.outcomes["Wrong citation"] = {
+        "doi": "10.2196/29080",
+        "title": "Suggested title",
+        "status": "likely_wrong",
+        "note": "candidate_mismatch",
+        "comparison_summary": "title x / authors ok / year ok / venue ok / pages ok",
+        "field_diffs": {
             "title": {"state": "mismatch", "input_value": "Wrong", "candidate_value": "Suggested title", "reason": None, "score": 0.1},
             "authors": {"state": "ok", "input_value": "A", "candidate_value": "A", "reason": None, "score": 1.0},
             "year": {"state": "ok", "input_value": "2020", "candidate_value": "2020", "reason": None, "score": 1.0},
             "venue": {"state": "ok", "input_value": "X", "candidate_value": "X", "reason": None, "score": 1.0},
             "pages": {"state": "ok", "input_value": "1", "candidate_value": "1", "reason": None, "score": 1.0},
         },
-        candidates=[{"title": "Suggested title", "doi": "10.2196/29080", "field_summary": "title x / authors ok / year ok / venue ok / pages ok"}],
-    )
-
-    class DummyClient:
-        def __init__(self, debug=False, email=None, pause_sec=0.2, strict=True):
-            self.debug = debug
-            self.email = email
-
-        def check_one(self, line):
-            return result
+        "candidates": [{"title": "Suggested title", "doi": "10.2196/29080", "field_summary": "title x / authors ok / year ok / venue ok / pages ok"}],
+    }
 
-    monkeypatch.setattr("refaudit.crossref.CrossrefClient", DummyClient)
     out_path = tmp_path / "report.md"
     run("Wrong citation", out_path)
     text = out_path.read_text(encoding="utf-8")
@@ -774,7 +783,16 @@ def test_collect_candidates_parallel_runs_sources_concurrently(monkeypatch):
 
     client = CrossrefClient(pause_sec=0)
     started = time.perf_counter()
-    raw_candidates, arxiv_id, arxiv_doi, journal_ref, unchecked_sources, source_errors = client._collect_candidates_parallel(
+    (
+        raw_candidates,
+        arxiv_id,
+        arxiv_doi,
+        journal_ref,
+        unchecked_sources,
+        source_errors,
+        early_exit,
+        scores,
+    ) = client._collect_candidates_parallel(
         "Reference text",
         "Some title",
         "2307.06464",
@@ -789,6 +807,8 @@ def test_collect_candidates_parallel_runs_sources_concurrently(monkeypatch):
     assert journal_ref is None
     assert unchecked_sources == []
     assert source_errors == {}
+    assert early_exit is None
+    assert scores == {}
 
 
 def test_accepted_result_is_complete_even_with_skipped_sources(monkeypatch):
@@ -816,16 +836,22 @@ def test_accepted_result_is_complete_even_with_skipped_sources(monkeypatch):
     monkeypatch.setattr(
         CrossrefClient,
         "_collect_candidates_parallel",
-        lambda self, input_text, title_guess, input_arxiv_id, input_authors: (
+        lambda self, input_text, title_guess, input_arxiv_id, input_authors, input_record=None: (
             [(candidate_record, "bibliographic")],
             None,
             None,
             None,
             ["pubmed"],
             {"jalc": "TimeoutError"},
+            None,
+            {},
         ),
     )
-    monkeypatch.setattr(CrossrefClient, "_evaluate_candidates", lambda self, input_record, raw_candidates, mode="verification": [accepted])
+    monkeypatch.setattr(
+        CrossrefClient,
+        "_evaluate_candidates",
+        lambda self, input_record, raw_candidates, scores=None: CandidateEvaluation(verified=[accepted], correction=[accepted]),
+    )
     monkeypatch.setattr(CrossrefClient, "is_retracted", lambda self, doi: (False, []))
 
     result = CrossrefClient(pause_sec=0).check_one("Smith J. 2024. Resolved title. Journal.")
@@ -841,16 +867,22 @@ def test_not_found_result_is_partial_when_sources_skipped(monkeypatch):
     monkeypatch.setattr(
         CrossrefClient,
         "_collect_candidates_parallel",
-        lambda self, input_text, title_guess, input_arxiv_id, input_authors: (
+        lambda self, input_text, title_guess, input_arxiv_id, input_authors, input_record=None: (
             [],
             None,
             None,
             None,
             ["pubmed"],
             {"jalc": "TimeoutError"},
+            None,
+            {},
         ),
     )
-    monkeypatch.setattr(CrossrefClient, "_evaluate_candidates", lambda self, input_record, raw_candidates, mode="verification": [])
+    monkeypatch.setattr(
+        CrossrefClient,
+        "_evaluate_candidates",
+        lambda self, input_record, raw_candidates, scores=None: CandidateEvaluation(verified=[], correction=[]),
+    )
     monkeypatch.setattr(CrossrefClient, "is_retracted", lambda self, doi: (False, []))
 
     result = CrossrefClient(pause_sec=0).check_one("Unknown reference text 2024.")
@@ -861,6 +893,53 @@ def test_not_found_result_is_partial_when_sources_skipped(monkeypatch):
     assert result.source_errors == {"jalc": "TimeoutError"}
 
 
+def test_unaccepted_candidates_are_scored_once(monkeypatch):
+    import refaudit.crossref as crossref_module
+
+    candidate_record = ReferenceRecord(
+        title="Debriefing with good judgment: combining rigorous feedback with genuine inquiry",
+        authors=["rudolph", "simon", "rivard"],
+        year=2007,
+        venue="Anesthesiol Clin",
+        volume="25",
+        issue="2",
+        page="361-76",
+        doi="10.1016/j.anclin.2007.03.007",
+        source="crossref",
+    )
+    monkeypatch.setattr(
+        CrossrefClient,
+        "_collect_candidates_parallel",
+        lambda self, input_text, title_guess, input_arxiv_id, input_authors, input_record=None: (
+            [(candidate_record, "bibliographic")],
+            None,
+            None,
+            None,
+            [],
+            {},
+            None,
+            {},
+        ),
+    )
+    monkeypatch.setattr(CrossrefClient, "is_retracted", lambda self, doi: (False, []))
+    calls: list[str] = []
+    real_score = crossref_module.score_candidate
+
+    def counting_score(*args, **kwargs):
+        calls.append(kwargs.get("mode", "verification"))
+        return real_score(*args, **kwargs)
+
+    monkeypatch.setattr(crossref_module, "score_candidate", counting_score)
+
+    result = CrossrefClient(pause_sec=0).check_one(
+        "Rudolph JW, Simon R, Raemer DB and Eppich WJ. Debriefing as Formative Assessment: "
+        "Translating Medical Simulation into Effective Learning. Anesthesiol Clin 2007; 25(2): 361-76."
+    )
+
+    assert result.status == "likely_wrong"
+    assert calls == ["verification"]
+
+
 def test_report_includes_partial_verification_section():
     result = MatchResult(
         input_text="Smith J. 2024. Resolved title. Journal.",
@@ -881,3 +960,132 @@ def test_report_includes_partial_verification_section():
     assert "検証未完了" in markdown
     assert "`pubmed`" in markdown
     assert "`jalc`=TimeoutError" in markdown
+
+
+def _exact_crossref_source(self, input_text):
+    record = ReferenceRecord(
+        title="Virtual Reality for Medical Training: Systematic Review and Meta-Analysis",
+        authors=["kyaw", "saxena", "posadzki"],
+        year=2019,
+        venue="J Med Internet Res",
+        volume="21",
+        issue="1",
+        page="e12959",
+        article_number="e12959",
+        doi="10.2196/12959",
+        source="crossref",
+        aliases_resolved=True,
+    )
+    return SourceCollectionResult(source="crossref", candidates=[(record, "bibliographic")])
+
+
+def test_early_exit_stops_waiting_for_slow_sources(monkeypatch):
+    def slow_pubmed(self, input_text, title_guess):
+        time.sleep(0.5)
+        return SourceCollectionResult(source="pubmed", candidates=[])
+
+    def slow_arxiv(self, **kwargs):
+        time.sleep(0.5)
+        return None, "arxiv-title-not-found"
+
+    monkeypatch.setattr(CrossrefClient, "_collect_crossref_source", _exact_crossref_source)
+    monkeypatch.setattr(CrossrefClient, "_collect_pubmed_source", slow_pubmed)
+    monkeypatch.setattr("refaudit.crossref.ArxivClient.verify_reference", slow_arxiv)
+    monkeypatch.setattr(CrossrefClient, "is_retracted", lambda self, doi: (False, []))
+
+    started = time.perf_counter()
+    result = CrossrefClient(pause_sec=0).check_one(
+        "Kyaw BM, Saxena N, Posadzki P. Virtual Reality for Medical Training: Systematic Review and "
+        "Meta-Analysis. J Med Internet Res 2019; 21(1): e12959."
+    )
+    elapsed = time.perf_counter() - started
+
+    assert result.status == "found"
+    assert elapsed < 0.4
+    assert result.early_exit is not None
+    assert result.early_exit["source"] == "crossref"
+    assert result.early_exit["skipped_sources"] == ["pubmed", "arxiv"]
+    assert result.early_exit["score"] >= result.early_exit["threshold"]
+
+
+def test_early_exit_scores_the_accepted_candidate_once(monkeypatch):
+    import refaudit.crossref as crossref_module
+
+    def slow_pubmed(self, input_text, title_guess):
+        time.sleep(0.2)
+        return SourceCollectionResult(source="pubmed", candidates=[])
+
+    monkeypatch.setattr(CrossrefClient, "_collect_crossref_source", _exact_crossref_source)
+    monkeypatch.setattr(CrossrefClient, "_collect_pubmed_source", slow_pubmed)
+    monkeypatch.setattr("refaudit.crossref.ArxivClient.verify_reference", lambda self, **kwargs: (None, "arxiv-no-query"))
+    monkeypatch.setattr(CrossrefClient, "is_retracted", lambda self, doi: (False, []))
+    calls: list[str] = []
+    real_score = crossref_module.score_candidate
+
+    def counting_score(*args, **kwargs):
+        calls.append(kwargs.get("mode", "verification"))
+        return real_score(*args, **kwargs)
+
+    monkeypatch.setattr(crossref_module, "score_candidate", counting_score)
+
+    result = CrossrefClient(pause_sec=0).check_one(
+        "Kyaw BM, Saxena N, Posadzki P. Virtual Reality for Medical Training: Systematic Review and "
+        "Meta-Analysis. J Med Internet Res 2019; 21(1): e12959."
+    )
+
+    assert result.early_exit is not None
+    assert calls == ["verification"]
+
+
+def test_early_exit_stops_sources_already_running(monkeypatch):
+    started = threading.Event()
+    stopped: list[bool] = []
+    done = threading.Event()
+
+    def slow_pubmed(self, input_text, title_guess):
+        started.set()
+        time.sleep(0.2)
+        # The next request would check the budget; it must read as spent now.
+        stopped.append(self.budget.expired)
+        done.set()
+        return SourceCollectionResult(source="pubmed", candidates=[])
+
+    def crossref_after_pubmed_starts(self, input_text):
+        started.wait(1)
+        return _exact_crossref_source(self, input_text)
+
+    monkeypatch.setattr(CrossrefClient, "_collect_crossref_source", crossref_after_pubmed_starts)
+    monkeypatch.setattr(CrossrefClient, "_collect_pubmed_source", slow_pubmed)
+    monkeypatch.setattr("refaudit.crossref.ArxivClient.verify_reference", lambda self, **kwargs: (None, "arxiv-no-query"))
+    monkeypatch.setattr(CrossrefClient, "is_retracted", lambda self, doi: (False, []))
+
+    client = CrossrefClient(pause_sec=0)
+    result = client.check_one(
+        "Kyaw BM, Saxena N, Posadzki P. Virtual Reality for Medical Training: Systematic Review and "
+        "Meta-Analysis. J Med Internet Res 2019; 21(1): e12959."
+    )
+
+    assert result.early_exit is not None
+    assert done.wait(1)
+    assert stopped == [True]
+    # Only the cancelled lookups see the spent budget, not the client.
+    assert not client.budget.expired
+
+
+def test_early_exit_can_be_disabled(monkeypatch):
+    def slow_pubmed(self, input_text, title_guess):
+        time.sleep(0.2)
+        return SourceCollectionResult(source="pubmed", candidates=[])
+
+    monkeypatch.setattr(CrossrefClient, "_collect_crossref_source", _exact_crossref_source)
+    monkeypatch.setattr(CrossrefClient, "_collect_pubmed_source", slow_pubmed)
+    monkeypatch.setattr("refaudit.crossref.ArxivClient.verify_reference", lambda self, **kwargs: (None, "arxiv-no-query"))
+    monkeypatch.setattr(CrossrefClient, "is_retracted", lambda self, doi: (False, []))
+
+    result = CrossrefClient(pause_sec=0, early_exit_score=None).check_one(
+        "Kyaw BM, Saxena N, Posadzki P. Virtual Reality for Medical Training: Systematic Review and "
+        "Meta-Analysis. J Med Internet Res 2019; 21(1): e12959."
+    )
+
+    assert result.status == "found"
+    assert result.early_exit is None
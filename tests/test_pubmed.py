@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import time
+
+from refaudit.pubmed import PubMedClient, PubMedMatch
+
+
+def test_speculative_search_prefers_highest_priority_variant(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    searched: list[str] = []
+    fetched: list[list[str]] = []
+    citation = "Smith J. Caffeine therapy in infants. JAMA. 2020;10(2):1-5."
+    variants = PubMedClient(pause_sec=0)._search_variants(citation)
+    ids = {variants[1]: ["222"], variants[2]: ["333"]}
+
+    def fake_esearch(self, query, retmax=5, cancel=None):
+        searched.append(query)
+        if query == variants[1]:
+            time.sleep(0.05)
+        return ids.get(query, [])
+
+    def fake_fetch(self, pmids):
+        fetched.append(pmids)
+        return [PubMedMatch(pmid=pmid, title="T", doi=None) for pmid in pmids]
+
+    monkeypatch.setattr(PubMedClient, "_esearch_ids", fake_esearch)
+    monkeypatch.setattr(PubMedClient, "_fetch_details", fake_fetch)
+
+    sequential = PubMedClient(pause_sec=0).search_full_citation(citation)
+    assert [hit.pmid for hit in sequential] == ["222"]
+    assert searched == variants[:2]
+
+    searched.clear()
+    fetched.clear()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        client = PubMedClient(pause_sec=0, speculative=True, pool=lambda: pool)
+        speculative = client.search_full_citation(citation)
+    assert [hit.pmid for hit in speculative] == ["222"]
+    assert fetched == [["222"]]
+    # Only one variant runs ahead, so the fourth is never sent.
+    assert sorted(searched) == sorted(variants[:3])
+
+
+def test_speculative_search_runs_queued_variant_inline():
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Event
+
+    release = Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Saturate the pool so the speculative variant can never start there.
+        pool.submit(release.wait, 5)
+        client = PubMedClient(pause_sec=0, speculative=True, pool=lambda: pool)
+        client._esearch_ids = lambda query, retmax=5, cancel=None: ["1"] if query == "b" else []
+        client._fetch_details = lambda pmids: [PubMedMatch(pmid=pmid, title="T", doi=None) for pmid in pmids]
+        hits = client._search_speculative(["a", "b", "c"], 5)
+        release.set()
+    assert [hit.pmid for hit in hits] == ["1"]
+
+
+def test_batcher_pools_pmids_and_dois_from_concurrent_checks():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from refaudit.pubmed import EFETCH_DOI_LIMIT, PubMedBatcher
+
+    batcher = PubMedBatcher(window=0.1)
+    summary_calls: list[list[str]] = []
+    doi_calls: list[list[str]] = []
+
+    def summaries(pmids):
+        summary_calls.append(sorted(pmids))
+        return {pmid: PubMedMatch(pmid=pmid, title=f"T{pmid}", doi=None) for pmid in pmids if pmid != "9"}
+
+    def dois(pmids):
+        doi_calls.append(sorted(pmids))
+        return {pmid: f"10.1/{pmid}" for pmid in pmids}
+
+    requests = (["1", "2"], ["2", "3"], ["9"], ["4", "5", "6", "7"])
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        futures = [executor.submit(batcher.get, ids, summaries, dois) for ids in requests]
+        results = [future.result() for future in futures]
+
+    assert summary_calls == [["1", "2", "3", "4", "5", "6", "7", "9"]]
+    # One efetch for the tick, with each caller's first three DOI-less hits.
+    assert doi_calls == [["1", "2", "3", "4", "5", "6"]]
+    assert sorted(results[1]) == ["2", "3"]
+    assert results[2] == {}
+    assert [results[3][pmid].doi for pmid in requests[3]] == ["10.1/4", "10.1/5", "10.1/6", None]
+    assert sum(match.doi is not None for match in results[3].values()) == EFETCH_DOI_LIMIT
+
+
+def test_batched_and_unbatched_lookups_fill_the_same_dois(monkeypatch):
+    from refaudit.pubmed import EFETCH_DOI_LIMIT, PubMedBatcher
+
+    pmids = [str(pmid) for pmid in range(1, 7)]
+
+    def fake_summaries(self, ids, doi_limit=EFETCH_DOI_LIMIT):
+        results = [PubMedMatch(pmid=pmid, title=f"T{pmid}", doi=None) for pmid in ids]
+        self._fill_dois(results, doi_limit)
+        return results
+
+    monkeypatch.setattr(PubMedClient, "_fetch_summaries", fake_summaries)
+    monkeypatch.setattr(PubMedClient, "_efetch_dois", lambda self, ids: {pmid: f"10.1/{pmid}" for pmid in ids})
+
+    unbatched = PubMedClient(pause_sec=0)._fetch_details(pmids)
+    batched = PubMedClient(pause_sec=0, batcher=PubMedBatcher(window=0))._fetch_details(pmids)
+    assert [hit.doi for hit in batched] == [hit.doi for hit in unbatched]
+    assert sum(hit.doi is not None for hit in batched) == EFETCH_DOI_LIMIT
+
+
+def test_batcher_waiter_gives_up_when_its_own_budget_runs_out():
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Event
+
+    from refaudit.budget import TimeBudget
+    from refaudit.pubmed import PubMedBatcher
+
+    batcher = PubMedBatcher(window=0.05)
+    release = Event()
+
+    def slow_fetch(pmids):
+        release.wait(5)
+        return {pmid: PubMedMatch(pmid=pmid, title="T", doi="10.1/x") for pmid in pmids}
+
+    def no_dois(pmids):
+        return {}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(batcher.get, ["1"], slow_fetch, no_dois)
+        time.sleep(0.01)
+        started = time.monotonic()
+        waiter = executor.submit(batcher.get, ["2"], slow_fetch, no_dois, TimeBudget(total_seconds=1.2))
+        assert waiter.result() == {}
+        assert time.monotonic() - started < 1.0
+        release.set()
+        assert sorted(leader.result()) == ["1"]
+
+
+def test_efetch_dois_streams_article_ids_and_skips_reference_list():
+    import io
+
+    xml = b"""<PubmedArticleSet>
+      <PubmedArticle><MedlineCitation><PMID>1</PMID></MedlineCitation>
+        <PubmedData><ArticleIdList><ArticleId IdType="pubmed">1</ArticleId>
+          <ArticleId IdType="doi">10.1/one</ArticleId></ArticleIdList>
+        </PubmedData></PubmedArticle>
+      <PubmedArticle><MedlineCitation><PMID>2</PMID></MedlineCitation>
+        <PubmedData><ArticleIdList><ArticleId IdType="pubmed">2</ArticleId></ArticleIdList>
+          <ReferenceList><Reference><ArticleIdList><ArticleId IdType="doi">10.1/cited</ArticleId>
+          </ArticleIdList></Reference></ReferenceList>
+        </PubmedData></PubmedArticle>
+    </PubmedArticleSet>"""
+    requested: list[dict] = []
+
+    class FakeResponse:
+        raw = io.BytesIO(xml)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return None
+
+        def raise_for_status(self):
+            return None
+
+    class FakeSession:
+        def get(self, url, params=None, timeout=None, stream=False):
+            requested.append(params)
+            return FakeResponse()
+
+    client = PubMedClient(pause_sec=0)
+    client.session = FakeSession()
+    assert client._efetch_dois(["1", "2"]) == {"1": "10.1/one"}
+    assert requested[0]["id"] == "1,2"
+
+
+def test_citmatch_prepass_feeds_pmids_to_candidates(monkeypatch):
+    from refaudit.crossref import CrossrefClient
+
+    sent: list[str] = []
+
+    def fake_get_text(self, url, params):
+        sent.append(params["bdata"])
+        lines = [record.split("|") for record in params["bdata"].split("\r")]
+        answers = {"j pediatr": "111", "lancet": "AMBIGUOUS 1,2"}
+        return "\n".join("|".join(fields[:6] + [answers.get(fields[0].lower(), "NOT_FOUND")]) for fields in lines)
+
+    monkeypatch.setattr(PubMedClient, "_get_text", fake_get_text)
+    monkeypatch.setattr(
+        PubMedClient,
+        "fetch_pmids",
+        lambda self, pmids: [PubMedMatch(pmid=pmid, title="Caffeine therapy", doi=None) for pmid in pmids],
+    )
+    monkeypatch.setattr(
+        PubMedClient,
+        "search_full_citation",
+        lambda self, citation, retmax=5: (_ for _ in ()).throw(AssertionError("free-text search should be skipped")),
+    )
+
+    matched = "Smith J, Doe A. Caffeine therapy in preterm infants. J Pediatr. 2015;166(5):1124-1130."
+    refs = [
+        matched,
+        "Roe B. Ambiguous paper. Lancet. 2010;375:100-105.",
+        "No journal details here.",
+        "Poe C. Resolved by DOI. BMJ. 2019;364:l100. doi:10.1136/bmj.l100",
+    ]
+    client = CrossrefClient(pause_sec=0)
+
+    assert client.prefetch_pmids(refs) == 1
+    assert len(sent) == 1 and sent[0].count("\r") == 1
+    assert sent[0].startswith("J Pediatr|2015|166|1124|smith|0|")
+
+    candidates = client._collect_pubmed_candidates(matched, "Caffeine therapy in preterm infants")
+    assert [(record.source_id, method) for record, method in candidates] == [("111", "pubmed-citmatch")]
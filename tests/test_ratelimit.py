@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from refaudit.ratelimit import HostRateLimiter, TokenBucket, parse_rate_overrides
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_spaces_reservations_at_configured_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=1.0, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+    assert bucket.requests == 4
+
+
+def test_token_bucket_allows_burst_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=3.0, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_refuses_waits_past_max_wait_without_taking_a_token():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0.5, capacity=1.0, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve(max_wait=1.0) is None
+    assert bucket.acquire(max_wait=1.0) is False
+    assert bucket.reserve(max_wait=2.0) == pytest.approx(2.0)
+    assert (bucket.requests, bucket.refused) == (2, 2)
+
+
+def test_host_rate_limiter_uses_known_host_rates_and_pause_fallback():
+    limiter = HostRateLimiter.from_pause(0.5, {"api.crossref.org": 20.0})
+
+    assert limiter.acquire("https://api.crossref.org/works?query=x") is True
+    assert limiter.acquire("https://example.org/other") is True
+    stats = limiter.stats()
+    assert stats["api.crossref.org"]["rate"] == 20.0
+    assert stats["example.org"]["rate"] == 2.0
+
+
+def test_zero_pause_disables_pacing():
+    limiter = HostRateLimiter.from_pause(0)
+    for _ in range(5):
+        assert limiter.acquire("https://export.arxiv.org/api/query") is True
+    assert limiter.stats() == {}
+
+
+def test_parse_rate_overrides():
+    assert parse_rate_overrides(["API.Crossref.org=20", "export.arxiv.org=0.5"]) == {
+        "api.crossref.org": 20.0,
+        "export.arxiv.org": 0.5,
+    }
+    with pytest.raises(ValueError):
+        parse_rate_overrides(["api.crossref.org"])
+    with pytest.raises(ValueError):
+        parse_rate_overrides(["api.crossref.org=0"])
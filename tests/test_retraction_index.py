@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+
+from refaudit.crossref import CrossrefClient
+from refaudit.retraction_index import (
+    RetractionIndex,
+    main,
+    normalize_doi,
+    normalize_pmid,
+    read_records,
+)
+
+WATCH_CSV = (
+    "Record ID,Title,RetractionDate,RetractionDOI,RetractionPubMedID,"
+    "OriginalPaperDOI,OriginalPaperPubMedID,RetractionNature,Reason\n"
+    "1,Paper A,3/14/2021 0:00,10.1/notice-a,0,https://doi.org/10.1/A,12345,Retraction,+Fabrication;\n"
+    "2,Paper B,1/2/2020 0:00,10.1/notice-b,0,10.1/b,0,Correction,+Error in Figures;\n"
+    "3,Paper C,1/2/2020 0:00,,0,unavailable,67890,Retraction,\n"
+)
+
+
+def test_normalizers():
+    assert normalize_doi("https://doi.org/10.1/ABC ") == "10.1/abc"
+    assert normalize_doi("doi: 10.1/x") == "10.1/x"
+    assert normalize_doi("Unavailable") is None
+    assert normalize_pmid("0") is None
+    assert normalize_pmid("12345.0") == "12345"
+
+
+def test_ingest_and_lookup_by_doi_and_pmid(tmp_path):
+    dump = tmp_path / "rw.csv"
+    dump.write_text(WATCH_CSV, encoding="utf-8")
+    index = RetractionIndex(tmp_path / "index.sqlite")
+
+    assert index.ingest(read_records(dump)) == 3
+
+    hits = index.lookup(doi="10.1/a")
+    assert hits == [
+        {
+            "notice_doi": "10.1/notice-a",
+            "update_type": "retraction",
+            "source": "retraction-watch",
+            "updated": {"date-time": "2021-03-14T00:00:00Z"},
+            "label": "+Fabrication;",
+        }
+    ]
+    assert index.lookup(pmid="12345") == hits
+    assert index.lookup(doi="10.1/b") == []
+    assert index.lookup(pmid="67890")[0]["update_type"] == "retraction"
+    index.close()
+
+
+def test_delta_refresh_upserts_by_record_id(tmp_path):
+    first = tmp_path / "first.json"
+    first.write_text(
+        json.dumps([{"Record ID": "9", "OriginalPaperDOI": "10.1/z", "RetractionNature": "Expression of concern"}]),
+        encoding="utf-8",
+    )
+    update = tmp_path / "update.json"
+    update.write_text(
+        json.dumps([{"Record ID": "9", "OriginalPaperDOI": "10.1/z", "RetractionNature": "Retraction"}]),
+        encoding="utf-8",
+    )
+    path = tmp_path / "index.sqlite"
+
+    assert main([str(path), str(first)]) == 0
+    assert RetractionIndex(path).lookup(doi="10.1/z") == []
+    assert main([str(path), str(update)]) == 0
+
+    index = RetractionIndex(path)
+    assert index.stats()["notices"] == 1
+    assert index.lookup(doi="10.1/z")[0]["update_type"] == "retraction"
+    index.close()
+
+
+def test_crossref_notices_json_is_ingested(tmp_path):
+    dump = tmp_path / "notices.json"
+    dump.write_text(
+        json.dumps(
+            {
+                "message": {
+                    "items": [
+                        {"DOI": "10.1/n", "update-to": [{"DOI": "10.1/Q", "type": "withdrawal", "source": "publisher"}]}
+                    ]
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    index = RetractionIndex(tmp_path / "index.sqlite")
+    index.ingest(read_records(dump))
+    assert index.lookup(doi="10.1/q")[0]["source"] == "publisher"
+    index.close()
+
+
+def test_client_consults_index_before_crossref(tmp_path, monkeypatch):
+    dump = tmp_path / "rw.csv"
+    dump.write_text(WATCH_CSV, encoding="utf-8")
+    index = RetractionIndex(tmp_path / "index.sqlite")
+    index.ingest(read_records(dump))
+    calls: list[str] = []
+    monkeypatch.setattr(CrossrefClient, "_fetch_updates", lambda self, doi: calls.append(doi) or [])
+
+    client = CrossrefClient(pause_sec=0, retraction_index=index)
+    assert client.is_retracted("10.1/A")[0] is True
+    assert client.is_retracted("10.1/clean") == (False, [])
+    assert calls == ["10.1/clean"]
+
+    offline = CrossrefClient(pause_sec=0, retraction_index=index, offline_retractions=True)
+    assert offline.is_retracted("10.1/other") == (False, [])
+    assert offline.check_retractions(["10.1/a", "10.1/other"])["10.1/a"][0] is True
+    assert calls == ["10.1/clean"]
+    index.close()
+
+
+def test_reinstatement_clears_earlier_retractions(tmp_path):
+    dump = tmp_path / "rw.json"
+    dump.write_text(
+        json.dumps(
+            [
+                {"Record ID": "1", "OriginalPaperDOI": "10.1/r", "RetractionNature": "Retraction",
+                 "RetractionDate": "1/2/2019 0:00"},
+                {"Record ID": "2", "OriginalPaperDOI": "10.1/r", "RetractionNature": "Reinstatement",
+                 "RetractionDate": "5/6/2020 0:00"},
+                {"Record ID": "3", "OriginalPaperDOI": "10.1/s", "RetractionNature": "Reinstatement",
+                 "RetractionDate": "1/2/2019 0:00"},
+                {"Record ID": "4", "OriginalPaperDOI": "10.1/s", "RetractionNature": "Retraction",
+                 "RetractionDate": "5/6/2020 0:00"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    index = RetractionIndex(tmp_path / "index.sqlite")
+
+    assert index.ingest(iter(read_records(dump))) == 4
+    assert index.lookup(doi="10.1/r") == []
+    assert index.lookup(doi="10.1/s")[0]["update_type"] == "retraction"
+    index.close()
+
+
+def test_readonly_open_rejects_missing_or_empty_index(tmp_path, monkeypatch, capsys):
+    import pytest
+
+    from refaudit.main import main as cli_main
+
+    missing = tmp_path / "typo" / "index.sqlite"
+    with pytest.raises(FileNotFoundError):
+        RetractionIndex(missing, readonly=True)
+    assert not missing.parent.exists()
+
+    empty = tmp_path / "empty.sqlite"
+    RetractionIndex(empty).close()
+    index = RetractionIndex(empty, readonly=True)
+    assert not index.populated
+    with pytest.raises(ValueError):
+        CrossrefClient(pause_sec=0, retraction_index=index, offline_retractions=True)
+    index.close()
+
+    for path, flags in ((missing, []), (empty, ["--offline-retractions"])):
+        monkeypatch.setattr(
+            "sys.argv", ["citeguard", "--text", "Ref", "--retraction-index", str(path), *flags]
+        )
+        with pytest.raises(SystemExit) as excinfo:
+            cli_main()
+        assert excinfo.value.code == 2
+        assert str(path) in capsys.readouterr().err
+    assert not missing.exists()
+
+
+def test_readonly_index_answers_lookups(tmp_path):
+    dump = tmp_path / "rw.csv"
+    dump.write_text(WATCH_CSV, encoding="utf-8")
+    path = tmp_path / "index.sqlite"
+    assert main([str(path), str(dump)]) == 0
+
+    index = RetractionIndex(path, readonly=True)
+    assert index.populated
+    assert index.lookup(doi="10.1/a")[0]["update_type"] == "retraction"
+    index.close()
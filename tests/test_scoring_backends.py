@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from refaudit import scoring
+from refaudit.scoring import CandidateScore, ReferenceRecord, score_candidate, title_similarity
+
+PAIRS = [
+    (
+        ReferenceRecord(
+            title="Effect of aerobic exercise on depressive symptoms in older adults",
+            authors=["Smith J", "Tanaka K"],
+            year=2020,
+            venue="JAMA",
+            volume="323",
+            page="101-110",
+        ),
+        ReferenceRecord(
+            title="Effect of Aerobic Exercise on Depressive Symptoms in Older Adults: A Randomized Trial",
+            authors=["Smith", "Tanaka"],
+            year=2020,
+            venue="Journal of the American Medical Association",
+            venue_aliases=["JAMA"],
+            volume="323",
+            page="101-110",
+        ),
+    ),
+    (
+        ReferenceRecord(title="Sleep duration and cognitive decline", authors=["Chen L"], year=2018, venue="BMJ"),
+        ReferenceRecord(title="Sleep quality and mortality in a national cohort", authors=["Garcia"], year=2015, venue="Lancet"),
+    ),
+]
+
+
+@pytest.fixture
+def restore_backend():
+    previous = scoring.similarity_backend()
+    yield
+    scoring.set_similarity_backend(previous)
+
+
+@pytest.mark.parametrize("backend", sorted(scoring.SIMILARITY_BACKENDS))
+def test_backends_agree_on_decisions(backend, restore_backend):
+    scoring.set_similarity_backend("difflib")
+    expected = [score_candidate(ref, cand).decision for ref, cand in PAIRS]
+
+    scoring.set_similarity_backend(backend)
+    assert [score_candidate(ref, cand).decision for ref, cand in PAIRS] == expected
+    assert expected == ["accept", "reject"]
+    assert title_similarity("Same title", "same  title!") == 1.0
+
+
+def test_unknown_backend_is_rejected(restore_backend):
+    with pytest.raises(ValueError):
+        scoring.set_similarity_backend("nope")
+
+
+def test_record_caches_normalised_fields_and_matches_string_helpers():
+    reference, candidate = PAIRS[0]
+    score = score_candidate(reference, candidate)
+
+    assert "title_tokens" in reference.__dict__
+    assert reference.venue_variants == ("jama",)
+    assert candidate.venue_variants == ("journal of the american medical association", "jama")
+    assert reference.author_keys == frozenset({"smith", "tanaka"})
+    assert score.signals["title_similarity"] == title_similarity(reference.title, candidate.title)
+    assert score.signals["author_overlap"] == scoring.author_overlap(reference.authors, candidate.authors)
+    assert not reference.preprint_like
+    assert ReferenceRecord(title="A study", venue="medRxiv").preprint_like
+
+
+def test_field_diffs_are_built_on_first_access():
+    reference, candidate = PAIRS[1]
+    score = score_candidate(reference, candidate)
+
+    assert score._field_diffs is None
+    assert score == replace(score)
+    assert score._field_diffs is None
+    assert score.field_diffs["year"]["state"] == "mismatch"
+    assert score.field_diffs is score.field_diffs
+    assert score.for_mode("correction").field_diffs is score.field_diffs
+
+
+def test_candidate_score_accepts_field_diffs_and_note_in_order():
+    score = CandidateScore(1.0, "accept", {}, {"title": "ok"}, "title ok", {"title": {"state": "ok"}}, "exact")
+
+    assert score.field_diffs == {"title": {"state": "ok"}}
+    assert score.note == "exact"
+    assert CandidateScore(1.0, "accept", {}, {}, "").field_diffs == {}
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import time
+
 from api.check import handle_check, validate_payload
-from refaudit.crossref import MatchResult
 from refaudit.etiquette import build_user_agent, resolve_contact_email
 from refaudit.main import run
 from refaudit.parser import split_references
@@ -20,35 +21,50 @@ def test_contact_email_resolution(monkeypatch):
     assert "mailto:direct@example.com" in build_user_agent("direct@example.com")
 
 
-def test_cli_run_uses_markdown_output(tmp_path, monkeypatch):
-    result = MatchResult(
-        input_text="Missing reference",
-        doi=None,
-        title=None,
-        found=False,
-        retracted=False,
-        retraction_details=[],
-        status="not_found",
-        note="no_match",
-    )
-
-    class DummyClient:
-        def __init__(self, debug=False, email=None, pause_sec=0.2, strict=True):
-            self.debug = debug
-            self.email = email
-
-        def check_one(self, line):
-            assert line == "Missing reference"
-            return result
-
+def test_cli_run_uses_markdown_output(tmp_path, monkeypatch, dummy_client):
     monkeypatch.setenv("CONTACT_EMAIL", "cli@example.com")
-    monkeypatch.setattr("refaudit.crossref.CrossrefClient", DummyClient)
 
     out_path = tmp_path / "report.md"
     assert run("Missing reference", out_path) == 0
     text = out_path.read_text(encoding="utf-8")
     assert "Reference Audit Report" in text
     assert "Missing reference" in text
+    assert dummy_client.checked == ["Missing reference"]
+
+
+def test_cli_run_streams_jsonl_and_writes_markdown_from_stream(tmp_path, dummy_client):
+    from refaudit.jsonl import read_results
+
+    def screen_retractions(self, results):
+        # Changes made after a line is streamed must not reach the report.
+        for result in results:
+            result.note = "changed_after_streaming"
+
+    dummy_client.screen_retractions = screen_retractions
+
+    out_path = tmp_path / "results.jsonl"
+    assert run("First reference\nSecond reference", out_path, output_format="jsonl", jobs=2) == 0
+
+    pairs = read_results(out_path)
+    assert [index for index, _ in pairs] == [0, 1]
+    assert [result.input_text for _, result in pairs] == ["First reference", "Second reference"]
+    report = (tmp_path / "results.md").read_text(encoding="utf-8")
+    assert "Second reference" in report
+    assert "no_match" in report and "changed_after_streaming" not in report
+
+
+def test_cli_requires_report_when_streaming_jsonl_to_stdout(tmp_path, monkeypatch, capsys):
+    import pytest
+
+    from refaudit.main import main
+
+    refs = tmp_path / "refs.txt"
+    refs.write_text("First reference", encoding="utf-8")
+    monkeypatch.setattr("sys.argv", ["citeguard", "--input-file", str(refs), "--format", "jsonl"])
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 2
+    assert "--report" in capsys.readouterr().err
 
 
 def test_validate_payload_rejects_invalid_email():
@@ -89,6 +105,207 @@ def test_handle_check_returns_payload(monkeypatch):
     assert payload["result"]["input_text"] == "Ref"
 
 
+def test_handle_check_batch_shares_one_client_and_reports_budget_exhaustion(monkeypatch, make_result):
+    from api.check import validate_batch_payload
+    from refaudit.web import clear_web_clients
+
+    clients: list = []
+
+    class FlipBudget:
+        def __init__(self):
+            self.checks = 0
+
+        @property
+        def expired(self):
+            return self.checks >= 2
+
+    class DummyClient:
+        def __init__(self, budget=None, **options):
+            self.budget = FlipBudget()
+            self.prefetched = None
+            clients.append(self)
+
+        def fork(self, budget=None):
+            return self
+
+        def close(self):
+            return None
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return None
+
+        def prefetch(self, refs):
+            self.prefetched = list(refs)
+
+        def check_one(self, line):
+            self.budget.checks += 1
+            return make_result(line)
+
+    monkeypatch.setattr("refaudit.web.WEB_BATCH_JOBS", 1)
+    monkeypatch.setattr("refaudit.web.CrossrefClient", DummyClient)
+    clear_web_clients()
+
+    status, payload = handle_check({"refs": ["A", "B", "C"], "email": "user@example.com"})
+
+    assert status == 200
+    assert len(clients) == 1
+    assert clients[0].prefetched == ["A", "B", "C"]
+    assert [item["ok"] for item in payload["results"]] == [True, True, False]
+    assert payload["results"][1]["result"]["input_text"] == "B"
+    assert payload["results"][2] == {"ok": False, "ref": "C", "error": "budget_exhausted"}
+    assert payload["complete"] is False
+
+    for bad in ({"refs": [], "email": "user@example.com"}, {"refs": ["ok", ""], "email": "user@example.com"}):
+        try:
+            validate_batch_payload(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError")
+
+    # A warm instance reuses the registered client for the same email.
+    clients[0].budget.checks = 0
+    handle_check({"refs": ["D"], "email": "user@example.com"})
+    assert len(clients) == 1
+    clear_web_clients()
+
+
+def test_handle_check_stream_emits_results_then_done(monkeypatch):
+    import json
+
+    from api.check import handle_check_stream, stream_format
+
+    def fake_iter(refs, email=None, pause_sec=0.0, budget=None):
+        for index in reversed(range(len(refs))):
+            yield {"index": index, "ok": True, "result": {"input_text": refs[index]}}
+
+    monkeypatch.setattr("api.check.iter_references_payload", fake_iter)
+
+    assert stream_format("application/x-ndjson") == "ndjson"
+    assert stream_format("text/event-stream, */*") == "sse"
+    assert stream_format("application/json") is None
+
+    lines = b"".join(handle_check_stream({"refs": ["A", "B"], "email": "user@example.com"}, "ndjson")).splitlines()
+    events = [json.loads(line) for line in lines]
+    assert [event["type"] for event in events] == ["result", "result", "done"]
+    assert [event["index"] for event in events[:2]] == [1, 0]
+    assert events[-1]["complete"] is True
+
+    sse = b"".join(handle_check_stream({"ref": "A", "email": "user@example.com"}, "sse")).decode("utf-8")
+    assert sse.startswith("event: result\ndata: {")
+    assert "event: done\n" in sse
+
+    try:
+        handle_check_stream({"refs": ["A"], "email": "bad"}, "ndjson")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError before streaming")
+
+
+class GoneWriter:
+    """A response body whose client has already disconnected."""
+
+    def __init__(self):
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        raise BrokenPipeError
+
+    def flush(self):
+        return None
+
+
+class DisconnectedRequest:
+    def __init__(self):
+        self.wfile = GoneWriter()
+
+    def send_response(self, status):
+        return None
+
+    def send_header(self, name, value):
+        return None
+
+    def end_headers(self):
+        return None
+
+
+def test_write_stream_stops_and_closes_chunks_when_client_disconnects():
+    from api.check import write_stream
+
+    produced: list[int] = []
+
+    def chunks():
+        try:
+            for index in range(3):
+                produced.append(index)
+                yield b"{}\n"
+        finally:
+            produced.append(-1)
+
+    request = DisconnectedRequest()
+    write_stream(request, "ndjson", chunks())
+    assert request.wfile.writes == 1
+    assert produced == [0, -1]
+
+
+def test_disconnect_cancels_checks_not_yet_started(monkeypatch, make_result):
+    import threading
+    from contextlib import contextmanager
+
+    from api.check import handle_check_stream, write_stream
+    from refaudit.budget import NO_BUDGET
+    from refaudit.web import WEB_BATCH_JOBS
+
+    ran: list[str] = []
+    lock = threading.Lock()
+
+    class StubClient:
+        budget = NO_BUDGET
+
+        def prefetch(self, refs):
+            return None
+
+        def check_one(self, line):
+            time.sleep(0.02)
+            with lock:
+                ran.append(line)
+            return make_result(line)
+
+    class StubRegistry:
+        @contextmanager
+        def fork(self, budget):
+            yield StubClient()
+
+    monkeypatch.setattr("refaudit.web.web_client", lambda email, pause_sec=0.2, debug=False: StubRegistry())
+    refs = [f"Reference {index}" for index in range(20)]
+    request = DisconnectedRequest()
+    write_stream(request, "ndjson", handle_check_stream({"refs": refs, "email": "user@example.com"}, "ndjson"))
+
+    assert request.wfile.writes == 1
+    assert len(ran) <= 2 * WEB_BATCH_JOBS
+    time.sleep(0.1)
+    assert len(ran) <= 2 * WEB_BATCH_JOBS
+
+
 def test_split_references_keeps_cli_behavior():
     refs = split_references("[1] First\nReferences\n2. Second\n")
     assert refs == ["First", "Second"]
+
+
+def test_handle_config_advertises_concurrency_and_scaled_rates():
+    from api.check import handle_config
+    from refaudit.ratelimit import DEFAULT_HOST_RATES
+    from refaudit.web import WEB_MAX_CONCURRENCY, web_rates
+
+    status, payload = handle_config()
+    assert status == 200
+    config = payload["config"]
+    assert config["max_concurrency"] == WEB_MAX_CONCURRENCY
+    assert config["max_batch_refs"] == 50
+    assert config["host_rates"] == web_rates()
+    assert web_rates(4)["api.crossref.org"] * 4 == DEFAULT_HOST_RATES["api.crossref.org"]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from threading import Thread
+
+from refaudit.crossref import CrossrefClient
+from refaudit.transport import Transport
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(0.2)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return None
+
+
+def test_sessions_share_pooled_connections():
+    server = HTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/"
+    transport = Transport(pool_size=2)
+    try:
+        first = transport.session({"User-Agent": "a"})
+        second = transport.session({"User-Agent": "b"})
+        for session in (first, second, first):
+            assert session.get(url, timeout=5).json() == {}
+        assert transport.stats()["127.0.0.1"] == {"requests": 3, "connections": 1, "reused": 2}
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_full_pool_opens_an_extra_connection_instead_of_waiting():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/slow"
+    transport = Transport(pool_size=1)
+    try:
+        session = transport.session()
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            responses = list(executor.map(lambda _: session.get(url, timeout=5).json(), range(2)))
+        assert responses == [{}, {}]
+        assert time.monotonic() - started < 0.35
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_and_sources_mount_one_transport():
+    transport = Transport()
+    client = CrossrefClient(pause_sec=0, transport=transport)
+    adapters = {
+        id(session.get_adapter("https://example.org"))
+        for session in (client.session, client._pubmed.session, client._nlm.session, client._arxiv.session)
+    }
+    assert adapters == {id(transport.adapter)}
+    assert client.connection_stats() == {}